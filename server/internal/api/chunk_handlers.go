@@ -31,7 +31,10 @@ import (
 //	            (apartments/campuses/houses with varied door counts), agricultural clusters (house+barn+industrial),
 //	            park buildings (small scattered structures)
 //	8: Decommissioned legacy procedural structure generation (structures disabled)
-const CurrentGeometryVersion = 8
+//	9: Structure RNG seeds from derive_seed (SplitMix64, also used for chunk seeds) and
+//	   full-gap industrial spacing (STRUCTURE_PLACEMENT_VERSION 4); new structures for
+//	   every world seed
+const CurrentGeometryVersion = 9
 
 // ChunkHandlers handles chunk-related HTTP requests.
 type ChunkHandlers struct {
@@ -3,10 +3,16 @@ Building generation functions for Phase 2 MVP.
 Generates basic rectangular buildings with simple window patterns.
 """
 
-import random
+import logging
 import math
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple, Optional
 
+import numpy as np
+
+from . import seeds
+from .jit import njit
+
 # Import color palettes module
 try:
     from . import color_palettes
@@ -14,6 +20,8 @@ except ImportError:
     # If import fails, color_palettes will be None and we'll skip color application
     color_palettes = None
 
+logger = logging.getLogger(__name__)
+
 # Constants
 GRID_CELL_SIZE = 50.0  # 50m × 50m cells
 MIN_BUILDING_WIDTH = 10.0  # Minimum building width in meters
@@ -34,17 +42,93 @@ WINDOW_TYPES = {
     "standard": {"height": 1.0, "bottom": 2.0, "top": 3.0},     # Middle of living space (2-3m)
     "ceiling": {"height": 0.5, "bottom": 3.25, "top": 3.75},    # Upper part (3.25-3.75m)
 }
+for _window_type in WINDOW_TYPES.values():
+    _window_type["center"] = (_window_type["bottom"] + _window_type["top"]) / 2.0
 
+# Building subtype groups used for palette, window and door decisions
+_RESIDENTIAL_SUBTYPES = frozenset(("residence", "house", "apartment", "campus"))
+_INDUSTRIAL_SUBTYPES = frozenset(("warehouse", "factory"))
+_AGRICULTURAL_SUBTYPES = frozenset(("agri_industrial", "barn"))
 
-def seeded_random(seed: int) -> random.Random:
+class PooledRandom:
+    """
+    Deterministic random number generator backed by NumPy's PCG64.
+    
+    Uniforms are drawn from the generator in blocks and handed out one at a time,
+    so scalar draws avoid NumPy's per-call overhead. Exposes the subset of the
+    random.Random API used by building generation, plus random_array for bulk draws.
+    """
+    
+    __slots__ = ("_generator", "_pool", "_index")
+    
+    POOL_SIZE = 64
+    
+    def __init__(self, seed: int):
+        self._generator = np.random.Generator(np.random.PCG64(seed))
+        self._pool = self._generator.random(self.POOL_SIZE).tolist()
+        self._index = 0
+    
+    def random(self) -> float:
+        """Return the next uniform float in [0, 1)."""
+        if self._index == len(self._pool):
+            self._pool = self._generator.random(self.POOL_SIZE).tolist()
+            self._index = 0
+        value = self._pool[self._index]
+        self._index += 1
+        return value
+    
+    def random_array(self, count: int) -> np.ndarray:
+        """Return `count` uniform floats in [0, 1) as an array in a single draw."""
+        return self._generator.random(count)
+    
+    def uniform(self, a: float, b: float) -> float:
+        """Return a uniform float between a and b."""
+        return a + (b - a) * self.random()
+    
+    def randint(self, a: int, b: int) -> int:
+        """Return a uniform integer in [a, b], inclusive."""
+        return a + int(self.random() * (b - a + 1))
+    
+    def choice(self, seq):
+        """Return a uniformly chosen element of a non-empty sequence."""
+        return seq[int(self.random() * len(seq))]
+    
+    def sample(self, population, k: int) -> list:
+        """Return k unique elements chosen from population (partial Fisher-Yates, k draws)."""
+        pool = list(population)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        for i in range(k):
+            j = i + int(self.random() * (n - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+    
+    def shuffle(self, items: list) -> None:
+        """Shuffle a list in place (Fisher-Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+def seeded_random(seed: int) -> PooledRandom:
     """Create deterministic random number generator."""
-    rng = random.Random(seed)
-    return rng
+    return PooledRandom(seed)
 
 
 def get_building_seed(chunk_seed: int, cell_x: int, cell_y: int) -> int:
-    """Generate deterministic seed for a building cell."""
-    return hash((chunk_seed, cell_x, cell_y)) % (2**31)
+    """Generate deterministic seed for a building cell (see seeds.get_building_seed)."""
+    return seeds.get_building_seed(chunk_seed, cell_x, cell_y)
+
+
+def get_building_seeds(chunk_seed: int, cell_xs, cell_ys) -> np.ndarray:
+    """
+    Vectorized get_building_seed for arrays of cell coordinates.
+
+    Returns:
+        int64 array of seeds (31-bit, non-negative)
+    """
+    return seeds.get_building_seeds(chunk_seed, cell_xs, cell_ys)
 
 
 def generate_building(
@@ -82,8 +166,71 @@ def generate_building(
             zone_type, zone_importance, rng, building_subtype_override
         )
     else:
-        width, depth, height, building_subtype = _get_building_dimensions(zone_type, zone_importance, rng)
+        width, depth, height, building_subtype = _get_building_dimensions(zone_type, zone_importance, building_seed)
+    
+    return _assemble_building(
+        position, zone_type, zone_importance, building_seed, floor, hub_name,
+        width, depth, height, building_subtype, rng,
+    )
+
+
+def generate_buildings_batch(
+    positions: List[Tuple[float, float]],
+    zone_types: List[str],
+    zone_importances: List[float],
+    building_seeds: List[int],
+    floors: List[int],
+    hub_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate many buildings at once (e.g. every building cell in a chunk).
+    
+    Dimensions for the whole batch are drawn in one vectorized call; windows, doors
+    and output dicts are then built per building. Each building is identical to what
+    generate_building returns for the same inputs.
+    
+    Args:
+        positions: (x, y) position per building in EarthRing coordinates
+        zone_types: Zone type per building
+        zone_importances: Zone importance per building (0.0 to 1.0)
+        building_seeds: Deterministic seed per building
+        floors: Floor number per building
+        hub_name: Nearest hub name for color palette lookup
+    
+    Returns:
+        List of building dictionaries, in input order
+    """
+    zone_types = [zone_type.lower().strip() if zone_type else "" for zone_type in zone_types]
+    widths, depths, heights, subtypes = _get_building_dimensions_batch(
+        zone_types, zone_importances, building_seeds
+    )
     
+    return [
+        _assemble_building(
+            position, zone_type, zone_importance, building_seed, floor, hub_name,
+            width, depth, height, building_subtype, seeded_random(building_seed),
+        )
+        for position, zone_type, zone_importance, building_seed, floor, width, depth, height, building_subtype in zip(
+            positions, zone_types, zone_importances, building_seeds, floors,
+            widths.tolist(), depths.tolist(), heights.tolist(), subtypes,
+        )
+    ]
+
+
+def _assemble_building(
+    position: Tuple[float, float],
+    zone_type: str,
+    zone_importance: float,
+    building_seed: int,
+    floor: int,
+    hub_name: Optional[str],
+    width: float,
+    depth: float,
+    height: float,
+    building_subtype: str,
+    rng: PooledRandom,
+) -> Dict[str, Any]:
+    """Build windows, doors, colors and the output dict for a building of known dimensions."""
     # Calculate building corners (centered on position)
     half_width = width / 2.0
     half_depth = depth / 2.0
@@ -105,7 +252,7 @@ def generate_building(
     # Generate windows for Phase 2 (simple grid pattern)
     # Warehouses and agri-industrial may have fewer windows
     # Pass corner_trim_width to window generation
-    windows = _generate_window_grid(width, depth, height, building_seed, building_subtype, corner_trim_width)
+    windows = _generate_window_grid(width, depth, height, building_seed, building_subtype, corner_trim_width, rng)
     
     # Determine which facade faces r=0 (center of ring)
     # r=0 is at y=0 in EarthRing coordinates
@@ -127,7 +274,7 @@ def generate_building(
     # Pass windows to avoid overlaps
     doors = _generate_doors(
         width, depth, height, building_seed, building_subtype, 
-        main_door_facade, rng, windows
+        main_door_facade, rng, windows, corner_trim_width
     )
     
     # Generate garage doors for appropriate building types
@@ -155,38 +302,13 @@ def generate_building(
     colors = None
     if color_palettes is not None and hub_name is not None:
         try:
-            # Map building_subtype to palette zone_type
-            # This ensures that buildings in mixed-use zones get appropriate colors
-            # based on their actual building type, not just the zone type
-            palette_zone_type = None
-            if building_subtype in ["residence", "house", "apartment", "campus"]:
-                palette_zone_type = "Residential"
-            elif building_subtype == "retail":
-                palette_zone_type = "Commercial"
-            elif building_subtype in ["warehouse", "factory"]:
-                palette_zone_type = "Industrial"
-            elif building_subtype in ["agri_industrial", "barn"]:
-                palette_zone_type = "Agricultural"
-            elif building_subtype == "park_structure":
-                palette_zone_type = "Parks"
-            else:
-                # Fallback: use zone_type to determine palette
-                # Handle different zone_type formats: "mixed-use", "mixed_use", "Mixed-use", "Mixed_Use"
-                zone_type_normalized = zone_type.lower().replace("_", "-").replace(" ", "-")
-                if zone_type_normalized == "mixed-use":
-                    # Mixed-use zone but unknown subtype - default to Commercial
-                    palette_zone_type = "Commercial"
-                else:
-                    palette_zone_type = zone_type_normalized.title()  # "industrial" -> "Industrial"
-            
+            palette_zone_type = _palette_zone_type(building_subtype, zone_type)
             if palette_zone_type:
+                # None if hub or zone type not found in palette - this is OK, use defaults
                 colors = color_palettes.get_hub_colors(hub_name, palette_zone_type)
-                if colors is None:
-                    # Hub or zone type not found in palette - this is OK, use defaults
-                    pass
-        except Exception as e:
-            # If color loading fails, continue without colors (don't spam logs)
-            pass
+        except Exception:
+            # If color loading fails, continue without colors (debug-level only, don't spam logs)
+            logger.debug("Color palette lookup failed for hub %r", hub_name, exc_info=True)
     
     # Building properties
     building = {
@@ -200,7 +322,7 @@ def generate_building(
             "height": height,  # Height in meters (5, 10, 15, or 20m)
         },
         "corners": corners,
-        "windows": windows,
+        "windows": _windows_to_dicts(windows, width, depth),
         "doors": doors,  # Dictionary mapping facade to door info: {"front": {...}, "back": {...}, etc.}
         "garage_doors": garage_doors,  # List of garage door dictionaries
         "properties": {
@@ -220,166 +342,218 @@ def generate_building(
     return building
 
 
-def _get_building_dimensions(
-    zone_type: str, zone_importance: float, rng: random.Random
-) -> Tuple[float, float, float, str]:
+@lru_cache(maxsize=64)
+def _palette_zone_type(building_subtype: Optional[str], zone_type: str) -> Optional[str]:
     """
-    Get building dimensions based on zone type and importance.
+    Map a building subtype (or, failing that, its zone type) to a palette zone type.
+    
+    Buildings in mixed-use zones get colors for their actual building type,
+    not just the zone type.
+    """
+    if building_subtype in _RESIDENTIAL_SUBTYPES:
+        return "Residential"
+    if building_subtype == "retail":
+        return "Commercial"
+    if building_subtype in _INDUSTRIAL_SUBTYPES:
+        return "Industrial"
+    if building_subtype in _AGRICULTURAL_SUBTYPES:
+        return "Agricultural"
+    if building_subtype == "park_structure":
+        return "Parks"
+    
+    # Fallback: use zone_type to determine palette
+    # Handle different zone_type formats: "mixed-use", "mixed_use", "Mixed-use", "Mixed_Use"
+    zone_type_normalized = zone_type.lower().replace("_", "-").replace(" ", "-")
+    if zone_type_normalized == "mixed-use":
+        # Mixed-use zone but unknown subtype - default to Commercial
+        return "Commercial"
+    return zone_type_normalized.title()  # "industrial" -> "Industrial"
+
+
+# Building mix by zone type: list of (probability, subtype, footprint range, heights, height weights)
+# Width and depth are drawn independently from the footprint range; height weights of
+# None mean each height is equally likely. A subtype of None uses the zone type itself.
+ZONE_BUILDING_MIX: Dict[str, List[Tuple[float, Optional[str], Tuple[float, float], Tuple[float, ...], Optional[Tuple[float, ...]]]]] = {
+    # Residential: 60% apartment buildings/campuses (larger, 3-5 stories), 40% houses (2-3 stories)
+    "residential": [
+        (0.30, "apartment", (20.0, 40.0), (12.0, 16.0, 20.0), None),
+        (0.30, "campus", (20.0, 40.0), (12.0, 16.0, 20.0), None),
+        (0.40, "house", (10.0, 18.0), (8.0, 12.0), None),
+    ],
+    # Commercial: office towers, all 5 stories (20m); commercial zones only get retail buildings
+    "commercial": [
+        (1.00, "retail", (15.0, 35.0), (20.0,), None),
+    ],
+    # Industrial: 60% warehouses (wide and long, 80% short), 40% factories (70% short/medium)
+    "industrial": [
+        (0.60, "warehouse", (40.0, 80.0), (5.0, 10.0, 12.0), (0.4, 0.4, 0.2)),
+        (0.40, "factory", (30.0, 65.0), (5.0, 8.0, 10.0, 12.0, 16.0, 20.0), (0.175, 0.175, 0.175, 0.175, 0.15, 0.15)),
+    ],
+    # Mixed-use: any building type - 50% residential, 30% commercial, 20% industrial
+    "mixed_use": [
+        (0.15, "apartment", (20.0, 40.0), (12.0, 16.0, 20.0), None),
+        (0.15, "campus", (20.0, 40.0), (12.0, 16.0, 20.0), None),
+        (0.20, "house", (10.0, 18.0), (8.0, 12.0), None),
+        (0.30, "retail", (15.0, 35.0), (20.0,), None),
+        (0.12, "warehouse", (40.0, 70.0), (5.0, 10.0), None),
+        (0.08, "factory", (30.0, 60.0), (8.0, 10.0, 12.0), None),
+    ],
+    # Agricultural: 70% farmhouses, 30% agri-industrial (60% barns, 40% small industrial)
+    "agricultural": [
+        (0.70, "house", (10.0, 18.0), (8.0, 12.0), None),
+        (0.18, "barn", (12.0, 25.0), (5.0, 8.0, 10.0), None),
+        (0.12, "warehouse", (15.0, 30.0), (5.0, 8.0, 10.0), None),
+    ],
+    # Park: small structures, 1-2 stories
+    "park": [
+        (1.00, "park_structure", (5.0, 15.0), (4.0, 8.0), None),
+    ],
+    # Default (restricted, etc.): 1-3 floors
+    "default": [
+        (1.00, None, (10.0, 30.0), (1 * FLOOR_HEIGHT, 2 * FLOOR_HEIGHT, 3 * FLOOR_HEIGHT), None),
+    ],
+}
+
+# Zone type aliases accepted by the dimension tables
+_ZONE_ALIASES = {"mixed-use": "mixed_use"}
+
+
+def _build_dimension_tables():
+    """Flatten ZONE_BUILDING_MIX into lookup arrays indexed by zone code and variant."""
+    zone_codes = {zone: code for code, zone in enumerate(ZONE_BUILDING_MIX)}
+    max_variants = max(len(mix) for mix in ZONE_BUILDING_MIX.values())
+    max_heights = max(len(v[3]) for mix in ZONE_BUILDING_MIX.values() for v in mix)
+    
+    variant_cdf = np.ones((len(zone_codes), max_variants))
+    variant_ids = np.zeros((len(zone_codes), max_variants), dtype=np.int64)
+    subtypes = []
+    footprints = []
+    heights = np.zeros((0, max_heights))
+    height_cdf = np.zeros((0, max_heights))
+    
+    for zone, code in zone_codes.items():
+        cumulative = 0.0
+        for slot, (probability, subtype, footprint, variant_heights, weights) in enumerate(ZONE_BUILDING_MIX[zone]):
+            cumulative += probability
+            variant_cdf[code, slot] = cumulative
+            variant_ids[code, slot] = len(subtypes)
+            subtypes.append(subtype)
+            footprints.append(footprint)
+            
+            weights = weights or (1.0,) * len(variant_heights)
+            row_heights = np.full(max_heights, variant_heights[-1])
+            row_heights[:len(variant_heights)] = variant_heights
+            row_cdf = np.ones(max_heights)
+            row_cdf[:len(weights)] = np.cumsum(weights) / sum(weights)
+            heights = np.vstack([heights, row_heights])
+            height_cdf = np.vstack([height_cdf, row_cdf])
+        # Guard against rounding: the last variant of each zone catches u close to 1.0
+        variant_cdf[code, len(ZONE_BUILDING_MIX[zone]) - 1:] = 1.0
+    
+    height_cdf[:, -1] = 1.0
+    return zone_codes, variant_cdf, variant_ids, tuple(subtypes), np.array(footprints), heights, height_cdf
+
+
+(
+    _ZONE_CODES,
+    _VARIANT_CDF,
+    _VARIANT_IDS,
+    _VARIANT_SUBTYPES,
+    _VARIANT_FOOTPRINTS,
+    _VARIANT_HEIGHTS,
+    _VARIANT_HEIGHT_CDF,
+) = _build_dimension_tables()
+
+
+def _seed_uniforms(building_seeds: np.ndarray, count: int) -> np.ndarray:
+    """
+    Counter-based uniforms: draw k of building i is SplitMix64(seed_i, k) mapped to [0, 1).
+    
+    Each building's draws depend only on its own seed, so batch composition never
+    changes a building's result.
     
     Returns:
-        Tuple of (width, depth, height, building_subtype) in meters
-        building_subtype: More specific building type (e.g., "warehouse", "factory", "residence", "agri_industrial")
+        Array of shape (len(building_seeds), count)
     """
-    # Normalize zone_type to lowercase and strip whitespace to handle any formatting variations
-    zone_type = zone_type.lower().strip()
+    seeds = np.asarray(building_seeds).astype(np.uint64)
+    counters = np.arange(1, count + 1, dtype=np.uint64)
+    z = seeds[:, None] * np.uint64(0x9E3779B97F4A7C15) + counters[None, :] * np.uint64(0xD1B54A32D192ED03)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    # Top 53 bits -> double in [0, 1)
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _get_building_dimensions_batch(
+    zone_types: List[str], zone_importances: np.ndarray, building_seeds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Get building dimensions for many buildings in one vectorized pass.
     
-    # Determine building subtype for zones that have variety
-    building_subtype = None
-    if zone_type == "industrial":
-        # Industrial: warehouses (large, single-story) or factories (medium-large, multi-story)
-        if rng.random() < 0.6:  # 60% warehouses, 40% factories
-            building_subtype = "warehouse"
-        else:
-            building_subtype = "factory"
-    elif zone_type == "agricultural":
-        # Agricultural: residences (small-medium) or agri-industrial (medium-large)
-        if rng.random() < 0.7:  # 70% residences, 30% agri-industrial
-            building_subtype = "residence"
-        else:
-            building_subtype = "agri_industrial"
-    
-    # Base dimensions vary by zone type and subtype
-    if zone_type == "residential":
-        # Residential: mix of apartment buildings/campuses and houses
-        # 60% apartment/campus buildings, 40% houses
-        if rng.random() < 0.6:
-            # Apartment buildings and campuses: larger footprints, taller
-            building_subtype = rng.choice(["apartment", "campus"])
-            base_width = rng.uniform(20.0, 40.0)  # Larger footprint
-            base_depth = rng.uniform(20.0, 40.0)
-            height = rng.choice([12.0, 16.0, 20.0])  # 3-5 stories
-        else:
-            # Houses: smaller footprints, shorter
-            building_subtype = "house"
-            base_width = rng.uniform(10.0, 18.0)  # Smaller footprint
-            base_depth = rng.uniform(10.0, 18.0)
-            height = rng.choice([8.0, 12.0])  # 2-3 stories
-    elif zone_type == "commercial":
-        # Commercial: mostly office towers, all 5 stories tall (20m)
-        # Commercial zones ONLY get commercial-themed buildings (retail)
-        base_width = rng.uniform(15.0, 35.0)  # Office tower footprint
-        base_depth = rng.uniform(15.0, 35.0)
-        height = 20.0  # All commercial buildings are 5 stories (20m)
-        building_subtype = "retail"  # Commercial zones always get retail buildings
-    elif zone_type == "industrial":
-        if building_subtype == "warehouse":
-            # Warehouses: mostly short, wide, and long
-            # 80% short (5m or 10m), 20% medium height
-            if rng.random() < 0.8:
-                height = rng.choice([5.0, 10.0])  # Mostly short
-            else:
-                height = 12.0  # Some medium height
-            # Wide and long footprints
-            base_width = rng.uniform(40.0, 80.0)  # Wide
-            base_depth = rng.uniform(40.0, 80.0)  # Long
-        else:  # factory
-            # Factories: large footprint, mostly short to medium height
-            base_width = rng.uniform(30.0, 65.0)  # Wide
-            base_depth = rng.uniform(30.0, 65.0)  # Long
-            # 70% short/medium (5-12m), 30% taller
-            if rng.random() < 0.7:
-                height = rng.choice([5.0, 8.0, 10.0, 12.0])  # Mostly short/medium
-            else:
-                height = rng.choice([16.0, 20.0])  # Some taller
-    elif zone_type == "mixed_use" or zone_type == "mixed-use":
-        # Mixed-use zones can get ANY type of building (residential, commercial, industrial)
-        # This creates variety in mixed-use areas
-        building_type_choice = rng.random()
-        
-        if building_type_choice < 0.5:  # 50% residential
-            # Residential buildings in mixed-use zones
-            if rng.random() < 0.6:
-                building_subtype = rng.choice(["apartment", "campus"])
-                base_width = rng.uniform(20.0, 40.0)
-                base_depth = rng.uniform(20.0, 40.0)
-                height = rng.choice([12.0, 16.0, 20.0])
-            else:
-                building_subtype = "house"
-                base_width = rng.uniform(10.0, 18.0)
-                base_depth = rng.uniform(10.0, 18.0)
-                height = rng.choice([8.0, 12.0])
-        elif building_type_choice < 0.8:  # 30% commercial
-            # Commercial buildings in mixed-use zones
-            base_width = rng.uniform(15.0, 35.0)
-            base_depth = rng.uniform(15.0, 35.0)
-            height = 20.0  # 5 stories
-            building_subtype = "retail"
-        else:  # 20% industrial
-            # Industrial buildings in mixed-use zones
-            if rng.random() < 0.6:  # 60% warehouses, 40% factories
-                building_subtype = "warehouse"
-                base_width = rng.uniform(40.0, 70.0)
-                base_depth = rng.uniform(40.0, 70.0)
-                height = rng.choice([5.0, 10.0])
-            else:
-                building_subtype = "factory"
-                base_width = rng.uniform(30.0, 60.0)
-                base_depth = rng.uniform(30.0, 60.0)
-                height = rng.choice([8.0, 10.0, 12.0])
-    elif zone_type == "agricultural":
-        # Agricultural buildings: house, barn/warehouse, small industrial
-        # This will be clustered in generation.py, but here we define the building types
-        if building_subtype == "residence":
-            # Agricultural residences: small to medium (farmhouses)
-            building_subtype = "house"  # Use "house" subtype for farmhouses
-            base_width = rng.uniform(10.0, 18.0)
-            base_depth = rng.uniform(10.0, 18.0)
-            height = rng.choice([8.0, 12.0])  # 2-3 stories
-        elif building_subtype == "agri_industrial":
-            # Determine if it's a barn/warehouse or small industrial
-            if rng.random() < 0.6:  # 60% barn/warehouse
-                building_subtype = "barn"
-                base_width = rng.uniform(12.0, 25.0)  # Small warehouse/barn
-                base_depth = rng.uniform(12.0, 25.0)
-                height = rng.choice([5.0, 8.0, 10.0])  # Short structures
-            else:  # 40% small industrial
-                building_subtype = "warehouse"  # Use warehouse subtype
-                base_width = rng.uniform(15.0, 30.0)  # Small industrial
-                base_depth = rng.uniform(15.0, 30.0)
-                height = rng.choice([5.0, 8.0, 10.0])  # Short
-        else:
-            # Default agricultural: farmhouse
-            building_subtype = "house"
-            base_width = rng.uniform(10.0, 18.0)
-            base_depth = rng.uniform(10.0, 18.0)
-            height = rng.choice([8.0, 12.0])
-    elif zone_type == "park":
-        # Park buildings: small structures scattered throughout
-        base_width = rng.uniform(5.0, 15.0)  # Small
-        base_depth = rng.uniform(5.0, 15.0)  # Small
-        height = rng.choice([4.0, 8.0])  # 1-2 stories, mostly 1 story
-        building_subtype = "park_structure"
-    else:
-        # Default (restricted, etc.)
-        base_width = rng.uniform(10.0, 30.0)
-        base_depth = rng.uniform(10.0, 30.0)
-        # Heights: 1-3 floors
-        num_floors = rng.choice([1, 2, 3])
-        height = num_floors * FLOOR_HEIGHT
-        building_subtype = zone_type
+    Args:
+        zone_types: Zone type per building (residential, commercial, industrial, etc.)
+        zone_importances: Zone importance per building (0.0 to 1.0)
+        building_seeds: Deterministic seed per building
     
-    # Scale by zone importance (higher importance = larger buildings)
-    scale = 0.7 + (zone_importance * 0.6)  # Scale from 0.7x to 1.3x
+    Returns:
+        Tuple of (widths, depths, heights, building_subtypes); widths/depths/heights are
+        arrays in meters, building_subtypes is a list of strings
+    """
+    normalized = [(zone_type or "").lower().strip() for zone_type in zone_types]
+    default_code = _ZONE_CODES["default"]
+    codes = np.array(
+        [_ZONE_CODES.get(_ZONE_ALIASES.get(z, z), default_code) for z in normalized], dtype=np.int64
+    )
+    importances = np.asarray(zone_importances, dtype=np.float64)
     
-    width = max(MIN_BUILDING_WIDTH, min(MAX_BUILDING_WIDTH, base_width * scale))
-    depth = max(MIN_BUILDING_DEPTH, min(MAX_BUILDING_DEPTH, base_depth * scale))
-    # Height is already in 4m floor increments, no scaling needed
+    # Draws: variant, width, depth, height
+    u = _seed_uniforms(building_seeds, 4)
     
-    return (width, depth, height, building_subtype)
+    slots = (u[:, 0:1] >= _VARIANT_CDF[codes]).sum(axis=1)
+    variants = _VARIANT_IDS[codes, slots]
+    
+    lows = _VARIANT_FOOTPRINTS[variants, 0]
+    spans = _VARIANT_FOOTPRINTS[variants, 1] - lows
+    base_width = lows + spans * u[:, 1]
+    base_depth = lows + spans * u[:, 2]
+    
+    height_slots = (u[:, 3:4] >= _VARIANT_HEIGHT_CDF[variants]).sum(axis=1)
+    heights = _VARIANT_HEIGHTS[variants, height_slots]
+    
+    # Scale by zone importance (higher importance = larger buildings): 0.7x to 1.3x
+    scale = 0.7 + (importances * 0.6)
+    widths = np.clip(base_width * scale, MIN_BUILDING_WIDTH, MAX_BUILDING_WIDTH)
+    depths = np.clip(base_depth * scale, MIN_BUILDING_DEPTH, MAX_BUILDING_DEPTH)
+    # Height is already in discrete floor increments, no scaling needed
+    
+    subtypes = [
+        _VARIANT_SUBTYPES[variant] if _VARIANT_SUBTYPES[variant] is not None else zone_type
+        for variant, zone_type in zip(variants.tolist(), normalized)
+    ]
+    return widths, depths, heights, subtypes
+
+
+def _get_building_dimensions(
+    zone_type: str, zone_importance: float, building_seed: int
+) -> Tuple[float, float, float, str]:
+    """
+    Get building dimensions based on zone type and importance.
+    
+    Single-building wrapper around _get_building_dimensions_batch.
+    
+    Returns:
+        Tuple of (width, depth, height, building_subtype) in meters
+        building_subtype: More specific building type (e.g., "warehouse", "factory", "house", "barn")
+    """
+    widths, depths, heights, subtypes = _get_building_dimensions_batch(
+        [zone_type], [zone_importance], [building_seed]
+    )
+    return (float(widths[0]), float(depths[0]), float(heights[0]), subtypes[0])
 
 
 def _get_building_dimensions_with_subtype(
-    zone_type: str, zone_importance: float, rng: random.Random, building_subtype_override: str
+    zone_type: str, zone_importance: float, rng: PooledRandom, building_subtype_override: str
 ) -> Tuple[float, float, float, str]:
     """
     Get building dimensions based on zone type and a specific building subtype override.
@@ -482,9 +656,124 @@ def _get_building_dimensions_with_subtype(
     return (width, depth, height, building_subtype)
 
 
+# Facade order used by the window kernel (index -> facade name)
+FACADES = ("front", "back", "left", "right")
+# Window type order used by the window kernel (index -> WINDOW_TYPES key)
+WINDOW_TYPE_NAMES = ("full_height", "standard", "ceiling")
+# Window center offset from floor base and window height, by window type index
+WINDOW_TYPE_CENTERS = np.array([WINDOW_TYPES[t]["center"] for t in WINDOW_TYPE_NAMES])
+WINDOW_TYPE_HEIGHTS = np.array([WINDOW_TYPES[t]["height"] for t in WINDOW_TYPE_NAMES])
+
+
+@njit
+def _window_grid_kernel(
+    width: float,
+    depth: float,
+    height: float,
+    num_floors: int,
+    density: float,
+    corner_trim_width: float,
+    type_probs: np.ndarray,
+    type_centers: np.ndarray,
+    type_heights: np.ndarray,
+    draws: np.ndarray,
+):
+    """
+    Fill window arrays for all four facades.
+    
+    Consumes pre-drawn uniforms in the same order as the original per-window loop:
+    for each facade and floor, three window-type draws followed by one skip draw per slot.
+    
+    Returns:
+        Tuple of (x[N], z[N], w[N], h[N], facade_ids[N], type_ids[N], N) where x is the
+        facade-local horizontal offset and z the vertical offset from building center
+    """
+    facade_widths = np.array([width, width, depth, depth])
+    
+    # Windows per facade (horizontal slots) for each facade
+    windows_per_facade = np.empty(4, dtype=np.int64)
+    capacity = 0
+    for f in range(4):
+        usable_width = facade_widths[f] - (corner_trim_width * 2)
+        available_width = usable_width - (WINDOW_SPACING * 2)
+        count = max(1, int(available_width / (WINDOW_WIDTH + WINDOW_SPACING)))
+        count = max(1, int(count * math.sqrt(density)))
+        windows_per_facade[f] = count
+        capacity += num_floors * count * 3
+    
+    xs = np.empty(capacity)
+    zs = np.empty(capacity)
+    ws = np.empty(capacity)
+    hs = np.empty(capacity)
+    facade_ids = np.empty(capacity, dtype=np.uint8)
+    type_ids = np.empty(capacity, dtype=np.uint8)
+    
+    n = 0
+    d = 0
+    for f in range(4):
+        facade_width = facade_widths[f]
+        count = windows_per_facade[f]
+        usable_width = facade_width - (corner_trim_width * 2)
+        available_width = usable_width - (WINDOW_SPACING * 2)
+        window_spacing_x = available_width / max(1, count - 1) if count > 1 else 0.0
+        
+        # Window centers must stay WINDOW_WIDTH/2 clear of the corner trim
+        min_offset = -facade_width / 2.0 + corner_trim_width + WINDOW_WIDTH / 2.0
+        max_offset = facade_width / 2.0 - corner_trim_width - WINDOW_WIDTH / 2.0
+        
+        active_types = np.empty(3, dtype=np.int64)
+        for floor_num in range(num_floors):
+            floor_base = -height / 2.0 + floor_num * FLOOR_HEIGHT
+            
+            # Window types used on this floor, decided once per floor
+            active_count = 0
+            for t in range(3):
+                if draws[d] < type_probs[t]:
+                    active_types[active_count] = t
+                    active_count += 1
+                d += 1
+            
+            if active_count == 0:
+                # No windows on this floor; still consume the per-slot skip draws
+                d += count
+                continue
+            
+            for i in range(count):
+                # Skip some windows randomly for variation (10% chance)
+                skip = draws[d] < 0.1
+                d += 1
+                if skip:
+                    continue
+                
+                if count > 1:
+                    offset_local = min_offset + (i * window_spacing_x)
+                    offset_local = min(offset_local, max_offset - WINDOW_WIDTH / 2.0)
+                else:
+                    # Single window: center it in available area
+                    offset_local = (min_offset + max_offset) / 2.0
+                
+                for j in range(active_count):
+                    t = active_types[j]
+                    xs[n] = offset_local
+                    zs[n] = floor_base + type_centers[t]
+                    ws[n] = WINDOW_WIDTH
+                    hs[n] = type_heights[t]
+                    facade_ids[n] = f
+                    type_ids[n] = t
+                    n += 1
+    
+    return xs, zs, ws, hs, facade_ids, type_ids, n
+
+
 def _generate_window_grid(
-    width: float, depth: float, height: float, building_seed: int, building_subtype: str = None, corner_trim_width: float = 0.02
-) -> List[Dict[str, Any]]:
+    width: float,
+    depth: float,
+    height: float,
+    building_seed: int,
+    building_subtype: str = None,
+    corner_trim_width: float = 0.02,
+    rng: Optional[PooledRandom] = None,
+) -> Dict[str, np.ndarray]:
     """
     Generate windows for a building using floor-based window patterns.
     Windows are generated on all four facades (front, back, left, right).
@@ -495,47 +784,49 @@ def _generate_window_grid(
     - Standard: 2.0-3.0m (middle of living space)
     - Ceiling: 3.25-3.75m (upper part of living space)
     
+    The numeric work runs in _window_grid_kernel (Numba-compiled when available);
+    this wrapper draws the random numbers the kernel consumes.
+    
     Args:
         width: Building width in meters
         depth: Building depth in meters
         height: Building height in meters (must be multiple of 4m)
-        building_seed: Seed for deterministic generation
+        building_seed: Seed for deterministic generation (used when rng is not given)
         building_subtype: Optional building subtype (warehouse, factory, etc.)
+        corner_trim_width: Corner trim width in meters
+        rng: Building random number generator to draw from
     
     Returns:
-        List of window dictionaries with position and size
+        Windows as structure-of-arrays (see _empty_windows); use _windows_to_dicts
+        to convert to the serialized list-of-dicts format
     """
-    rng = seeded_random(building_seed)
-    windows = []
+    if rng is None:
+        rng = seeded_random(building_seed)
     
     # Calculate number of floors (each floor is 4m)
     num_floors = int(height / FLOOR_HEIGHT)
     if num_floors < 1:
-        return windows  # No floors, no windows
+        return _empty_windows()  # No floors, no windows
     
     # Window density and type preferences based on building subtype
     if building_subtype == "warehouse":
         density = 0.10  # Warehouses have very few windows (10% density)
         prefer_full_height = False
         prefer_standard = False
-        prefer_ceiling = False
     elif building_subtype == "factory":
         density = 0.20  # Factories have few windows (20% density)
         prefer_full_height = False
         prefer_standard = True
-        prefer_ceiling = False
-    elif building_subtype in ["barn", "agri_industrial"]:
+    elif building_subtype in _AGRICULTURAL_SUBTYPES:
         density = 0.20  # Agricultural buildings have limited windows (20% density)
         prefer_full_height = False
         prefer_standard = True
-        prefer_ceiling = False
     elif building_subtype == "retail":
         # Commercial office towers: mostly floor-to-ceiling windows
         density = 0.75  # High window density
         prefer_full_height = True  # Prefer full-height windows
         prefer_standard = False
-        prefer_ceiling = False
-    elif building_subtype in ["apartment", "campus", "house", "residence"]:
+    elif building_subtype in _RESIDENTIAL_SUBTYPES:
         # Residential: mostly standard windows
         if building_subtype == "house":
             density = 0.60  # Houses have moderate window coverage
@@ -543,153 +834,183 @@ def _generate_window_grid(
             density = 0.70  # Apartments/campuses have good window coverage
         prefer_full_height = False
         prefer_standard = True  # Prefer standard windows
-        prefer_ceiling = False
     elif building_subtype == "park_structure":
         density = 0.40  # Park structures have moderate windows
         prefer_full_height = False
         prefer_standard = True
-        prefer_ceiling = False
     else:
         density = 0.65  # Default: 65% of facade covered
         prefer_full_height = False
         prefer_standard = True
-        prefer_ceiling = False
     
-    # Use variable corner trim width (10cm to 50cm) - absolute width in meters
+    # Per-floor chance of each window type (full_height, standard, ceiling)
+    if prefer_full_height:
+        # Commercial: mostly full-height windows
+        type_probs = np.array([0.85, 0.15, 0.10])
+    elif prefer_standard:
+        # Residential and others: mostly standard windows
+        type_probs = np.array([0.20, 0.85, 0.25])
+    else:
+        # Industrial/warehouse: minimal windows
+        type_probs = np.array([0.10, 0.30, 0.10])
     
-    # Helper function to generate windows for a facade
-    def generate_windows_for_facade(facade: str, facade_width: float, facade_offset: Tuple[float, float, float]):
-        """Generate windows for a specific facade.
-        
-        Args:
-            facade: 'front', 'back', 'left', or 'right'
-            facade_width: Width of the facade (for spacing calculation)
-            facade_offset: (x, y, z) offset from building center to facade center
-        """
-        # Calculate horizontal window spacing for this facade
-        # Use absolute corner trim width (in meters)
-        trim_margin = corner_trim_width  # Absolute width in meters
-        # Usable area: exclude trim margins on both sides
-        usable_width = facade_width - (trim_margin * 2)
-        # Further reduce by window spacing margins
-        available_width = usable_width - (WINDOW_SPACING * 2)
+    # Draw every uniform the kernel needs up front: per facade and floor,
+    # three window-type draws plus one skip draw per horizontal slot
+    draw_count = 0
+    for facade_width in (width, width, depth, depth):
+        available_width = facade_width - (corner_trim_width * 2) - (WINDOW_SPACING * 2)
         windows_per_facade = max(1, int(available_width / (WINDOW_WIDTH + WINDOW_SPACING)))
         windows_per_facade = max(1, int(windows_per_facade * math.sqrt(density)))
-        window_spacing_x = available_width / max(1, windows_per_facade - 1) if windows_per_facade > 1 else 0
-        
-        # Calculate offset range for windows (relative to facade center)
-        # Windows should be within: [-facade_width/2 + trim_margin, +facade_width/2 - trim_margin]
-        # Account for window width: window center must be at least WINDOW_WIDTH/2 from trim edge
-        min_offset = -facade_width / 2.0 + trim_margin + WINDOW_WIDTH / 2.0
-        max_offset = facade_width / 2.0 - trim_margin - WINDOW_WIDTH / 2.0
-        
-        # Generate windows for each floor
-        for floor_num in range(num_floors):
-            floor_base = -height / 2.0 + floor_num * FLOOR_HEIGHT
-            
-            # Determine which window types to use on this floor based on preferences
-            if prefer_full_height:
-                # Commercial: mostly full-height windows
-                use_full_height = rng.random() < 0.85  # 85% chance for full-height windows
-                use_standard = rng.random() < 0.15     # 15% chance for standard windows
-                use_ceiling = rng.random() < 0.10      # 10% chance for ceiling windows
-            elif prefer_standard:
-                # Residential and others: mostly standard windows
-                use_full_height = rng.random() < 0.20  # 20% chance for full-height windows
-                use_standard = rng.random() < 0.85     # 85% chance for standard windows
-                use_ceiling = rng.random() < 0.25      # 25% chance for ceiling windows
-            else:
-                # Industrial/warehouse: minimal windows
-                use_full_height = rng.random() < 0.10  # 10% chance for full-height windows
-                use_standard = rng.random() < 0.30     # 30% chance for standard windows
-                use_ceiling = rng.random() < 0.10      # 10% chance for ceiling windows
-            
-            # Generate windows horizontally across the facade
-            for i in range(windows_per_facade):
-                # Skip some windows randomly for variation (10% chance)
-                if rng.random() < 0.1:
-                    continue
-                
-                # Horizontal position (relative to facade center)
-                # Distribute windows evenly across available width, starting from min_offset
-                # Ensure we don't exceed max_offset
-                if windows_per_facade > 1:
-                    offset_local = min_offset + (i * window_spacing_x)
-                    # Clamp to ensure we don't exceed max_offset (accounting for window width)
-                    max_allowed = max_offset - WINDOW_WIDTH / 2.0
-                    offset_local = min(offset_local, max_allowed)
-                else:
-                    # Single window: center it in available area
-                    offset_local = (min_offset + max_offset) / 2.0
-                
-                # Convert to building-relative coordinates based on facade orientation
-                if facade == "front":
-                    offset_x = offset_local
-                    offset_y = facade_offset[1]  # depth / 2.0
-                    offset_z = facade_offset[2]  # 0
-                elif facade == "back":
-                    offset_x = offset_local
-                    offset_y = facade_offset[1]  # -depth / 2.0
-                    offset_z = facade_offset[2]  # 0
-                elif facade == "left":
-                    offset_x = facade_offset[0]  # -width / 2.0
-                    offset_y = offset_local
-                    offset_z = facade_offset[2]  # 0
-                else:  # right
-                    offset_x = facade_offset[0]  # width / 2.0
-                    offset_y = offset_local
-                    offset_z = facade_offset[2]  # 0
-                
-                # Generate window types for this position
-                if use_full_height:
-                    win_type = WINDOW_TYPES["full_height"]
-                    window = {
-                        "position": [
-                            offset_x,
-                            offset_y,
-                            floor_base + (win_type["bottom"] + win_type["top"]) / 2.0
-                        ],
-                        "size": [WINDOW_WIDTH, win_type["height"]],
-                        "facade": facade,
-                        "type": "full_height",
-                    }
-                    windows.append(window)
-                
-                if use_standard:
-                    win_type = WINDOW_TYPES["standard"]
-                    window = {
-                        "position": [
-                            offset_x,
-                            offset_y,
-                            floor_base + (win_type["bottom"] + win_type["top"]) / 2.0
-                        ],
-                        "size": [WINDOW_WIDTH, win_type["height"]],
-                        "facade": facade,
-                        "type": "standard",
-                    }
-                    windows.append(window)
-                
-                if use_ceiling:
-                    win_type = WINDOW_TYPES["ceiling"]
-                    window = {
-                        "position": [
-                            offset_x,
-                            offset_y,
-                            floor_base + (win_type["bottom"] + win_type["top"]) / 2.0
-                        ],
-                        "size": [WINDOW_WIDTH, win_type["height"]],
-                        "facade": facade,
-                        "type": "ceiling",
-                    }
-                    windows.append(window)
+        draw_count += num_floors * (3 + windows_per_facade)
+    draws = rng.random_array(draw_count)
+    
+    xs, zs, ws, hs, facade_ids, type_ids, count = _window_grid_kernel(
+        width, depth, height, num_floors, density, corner_trim_width,
+        type_probs, WINDOW_TYPE_CENTERS, WINDOW_TYPE_HEIGHTS, draws,
+    )
+    
+    return {
+        "x": xs[:count],
+        "z": zs[:count],
+        "w": ws[:count],
+        "h": hs[:count],
+        "facade": facade_ids[:count],
+        "type": type_ids[:count],
+    }
+
+
+def _empty_windows() -> Dict[str, np.ndarray]:
+    """
+    Create an empty structure-of-arrays window set.
+    
+    Keys:
+        x: Facade-local horizontal offset from facade center
+        z: Vertical offset from building center
+        w, h: Window width and height
+        facade: Index into FACADES (uint8)
+        type: Index into WINDOW_TYPE_NAMES (uint8)
+    """
+    return {
+        "x": np.empty(0),
+        "z": np.empty(0),
+        "w": np.empty(0),
+        "h": np.empty(0),
+        "facade": np.empty(0, dtype=np.uint8),
+        "type": np.empty(0, dtype=np.uint8),
+    }
+
+
+def _windows_to_dicts(windows: Dict[str, np.ndarray], width: float, depth: float) -> List[Dict[str, Any]]:
+    """
+    Convert structure-of-arrays windows to the serialized list-of-dicts format.
+    
+    Front/back windows sit at y = +/-depth/2 and run along X; left/right windows
+    sit at x = -/+width/2 and run along Y.
+    """
+    facade_planes = (depth / 2.0, -depth / 2.0, -width / 2.0, width / 2.0)
+    result = []
+    for x, z, w, h, facade_id, type_id in zip(
+        windows["x"].tolist(),
+        windows["z"].tolist(),
+        windows["w"].tolist(),
+        windows["h"].tolist(),
+        windows["facade"].tolist(),
+        windows["type"].tolist(),
+    ):
+        if facade_id < 2:
+            position = [x, facade_planes[facade_id], z]
+        else:
+            position = [facade_planes[facade_id], x, z]
+        result.append({
+            "position": position,
+            "size": [w, h],
+            "facade": FACADES[facade_id],
+            "type": WINDOW_TYPE_NAMES[type_id],
+        })
+    return result
+
+
+# Secondary door policy by building subtype:
+# (chance of secondary doors, min count, max count, candidate facades)
+# Facades that already have a door are skipped; a count of None means every candidate.
+SECONDARY_DOOR_POLICY: Dict[str, Tuple[float, Optional[int], Optional[int], Tuple[str, ...]]] = {
+    # Commercial office towers: doors on all sides
+    "retail": (1.0, None, None, FACADES),
+    # Apartment buildings and campuses: multiple doors (2-3 additional)
+    "apartment": (1.0, 2, 3, FACADES),
+    "campus": (1.0, 2, 3, FACADES),
+    # Houses: fewer doors, 20% chance for one secondary door
+    "house": (0.2, 1, 1, FACADES),
+    # Legacy "residence" subtype: 40% chance for one secondary door
+    "residence": (0.4, 1, 1, FACADES),
+    # Industrial buildings: REQUIRE at least 1 door on BOTH front and back facades
+    "warehouse": (1.0, None, None, ("front", "back")),
+    "factory": (1.0, None, None, ("front", "back")),
+}
+
+
+def _window_bounds_by_facade(
+    windows: Dict[str, np.ndarray]
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Group windows by facade into facade-local AABB arrays.
+    
+    Returns:
+        Dictionary mapping facade name to (left, right, bottom, top) arrays
+    """
+    half_w = windows["w"] / 2.0
+    half_h = windows["h"] / 2.0
+    left = windows["x"] - half_w
+    right = windows["x"] + half_w
+    bottom = windows["z"] - half_h
+    top = windows["z"] + half_h
+    
+    bounds = {}
+    for facade_id, facade in enumerate(FACADES):
+        mask = windows["facade"] == facade_id
+        if mask.any():
+            bounds[facade] = (left[mask], right[mask], bottom[mask], top[mask])
+    return bounds
+
+
+def _sample_free_position(
+    rng: PooledRandom,
+    lo: float,
+    hi: float,
+    blocked_starts: np.ndarray,
+    blocked_ends: np.ndarray,
+) -> Optional[float]:
+    """
+    Sample a position uniformly from [lo, hi] minus a set of blocked intervals.
+    
+    Blocked intervals are merged with a sorted sweep and the free gaps between them
+    are sampled in proportion to their length.
+    
+    Returns:
+        Sampled position, or None if no free space remains
+    """
+    if hi <= lo:
+        return None
+    
+    order = np.argsort(blocked_starts)
+    starts = blocked_starts[order]
+    # Running max of interval ends merges overlapping blocked intervals
+    ends = np.maximum.accumulate(blocked_ends[order])
     
-    # Generate windows for all four facades
-    generate_windows_for_facade("front", width, (0, depth / 2.0, 0))
-    generate_windows_for_facade("back", width, (0, -depth / 2.0, 0))
-    generate_windows_for_facade("left", depth, (-width / 2.0, 0, 0))
-    generate_windows_for_facade("right", depth, (width / 2.0, 0, 0))
+    gap_starts = np.maximum(np.concatenate(([lo], ends)), lo)
+    gap_ends = np.minimum(np.concatenate((starts, [hi])), hi)
+    lengths = gap_ends - gap_starts
+    free = lengths > 0.0
+    if not free.any():
+        return None
+    gap_starts = gap_starts[free]
+    lengths = lengths[free]
     
-    return windows
+    cumulative = np.cumsum(lengths)
+    u = rng.random() * cumulative[-1]
+    index = min(int(np.searchsorted(cumulative, u, side="right")), len(lengths) - 1)
+    previous = cumulative[index - 1] if index > 0 else 0.0
+    return float(gap_starts[index] + (u - previous))
 
 
 def _generate_doors(
@@ -699,8 +1020,8 @@ def _generate_doors(
     building_seed: int, 
     building_subtype: str,
     main_door_facade: str,
-    rng: random.Random,
-    windows: List[Dict[str, Any]] = None,
+    rng: PooledRandom,
+    windows: Optional[Dict[str, np.ndarray]] = None,
     corner_trim_width: float = 0.1
 ) -> Dict[str, Dict[str, Any]]:
     """
@@ -717,14 +1038,14 @@ def _generate_doors(
         building_subtype: Building subtype (warehouse, factory, etc.)
         main_door_facade: Facade that faces r=0 ("front" or "back")
         rng: Random number generator
-        windows: List of window dictionaries to avoid overlaps
+        windows: Structure-of-arrays windows to avoid overlaps
     
     Returns:
         Dictionary mapping facade name to door info, or empty dict if no door on that facade
         Example: {"front": {"x": 0, "y": 0, "width": 1.2, "height": 2.5}, ...}
     """
     doors = {}
-    windows = windows or []
+    windows = windows if windows is not None else _empty_windows()
     
     # Standard door dimensions
     door_width = 0.9  # 90cm wide
@@ -740,57 +1061,12 @@ def _generate_doors(
     
     # Use variable corner trim width (absolute value in meters)
     
-    def door_overlaps_window(door_x: float, door_y: float, door_w: float, door_h: float, 
-                              facade: str, facade_width: float) -> bool:
-        """Check if door overlaps any window on the given facade."""
-        door_left = door_x - door_w / 2.0
-        door_right = door_x + door_w / 2.0
-        door_bottom = door_y - door_h / 2.0
-        door_top = door_y + door_h / 2.0
-        
-        for window in windows:
-            if window.get("facade") != facade:
-                continue
-            
-            win_pos = window["position"]
-            win_size = window["size"]
-            
-            # Convert window position to facade-local coordinates
-            # Window position is in building-relative coordinates (x, y, z)
-            # For front/back facades: window X is already in facade-local coordinates
-            # For left/right facades: window Y becomes X for the facade
-            if facade == "front" or facade == "back":
-                # Window X is already in facade-local coordinates
-                win_x = win_pos[0]
-            elif facade == "left":
-                # For left facade, window Y coordinate (relative to building center) becomes X
-                # But we need to account for the fact that left facade is at -width/2
-                # Window Y is relative to building center, so win_pos[1] is the Y offset
-                # For left facade, we need the distance from the facade center
-                # Actually, looking at the window generation code, for left facade:
-                # offset_x = -width/2 (facade position), offset_y = offset_local (window position along facade)
-                # So win_pos[1] is the window position along the facade
-                win_x = win_pos[1]  # Y coordinate becomes X for side facades
-            else:  # right
-                win_x = win_pos[1]  # Y coordinate becomes X for side facades
-            
-            win_left = win_x - win_size[0] / 2.0
-            win_right = win_x + win_size[0] / 2.0
-            
-            # Window Z is vertical position (relative to building center)
-            win_center_y = win_pos[2]
-            win_bottom = win_center_y - win_size[1] / 2.0
-            win_top = win_center_y + win_size[1] / 2.0
-            
-            # Check for overlap (with margin to avoid touching)
-            margin = 0.15  # 15cm margin for safety
-            if not (door_right < win_left - margin or door_left > win_right + margin or
-                    door_top < win_bottom - margin or door_bottom > win_top + margin):
-                return True
-        
-        return False
+    # Per-facade window bounds, built once per building
+    window_bounds = _window_bounds_by_facade(windows)
+    # Front/back facades span the building width, left/right span the depth
+    facade_widths = dict(zip(FACADES, (width, width, depth, depth)))
     
-    def find_door_position(facade: str, facade_width: float, max_attempts: int = 50) -> Optional[float]:
+    def find_door_position(facade: str, facade_width: float) -> Optional[float]:
         """Find a valid door position that doesn't overlap windows or corner trim."""
         # Available width: exclude corner trim (absolute width in meters)
         # Door center must be at least door_width/2 from trim edge
@@ -798,143 +1074,68 @@ def _generate_doors(
         max_x = facade_width / 2.0 - corner_trim_width - door_width / 2.0
         available_width = max_x - min_x
         
-        # Try multiple positions to find one that doesn't overlap windows
-        for attempt in range(max_attempts):
-            # Try random position within available area
-            door_x = min_x + rng.random() * available_width
-            
-            # Check if this position overlaps any window
-            if not door_overlaps_window(door_x, door_y_position, door_width, door_height, facade, facade_width):
-                return door_x
-        
-        # If we can't find a non-overlapping position after many attempts,
-        # try positions away from center where windows are more likely
-        # Try edges first (less likely to have windows)
-        edge_positions = [
-            min_x + available_width * 0.1,  # 10% from left edge
-            min_x + available_width * 0.9,  # 10% from right edge
-            min_x + available_width * 0.25,  # 25% from left
-            min_x + available_width * 0.75,  # 25% from right
-        ]
-        
-        for pos in edge_positions:
-            if not door_overlaps_window(pos, door_y_position, door_width, door_height, facade, facade_width):
-                return pos
+        # Windows in the door's height band block a range of door centers along the facade
+        margin = 0.15  # 15cm margin for safety
+        blocked_starts = np.empty(0)
+        blocked_ends = np.empty(0)
+        bounds = window_bounds.get(facade)
+        if bounds is not None:
+            win_left, win_right, win_bottom, win_top = bounds
+            door_bottom = door_y_position - door_height / 2.0
+            door_top = door_y_position + door_height / 2.0
+            in_band = (door_top >= win_bottom - margin) & (door_bottom <= win_top + margin)
+            blocked_starts = win_left[in_band] - margin - door_width / 2.0
+            blocked_ends = win_right[in_band] + margin + door_width / 2.0
         
-        # Last resort: try very edge positions to minimize overlap
-        # Check if very edge positions avoid windows
-        for edge_pos in [min_x + available_width * 0.05, min_x + available_width * 0.95]:
-            if not door_overlaps_window(edge_pos, door_y_position, door_width, door_height, facade, facade_width):
-                return edge_pos
+        door_x = _sample_free_position(rng, min_x, max_x, blocked_starts, blocked_ends)
+        if door_x is not None:
+            return door_x
         
-        # If still can't find a position, place at edge anyway (this should be rare)
+        # No gap between windows: place at edge anyway (this should be rare)
         # The door will overlap a window, but it's better than having no door
         return min_x + available_width * 0.05  # 5% from left edge
     
-    # Main door: always on the facade facing r=0
-    facade_width = width if main_door_facade in ["front", "back"] else depth
-    door_offset = find_door_position(main_door_facade, facade_width)
-    
-    if door_offset is not None:
-        doors[main_door_facade] = {
+    def make_door(door_offset: float, door_type: str) -> Dict[str, Any]:
+        """Build a standard door entry at the given facade offset."""
+        return {
             "x": door_offset,  # Offset from facade center (in facade's local X coordinate)
             "y": door_y_position,  # Vertical position relative to building center
             "width": door_width,
             "height": door_height,
-            "type": "main",
+            "type": door_type,
         }
     
-    # Secondary doors: some buildings get them on other facades
-    # Commercial office towers: doors on all sides
-    # Apartment/campus buildings: multiple doors
-    # Houses: fewer doors (just main door, maybe one secondary)
-    if building_subtype == "retail":
-        # Commercial office towers: doors on all sides (front, back, left, right)
-        all_facades = ["front", "back", "left", "right"]
-        for facade in all_facades:
-            if facade != main_door_facade:  # Already have main door on one facade
-                facade_width = width if facade in ["front", "back"] else depth
-                door_offset = find_door_position(facade, facade_width)
-                if door_offset is not None:
-                    doors[facade] = {
-                        "x": door_offset,
-                        "y": door_y_position,
-                        "width": door_width,
-                        "height": door_height,
-                        "type": "secondary",
-                    }
-    elif building_subtype in ["apartment", "campus"]:
-        # Apartment buildings and campuses: multiple doors (2-3 additional)
-        num_secondary_doors = rng.randint(2, 3)
-        other_facades = [f for f in ["front", "back", "left", "right"] if f != main_door_facade]
-        rng.shuffle(other_facades)  # Randomize order
-        
-        for i in range(min(num_secondary_doors, len(other_facades))):
-            facade = other_facades[i]
-            facade_width = width if facade in ["front", "back"] else depth
-            door_offset = find_door_position(facade, facade_width)
-            if door_offset is not None:
-                doors[facade] = {
-                    "x": door_offset,
-                    "y": door_y_position,
-                    "width": door_width,
-                    "height": door_height,
-                    "type": "secondary",
-                }
-    elif building_subtype == "house":
-        # Houses: fewer doors, 20% chance for one secondary door
-        has_secondary_door = rng.random() < 0.2
-        if has_secondary_door:
-            other_facades = [f for f in ["front", "back", "left", "right"] if f != main_door_facade]
-            secondary_facade = rng.choice(other_facades)
-            
-            facade_width = width if secondary_facade in ["front", "back"] else depth
-            door_offset = find_door_position(secondary_facade, facade_width)
-            
-            if door_offset is not None:
-                doors[secondary_facade] = {
-                    "x": door_offset,
-                    "y": door_y_position,
-                    "width": door_width,
-                    "height": door_height,
-                    "type": "secondary",
-                }
-    elif building_subtype == "residence":
-        # Legacy "residence" subtype: 40% chance for secondary door
-        has_secondary_doors = rng.random() < 0.4
-        if has_secondary_doors:
-            other_facades = [f for f in ["front", "back", "left", "right"] if f != main_door_facade]
-            secondary_facade = rng.choice(other_facades)
-            
-            facade_width = width if secondary_facade in ["front", "back"] else depth
-            door_offset = find_door_position(secondary_facade, facade_width)
-            
-            if door_offset is not None:
-                doors[secondary_facade] = {
-                    "x": door_offset,
-                    "y": door_y_position,
-                    "width": door_width,
-                    "height": door_height,
-                    "type": "secondary",
-                }
-    elif building_subtype in ["warehouse", "factory"]:
-        # Industrial buildings: REQUIRE at least 1 door on BOTH front and back facades
-        # Main door is already on one facade (front or back), ensure the other also has a door
-        north_south_facades = ["front", "back"]
-        for facade in north_south_facades:
-            if facade not in doors:  # If this facade doesn't have a door yet, add one
-                facade_width = width if facade in ["front", "back"] else depth
-                door_offset = find_door_position(facade, facade_width)
-                
-                if door_offset is not None:
-                    door_type = "main" if facade == main_door_facade else "secondary"
-                    doors[facade] = {
-                        "x": door_offset,
-                        "y": door_y_position,
-                        "width": door_width,
-                        "height": door_height,
-                        "type": door_type,
-                    }
+    # Main door: always on the facade facing r=0
+    door_offset = find_door_position(main_door_facade, facade_widths[main_door_facade])
+    
+    if door_offset is not None:
+        doors[main_door_facade] = make_door(door_offset, "main")
+    
+    # Secondary doors: some buildings get them on other facades (see SECONDARY_DOOR_POLICY)
+    policy = SECONDARY_DOOR_POLICY.get(building_subtype)
+    if policy is None:
+        return doors
+    probability, min_count, max_count, candidate_facades = policy
+    
+    if probability < 1.0 and rng.random() >= probability:
+        return doors
+    
+    candidates = [f for f in candidate_facades if f not in doors]
+    if min_count is None:
+        selected = candidates
+    elif min_count == max_count == 1:
+        selected = [rng.choice(candidates)]
+    else:
+        count = rng.randint(min_count, max_count)
+        rng.shuffle(candidates)  # Randomize order
+        selected = candidates[:count]
+    
+    for facade in selected:
+        door_offset = find_door_position(facade, facade_widths[facade])
+        if door_offset is not None:
+            # The main facade is only a candidate if its own door did not fit
+            door_type = "main" if facade == main_door_facade else "secondary"
+            doors[facade] = make_door(door_offset, door_type)
     
     return doors
 
@@ -945,9 +1146,9 @@ def _generate_garage_doors(
     height: float,
     building_seed: int,
     building_subtype: str,
-    rng: random.Random,
+    rng: PooledRandom,
     corner_trim_width: float = 0.1,
-    windows: List[Dict[str, Any]] = None,
+    windows: Optional[Dict[str, np.ndarray]] = None,
     doors: Dict[str, Any] = None
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
     """
@@ -963,7 +1164,7 @@ def _generate_garage_doors(
         building_subtype: Building subtype (warehouse, factory, etc.)
         rng: Random number generator
         corner_trim_width: Corner trim width in meters
-        windows: List of window dictionaries to avoid overlaps
+        windows: Structure-of-arrays windows to avoid overlaps
     
     Returns:
         Tuple of (garage_doors_list, utility_doors_list)
@@ -972,8 +1173,9 @@ def _generate_garage_doors(
     """
     garage_doors = []
     utility_doors = []  # List of utility door dictionaries (one per garage door)
-    windows = windows or []
+    windows = windows if windows is not None else _empty_windows()
     doors = doors or {}
+    window_bounds = _window_bounds_by_facade(windows)
     
     # Foundation height calculation (matches client-side: min(0.5, height * 0.1))
     foundation_height = min(0.5, height * 0.1)
@@ -985,35 +1187,21 @@ def _generate_garage_doors(
     
     def utility_door_overlaps_window(door_x: float, door_y: float, facade: str, facade_width: float) -> bool:
         """Check if utility door overlaps any window on the given facade."""
+        bounds = window_bounds.get(facade)
+        if bounds is None:
+            return False
+        win_left, win_right, win_bottom, win_top = bounds
+        
         door_left = door_x - utility_door_width / 2.0
         door_right = door_x + utility_door_width / 2.0
         door_bottom = door_y - utility_door_height / 2.0
         door_top = door_y + utility_door_height / 2.0
         
-        for window in windows:
-            if window.get("facade") != facade:
-                continue
-            
-            win_pos = window["position"]
-            win_size = window["size"]
-            
-            if facade == "front" or facade == "back":
-                win_x = win_pos[0]
-            elif facade == "left" or facade == "right":
-                win_x = win_pos[1]
-            
-            win_left = win_x - win_size[0] / 2.0
-            win_right = win_x + win_size[0] / 2.0
-            win_center_y = win_pos[2]
-            win_bottom = win_center_y - win_size[1] / 2.0
-            win_top = win_center_y + win_size[1] / 2.0
-            
-            margin = 0.15  # 15cm margin for safety
-            if not (door_right < win_left - margin or door_left > win_right + margin or
-                    door_top < win_bottom - margin or door_bottom > win_top + margin):
-                return True
-        
-        return False
+        margin = 0.15  # 15cm margin for safety
+        return bool(np.any(
+            (door_right >= win_left - margin) & (door_left <= win_right + margin) &
+            (door_top >= win_bottom - margin) & (door_bottom <= win_top + margin)
+        ))
     
     # Garage doors are for industrial/agricultural building types
     has_garage_doors = False
@@ -1086,7 +1274,7 @@ def _generate_garage_doors(
         door_type = "garage"
     
     # Only proceed with garage/truck bay door generation if we have a valid building type
-    if building_subtype in ["warehouse", "factory"] or (building_subtype == "house" and garage_count > 0):
+    if building_subtype in _INDUSTRIAL_SUBTYPES or (building_subtype == "house" and garage_count > 0):
         
         # Function to check if garage door overlaps windows or doors with margin
         def garage_door_overlaps(garage_x: float, facade: str, facade_width: float) -> bool:
@@ -1098,27 +1286,12 @@ def _generate_garage_doors(
             garage_top = garage_y_position + garage_height / 2.0
             
             # Check windows
-            for window in windows:
-                if window.get("facade") != facade:
-                    continue
-                
-                win_pos = window["position"]
-                win_size = window["size"]
-                
-                if facade == "front" or facade == "back":
-                    win_x = win_pos[0]
-                elif facade == "left" or facade == "right":
-                    win_x = win_pos[1]
-                
-                win_left = win_x - win_size[0] / 2.0
-                win_right = win_x + win_size[0] / 2.0
-                win_center_y = win_pos[2]
-                win_bottom = win_center_y - win_size[1] / 2.0
-                win_top = win_center_y + win_size[1] / 2.0
-                
-                # Check if garage door (with margins) overlaps window
-                if not (garage_right < win_left or garage_left > win_right or
-                        garage_top < win_bottom or garage_bottom > win_top):
+            bounds = window_bounds.get(facade)
+            if bounds is not None:
+                win_left, win_right, win_bottom, win_top = bounds
+                # Check if garage door (with margins) overlaps any window
+                if np.any((garage_right >= win_left) & (garage_left <= win_right) &
+                          (garage_top >= win_bottom) & (garage_bottom <= win_top)):
                     return True
             
             # Check doors (regular doors already placed on this facade)
@@ -1153,7 +1326,7 @@ def _generate_garage_doors(
             return False
         
         # Determine which facade(s) to place doors on
-        if building_subtype in ["warehouse", "factory"]:
+        if building_subtype in _INDUSTRIAL_SUBTYPES:
             # For warehouses and factories: prefer front/back facades (north/south sides)
             facade_width = width  # Front and back have width as their dimension
             
@@ -1406,27 +1579,12 @@ def _generate_garage_doors(
             garage_top = garage_y_position + garage_height / 2.0
             
             # Check windows
-            for window in windows:
-                if window.get("facade") != facade:
-                    continue
-                
-                win_pos = window["position"]
-                win_size = window["size"]
-                
-                if facade == "front" or facade == "back":
-                    win_x = win_pos[0]
-                elif facade == "left" or facade == "right":
-                    win_x = win_pos[1]
-                
-                win_left = win_x - win_size[0] / 2.0
-                win_right = win_x + win_size[0] / 2.0
-                win_center_y = win_pos[2]
-                win_bottom = win_center_y - win_size[1] / 2.0
-                win_top = win_center_y + win_size[1] / 2.0
-                
-                # Check if garage door (with margins) overlaps window
-                if not (garage_right < win_left or garage_left > win_right or
-                        garage_top < win_bottom or garage_bottom > win_top):
+            bounds = window_bounds.get(facade)
+            if bounds is not None:
+                win_left, win_right, win_bottom, win_top = bounds
+                # Check if garage door (with margins) overlaps any window
+                if np.any((garage_right >= win_left) & (garage_left <= win_right) &
+                          (garage_top >= win_bottom) & (garage_bottom <= win_top)):
                     return True
             
             # Check doors (regular doors already placed on this facade)
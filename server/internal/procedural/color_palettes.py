@@ -4,15 +4,27 @@ Loads hub color palettes from JSON file or API endpoint for use in structure gen
 """
 
 import json
+import logging
 import os
+import sys
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple, TypedDict, Any
 
-# Cache for loaded palettes
-_palettes_cache: Optional[Dict[str, Any]] = None
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional accelerator
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Hub name mapping: Python name -> JSON key
-HUB_NAME_MAPPING = {
+_RAW_HUB_NAME_MAPPING = {
     "Pillar of Kongo": "PillarOfKongo",
     "Pillar of Kilima": "PillarOfKilima",
     "Pillar of Laccadé": "PillarOfLaccade",
@@ -27,6 +39,30 @@ HUB_NAME_MAPPING = {
     "Pillar of Atlantica": "PillarOfAtlantica",
 }
 
+# Interned keys so lookups with the station module's hub names hit the identity fast path
+HUB_NAME_MAPPING = {sys.intern(name): key for name, key in _RAW_HUB_NAME_MAPPING.items()}
+
+# Zone types present in every hub palette (JSON keys)
+ZONE_TYPES = ("Industrial", "Commercial", "Residential", "Parks", "Agricultural")
+
+# Integer ids for tight loops that want to skip string hashing
+HUB_ID: Dict[str, int] = {name: i for i, name in enumerate(HUB_NAME_MAPPING)}
+ZONE_ID: Dict[str, int] = {zone_type: i for i, zone_type in enumerate(ZONE_TYPES)}
+
+
+class ColorComponent(TypedDict):
+    """A single palette color as stored in hub-color-palettes.json."""
+
+    name: str
+    hex: str
+
+
+# Palette file schema: hub key -> zone type -> component -> color
+PaletteFile = Dict[str, Dict[str, Dict[str, ColorComponent]]]
+
+# Schema-validating decoder; TypedDicts decode to plain dicts, so callers see the same data
+_palette_decoder = msgspec.json.Decoder(PaletteFile) if msgspec is not None else None
+
 
 def _get_config_path() -> Path:
     """Get the path to the hub-color-palettes.json file."""
@@ -36,31 +72,143 @@ def _get_config_path() -> Path:
     return current_dir / "config" / "hub-color-palettes.json"
 
 
-def load_color_palettes() -> Dict[str, Any]:
+def _load() -> Optional[Mapping[str, Any]]:
+    """
+    Read and parse the palettes file.
+    
+    Returns:
+        Mapping of hub keys to palettes (read-only at the top level), or None if the
+        file doesn't exist
+        
+    Raises:
+        json.JSONDecodeError: If the JSON file is invalid (or, with msgspec installed,
+            doesn't match the palette schema)
+    """
+    config_path = _get_config_path()
+    if not config_path.exists():
+        return None
+    
+    data = config_path.read_bytes()
+    if _palette_decoder is not None:
+        try:
+            palettes = _palette_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Covers malformed JSON and schema mismatches; surface the stdlib exception type
+            raise json.JSONDecodeError(str(e), data.decode("utf-8", "replace"), 0) from e
+    elif orjson is not None:
+        try:
+            palettes = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            # Surface the same exception type as the stdlib path
+            raise json.JSONDecodeError(str(e), e.doc, e.pos) from e
+    else:
+        palettes = json.loads(data.decode("utf-8"))
+    
+    return MappingProxyType(palettes)
+
+
+def _preload() -> Optional[Mapping[str, Any]]:
+    """Load palettes at import time; a broken file is reported by load_color_palettes instead."""
+    try:
+        return _load()
+    except json.JSONDecodeError:
+        return None
+
+
+def _index_palettes(palettes: Optional[Mapping[str, Any]]) -> None:
+    """
+    Flatten palettes into lookup tables keyed by Python hub name.
+    
+    Builds (hub, zone) -> zone palette and (hub, zone, component) -> hex / RGB so
+    each color query is a single dict lookup instead of a chain of nested gets.
+    """
+    global _palettes_cache, _zone_colors, _zone_colors_by_id, _flat_hex, _flat_rgb
+    
+    zone_colors: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    flat_hex: Dict[Tuple[str, str, str], str] = {}
+    flat_rgb: Dict[Tuple[str, str, str], Tuple[int, int, int]] = {}
+    for hub_name, hub_key in HUB_NAME_MAPPING.items():
+        hub_palette = palettes.get(hub_key) if palettes is not None else None
+        if hub_palette is None:
+            continue
+        for zone_type, zone_palette in hub_palette.items():
+            zone_colors[(hub_name, zone_type)] = zone_palette
+            for component, component_data in zone_palette.items():
+                hex_value = component_data.get("hex")
+                if hex_value is not None:
+                    key = (hub_name, zone_type, component)
+                    flat_hex[key] = hex_value
+                    flat_rgb[key] = _hex_to_rgb(hex_value)
+    
+    _palettes_cache = palettes
+    _zone_colors = zone_colors
+    _zone_colors_by_id = [
+        [zone_colors.get((hub_name, zone_type)) for zone_type in ZONE_TYPES]
+        for hub_name in HUB_NAME_MAPPING
+    ]
+    _flat_hex = flat_hex
+    _flat_rgb = flat_rgb
+
+
+def _hex_to_rgb(hex_value: str) -> Tuple[int, int, int]:
+    """Convert a "#RRGGBB" string to an (r, g, b) tuple of ints."""
+    return (int(hex_value[1:3], 16), int(hex_value[3:5], 16), int(hex_value[5:7], 16))
+
+
+# Palettes never change at runtime, so they are read and indexed once when the module is imported
+_palettes_cache: Optional[Mapping[str, Any]] = None
+_zone_colors: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_zone_colors_by_id: List[List[Optional[Dict[str, Any]]]] = []
+_flat_hex: Dict[Tuple[str, str, str], str] = {}
+_flat_rgb: Dict[Tuple[str, str, str], Tuple[int, int, int]] = {}
+_index_palettes(_preload())
+
+
+def load_color_palettes() -> Mapping[str, Any]:
     """
     Load hub color palettes from JSON file.
     
     Returns:
-        Dictionary mapping hub names to their color palettes
+        Mapping of hub names to their color palettes. Only the top level is read-only;
+        the nested palettes are shared by every lookup and must not be modified.
         
     Raises:
         FileNotFoundError: If the JSON file doesn't exist
         json.JSONDecodeError: If the JSON file is invalid
     """
-    global _palettes_cache
-    
     if _palettes_cache is not None:
         return _palettes_cache
     
-    config_path = _get_config_path()
-    
-    if not config_path.exists():
-        raise FileNotFoundError(f"Color palettes file not found: {config_path}")
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        _palettes_cache = json.load(f)
-    
-    return _palettes_cache
+    # Import-time preload failed; retry so the caller sees the actual error
+    palettes = _load()
+    if palettes is None:
+        raise FileNotFoundError(f"Color palettes file not found: {_get_config_path()}")
+    _index_palettes(palettes)
+    return palettes
+
+
+def _ensure_loaded() -> bool:
+    """Return True if palettes are available, retrying the load if the preload failed."""
+    if _palettes_cache is not None:
+        return True
+    try:
+        load_color_palettes()
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    return True
+
+
+# (hub, zone) pairs already reported as missing, so a miss is only logged once
+_warned_missing: Set[Tuple[str, str]] = set()
+
+
+def _warn_missing(hub_name: str, zone_type: str) -> None:
+    """Log a missing hub/zone palette once per pair."""
+    key = (hub_name, zone_type)
+    if key in _warned_missing or not logger.isEnabledFor(logging.WARNING):
+        return
+    _warned_missing.add(key)
+    logger.warning("No color palette for hub %r, zone type %r", hub_name, zone_type)
 
 
 def get_hub_colors(hub_name: str, zone_type: str) -> Optional[Dict[str, str]]:
@@ -73,30 +221,34 @@ def get_hub_colors(hub_name: str, zone_type: str) -> Optional[Dict[str, str]]:
         
     Returns:
         Dictionary with color components (foundation, walls, roofs, windows_doors, trim)
-        Each component is a dict with "name" and "hex" keys.
-        Returns None if hub or zone type not found.
+        Each component is a dict with "name" and "hex" keys. The dictionary is shared,
+        so treat it as read-only. Returns None if hub or zone type not found.
     """
-    try:
-        palettes = load_color_palettes()
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        return None
-    
-    # Map hub name to JSON key
-    hub_key = HUB_NAME_MAPPING.get(hub_name)
-    if hub_key is None:
+    if _palettes_cache is None and not _ensure_loaded():
         return None
+    colors = _zone_colors.get((hub_name, zone_type))
+    if colors is None:
+        _warn_missing(hub_name, zone_type)
+    return colors
+
+
+def get_hub_colors_by_id(hub_id: int, zone_id: int) -> Optional[Dict[str, str]]:
+    """
+    Get color palette by integer hub and zone ids (see HUB_ID and ZONE_ID).
     
-    # Get hub palette
-    hub_palette = palettes.get(hub_key)
-    if hub_palette is None:
+    Args:
+        hub_id: Index into HUB_NAME_MAPPING order
+        zone_id: Index into ZONE_TYPES
+        
+    Returns:
+        Same dictionary as get_hub_colors, or None if not found
+    """
+    if _palettes_cache is None and not _ensure_loaded():
         return None
-    
-    # Get zone type palette
-    zone_palette = hub_palette.get(zone_type)
-    if zone_palette is None:
+    try:
+        return _zone_colors_by_id[hub_id][zone_id]
+    except IndexError:
         return None
-    
-    return zone_palette
 
 
 def get_hub_color_hex(hub_name: str, zone_type: str, component: str) -> Optional[str]:
@@ -111,19 +263,31 @@ def get_hub_color_hex(hub_name: str, zone_type: str, component: str) -> Optional
     Returns:
         Hex color string (e.g., "#1A1A1C") or None if not found
     """
-    colors = get_hub_colors(hub_name, zone_type)
-    if colors is None:
+    if _palettes_cache is None and not _ensure_loaded():
         return None
+    return _flat_hex.get((hub_name, zone_type, component))
+
+
+def get_hub_color_rgb(hub_name: str, zone_type: str, component: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get a specific color as integer RGB for a hub, zone type, and component.
     
-    component_data = colors.get(component)
-    if component_data is None:
+    Args:
+        hub_name: Name of the hub
+        zone_type: Zone type (Industrial, Commercial, Residential, Parks, Agricultural)
+        component: Color component (foundation, walls, roofs, windows_doors, trim)
+        
+    Returns:
+        (r, g, b) tuple with 0-255 components (e.g., (26, 26, 28)) or None if not found
+    """
+    if _palettes_cache is None and not _ensure_loaded():
         return None
-    
-    return component_data.get("hex")
+    return _flat_rgb.get((hub_name, zone_type, component))
 
 
 def clear_cache() -> None:
-    """Clear the color palettes cache (useful for testing or reloading)."""
+    """Clear the color palettes cache; the next lookup reloads them (for testing)."""
     global _palettes_cache
     _palettes_cache = None
+    _warned_missing.clear()
 
@@ -3,35 +3,67 @@ Configuration management for procedural generation service.
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration for procedural generation service"""
 
-    def __init__(self):
-        # Server configuration
-        self.host = os.getenv("PROCEDURAL_SERVICE_HOST", "0.0.0.0")
-        self.port = int(os.getenv("PROCEDURAL_SERVICE_PORT", "8081"))
-        self.environment = os.getenv("ENVIRONMENT", "development")
+    # Server configuration
+    host: str = "0.0.0.0"
+    port: int = 8081
+    environment: str = "development"
 
-        # Database configuration (for future use)
-        self.db_host = os.getenv("DB_HOST", "localhost")
-        self.db_port = int(os.getenv("DB_PORT", "5432"))
-        self.db_user = os.getenv("DB_USER", "postgres")
-        self.db_password = os.getenv("DB_PASSWORD", "")
-        self.db_name = os.getenv("DB_NAME", "earthring_dev")
-        self.db_sslmode = os.getenv("DB_SSLMODE", "disable")
+    # Database configuration (for future use)
+    db_host: str = "localhost"
+    db_port: int = 5432
+    db_user: str = "postgres"
+    db_password: str = field(default="", repr=False)
+    db_name: str = "earthring_dev"
+    db_sslmode: str = "disable"
 
-        # Generation configuration
-        self.world_seed = int(os.getenv("WORLD_SEED", "12345"))
-        self.cell_size = float(os.getenv("CELL_SIZE", "50.0"))  # 50m cells
+    # Generation configuration
+    world_seed: int = 12345
+    cell_size: float = 50.0  # 50m cells
 
-        # Performance configuration
-        self.max_parallel_generations = int(os.getenv("MAX_PARALLEL_GENERATIONS", "4"))
-        self.cache_enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    # Performance configuration
+    max_parallel_generations: int = 4
+    cache_enabled: bool = True
+    # uvicorn worker processes; each holds its own flare tables, palettes and response
+    # cache (~200 MB resident once warm, up to ~64 MB more with a full response cache)
+    workers: int = 1
 
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a Config from environment variables, falling back to the defaults"""
+        env = os.environ
+        return cls(
+            host=env.get("PROCEDURAL_SERVICE_HOST", "0.0.0.0"),
+            port=int(env.get("PROCEDURAL_SERVICE_PORT", "8081")),
+            environment=env.get("ENVIRONMENT", "development"),
+            db_host=env.get("DB_HOST", "localhost"),
+            db_port=int(env.get("DB_PORT", "5432")),
+            db_user=env.get("DB_USER", "postgres"),
+            db_password=env.get("DB_PASSWORD", ""),
+            db_name=env.get("DB_NAME", "earthring_dev"),
+            db_sslmode=env.get("DB_SSLMODE", "disable"),
+            world_seed=int(env.get("WORLD_SEED", "12345")),
+            cell_size=float(env.get("CELL_SIZE", "50.0")),
+            max_parallel_generations=int(env.get("MAX_PARALLEL_GENERATIONS", "4")),
+            cache_enabled=env.get("CACHE_ENABLED", "true").lower() == "true",
+            workers=int(env.get("PROCEDURAL_WORKERS", env.get("WEB_CONCURRENCY", "1"))),
+        )
 
+
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables"""
-    return Config()
+    """
+    Load configuration from environment variables.
+
+    Environment variables don't change during the process lifetime, so the Config is
+    built once and shared. Call load_config.cache_clear() to re-read the environment.
+    """
+    return Config.from_env()
@@ -3,17 +3,46 @@ Chunk generation functions.
 Phase 2: Basic ring floor geometry generation with station flares and building generation.
 """
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Optional
 
+import numpy as np
+
 from . import seeds
 from . import stations
+# Shared with the flare kernels so they agree on the nearest covering station
+from .stations import (
+    _STATION_FLARE_RANGES,
+    _STATION_POSITIONS,
+    _nearest_station_kernel,
+)
 from . import structure_generator
+from .jit import njit
 import math
 
+logger = logging.getLogger(__name__)
+
 # Constants
 CHUNK_LENGTH = 1000.0  # 1 km chunk length along ring
 BASE_CHUNK_WIDTH = 400.0  # Base width: 400m
 FLOOR_HEIGHT = 20.0  # 20 meters per floor level
+RING_FLOOR_SAMPLE_INTERVAL = 50.0  # 50m for smooth curves (20 samples per 1km chunk)
+# Sample count includes both chunk ends
+RING_FLOOR_NUM_SAMPLES = int(CHUNK_LENGTH / RING_FLOOR_SAMPLE_INTERVAL) + 1
+RING_FLOOR_ALGORITHM = "smooth_curved_taper"
+ZONE_SAMPLE_INTERVAL = 50.0  # Zone polygons sample the restricted zone width every 50m
+# Sample count includes both chunk ends
+ZONE_NUM_SAMPLES = int(CHUNK_LENGTH / ZONE_SAMPLE_INTERVAL) + 1
+
+# Sample offsets from chunk start (0, 50, ..., 1000), shared by all zone generators.
+# Built from an integer count so the last offset is exactly CHUNK_LENGTH.
+_ZONE_SAMPLE_OFFSETS = np.arange(ZONE_NUM_SAMPLES) * ZONE_SAMPLE_INTERVAL
+# The chunk center (500m) is itself a sample point
+_ZONE_CENTER_SAMPLE = int(CHUNK_LENGTH / 2.0 / ZONE_SAMPLE_INTERVAL)
 
 # Geometry version - increment this when generation algorithm changes significantly
 # Version history:
@@ -25,7 +54,20 @@ FLOOR_HEIGHT = 20.0  # 20 meters per floor level
 #   6: Phase 2 - Changed to 4m floor system (1-5 floors) with new window types (full-height, standard, ceiling)
 #   7: Phase 2 - Added building generation (grid-based city generation with buildings)
 #   8: Decommissioned legacy procedural structure generation (structures disabled)
-CURRENT_GEOMETRY_VERSION = 8
+#   9: Structure RNG seeds from derive_seed (SplitMix64, also used for chunk seeds) and
+#      full-gap industrial spacing (STRUCTURE_PLACEMENT_VERSION 4); new structures for
+#      every world seed
+CURRENT_GEOMETRY_VERSION = 9
+
+# Every ring floor mesh has the same sampling, so the version metadata is a constant
+# template; generate_chunk hands out a shallow copy per chunk
+_VERSION_METADATA_TEMPLATE = {
+    "geometry_version": CURRENT_GEOMETRY_VERSION,
+    "sample_interval": RING_FLOOR_SAMPLE_INTERVAL,  # Sample interval in meters
+    "algorithm": RING_FLOOR_ALGORITHM,
+    "vertex_count": RING_FLOOR_NUM_SAMPLES * 2,
+    "face_count": (RING_FLOOR_NUM_SAMPLES - 1) * 2,
+}
 
 
 def get_chunk_width(floor: int, chunk_index: int, chunk_seed: int) -> float:
@@ -43,13 +85,7 @@ def get_chunk_width(floor: int, chunk_index: int, chunk_seed: int) -> float:
     Returns:
         Chunk width in meters (400m base, up to 25km at station centers)
     """
-    # Calculate chunk center position along ring (in meters)
-    chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
-
-    # Calculate width based on station flares
-    width = stations.calculate_flare_width(chunk_center_position)
-
-    return width
+    return _chunk_center_width(chunk_index)
 
 
 def get_chunk_levels(floor: int, chunk_index: int, chunk_seed: int) -> int:
@@ -67,6 +103,9 @@ def get_chunk_levels(floor: int, chunk_index: int, chunk_seed: int) -> int:
     Returns:
         Number of levels (5 base, up to 15 at station centers)
     """
+    if 0 <= chunk_index < CHUNK_COUNT:
+        return int(_chunk_flare_tables()[1][chunk_index])
+
     # Calculate chunk center position along ring (in meters)
     chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
 
@@ -91,59 +130,104 @@ def generate_ring_floor_geometry(chunk_index: int, floor: int) -> dict:
     Returns:
         Dictionary with geometry data (vertices, faces, normals)
     """
-    # Sample interval: 50m for smooth curves (20 samples per 1km chunk)
-    SAMPLE_INTERVAL = 50.0
-    num_samples = int(CHUNK_LENGTH / SAMPLE_INTERVAL) + 1
+    geometry = _ring_floor_geometry_arrays(chunk_index)
+    geometry["vertices"] = geometry["vertices"].tolist()
+    geometry["faces"] = geometry["faces"].tolist()
+    geometry["normals"] = geometry["normals"].tolist()
+    return geometry
 
-    # Calculate chunk start position
-    chunk_start_position = chunk_index * CHUNK_LENGTH
 
-    vertices = []
-    faces = []
-    normals = []
+@njit
+def _ring_floor_vertices_kernel(x_positions, widths, z):
+    """
+    Ring floor vertices for samples at x_positions with the given full widths.
+
+    Vertices are interleaved so sample i has vertices 2*i (left, -width/2) and
+    2*i + 1 (right, +width/2), all at height z. One pass replaces the separate
+    halving and strided column writes.
+    """
+    n = len(x_positions)
+    vertices = np.empty((n * 2, 3))
+    for i in range(n):
+        half_width = widths[i] / 2.0
+        vertices[2 * i, 0] = x_positions[i]
+        vertices[2 * i, 1] = -half_width
+        vertices[2 * i, 2] = z
+        vertices[2 * i + 1, 0] = x_positions[i]
+        vertices[2 * i + 1, 1] = half_width
+        vertices[2 * i + 1, 2] = z
+    return vertices
+
+
+@lru_cache(maxsize=8)
+def _ring_floor_faces_normals(num_samples: int) -> tuple:
+    """
+    Read-only faces and normals for a ring floor strip with num_samples sample points.
 
-    # Generate vertices along both edges (left and right) at each sample point
-    for i in range(num_samples):
-        # Position along chunk (0 to CHUNK_LENGTH)
-        x_offset = min(i * SAMPLE_INTERVAL, CHUNK_LENGTH)
+    They depend only on the sample count, so they are built once and shared by all
+    chunks.
+    """
+    # Generate faces connecting adjacent sample points
+    # Each quad is made of two triangles:
+    #   left_current -> left_next -> right_current
+    #   right_current -> left_next -> right_next
+    # int32 indices and float32 normals hold these values exactly at half the size
+    left_current = np.arange(num_samples - 1, dtype=np.int32) * 2
+    faces = np.column_stack(
+        (
+            left_current,
+            left_current + 2,
+            left_current + 1,
+            left_current + 1,
+            left_current + 2,
+            left_current + 3,
+        )
+    ).reshape(-1, 3)
 
-        # Calculate absolute ring position at this sample point
-        ring_position = chunk_start_position + x_offset
+    # Normals for each face (all pointing up: [0, 0, 1])
+    normals = np.tile(np.array([0.0, 0.0, 1.0], dtype=np.float32), (len(faces), 1))
 
-        # Calculate width at this position (smooth curve)
-        width = stations.calculate_flare_width(ring_position)
-        half_width = width / 2.0
+    faces.flags.writeable = False
+    normals.flags.writeable = False
+    return faces, normals
 
-        # Create vertices for left and right edges at this X position
-        # Left edge (negative Y)
-        vertices.append([x_offset, -half_width, 0.0])
-        # Right edge (positive Y)
-        vertices.append([x_offset, half_width, 0.0])
 
-    # Generate faces connecting adjacent sample points
-    # Each quad is made of two triangles
-    for i in range(num_samples - 1):
-        # Indices for current sample point
-        left_current = i * 2
-        right_current = i * 2 + 1
-
-        # Indices for next sample point
-        left_next = (i + 1) * 2
-        right_next = (i + 1) * 2 + 1
-
-        # Create two triangles forming a quad
-        # Triangle 1: left_current -> left_next -> right_current
-        faces.append([left_current, left_next, right_current])
-        # Triangle 2: right_current -> left_next -> right_next
-        faces.append([right_current, left_next, right_next])
-
-    # Calculate normals for each face (all pointing up: [0, 0, 1])
-    for _ in faces:
-        normals.append([0.0, 0.0, 1.0])
+def _ring_floor_geometry_arrays(chunk_index: int, floor: Optional[int] = None) -> dict:
+    """
+    Ring floor geometry with vertices (float64), faces (int32) and normals (float32) as
+    numpy arrays.
+
+    Vertices stay float64: absolute ring X reaches 2.64e8 m, where float32 spacing is
+    16-32 m.
+
+    Without a floor, vertices are relative to the chunk start with Z = 0 (see
+    generate_ring_floor_geometry). With a floor, vertices are written directly at their
+    absolute ring X position with Z = floor, as generate_chunk returns them. Faces and
+    normals are shared read-only arrays (see _ring_floor_faces_normals).
+    """
+    num_samples = RING_FLOOR_NUM_SAMPLES
+
+    # Calculate chunk start position
+    chunk_start_position = chunk_index * CHUNK_LENGTH
+
+    # Position along chunk (0 to CHUNK_LENGTH) for each sample point
+    x_offsets = np.arange(num_samples) * RING_FLOOR_SAMPLE_INTERVAL
+    ring_positions = chunk_start_position + x_offsets
+
+    # Calculate width at each sample's absolute ring position (smooth curve)
+    widths = stations.calculate_flare_width_array(ring_positions)
+
+    # Create vertices for left (negative Y) and right (positive Y) edges at each sample
+    if floor is None:
+        vertices = _ring_floor_vertices_kernel(x_offsets, widths, 0.0)
+    else:
+        vertices = _ring_floor_vertices_kernel(ring_positions, widths, float(floor))
+
+    # Faces and normals depend only on the sample count
+    faces, normals = _ring_floor_faces_normals(num_samples)
 
     # Calculate average width for metadata (width at chunk center)
-    chunk_center_position = chunk_start_position + (CHUNK_LENGTH / 2.0)
-    avg_width = stations.calculate_flare_width(chunk_center_position)
+    avg_width = _chunk_center_width(chunk_index)
 
     return {
         "type": "ring_floor",
@@ -184,7 +268,7 @@ def calculate_restricted_zone_width(x_position: float) -> float:
     nearest_station, distance = station_result
     
     # Check if we're within the station flare area
-    flare_range = nearest_station.station_type.flare_length / 2.0
+    flare_range = nearest_station.station_type.flare_half_length
     if distance >= flare_range:
         # Outside flare area: use base width
         return base_half_width
@@ -219,6 +303,60 @@ def calculate_restricted_zone_width(x_position: float) -> float:
         return base_half_width
 
 
+@njit
+def _restricted_zone_width_kernel(
+    x_positions, station_positions, flare_ranges, circumference
+):
+    """
+    Restricted zone half-width per position (see calculate_restricted_zone_width).
+
+    Mirrors find_nearest_station: the nearest station covering the position wins.
+    """
+    half_widths = np.empty(x_positions.shape[0])
+    for i in range(x_positions.shape[0]):
+        wrapped = ((x_positions[i] % circumference) + circumference) % circumference
+        nearest, distance = _nearest_station_kernel(
+            wrapped, station_positions, flare_ranges, circumference
+        )
+
+        # Outside every flare, or exactly at the flare edge: base width
+        if nearest < 0 or distance >= flare_ranges[nearest]:
+            half_widths[i] = 10.0
+            continue
+
+        distance_percentage = distance / flare_ranges[nearest]
+        if distance_percentage <= 0.10:
+            half_widths[i] = 80.0
+        elif distance_percentage <= 0.20:
+            half_widths[i] = 60.0
+        elif distance_percentage <= 0.30:
+            half_widths[i] = 50.0
+        elif distance_percentage <= 0.40:
+            half_widths[i] = 40.0
+        else:
+            half_widths[i] = 10.0
+    return half_widths
+
+
+def calculate_restricted_zone_width_array(x_positions: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_restricted_zone_width for an array of X positions.
+
+    Args:
+        x_positions: X positions along the ring in meters
+
+    Returns:
+        Array of zone half-widths in meters, identical to the scalar function at each
+        position
+    """
+    return _restricted_zone_width_kernel(
+        np.asarray(x_positions, dtype=np.float64),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        float(stations.RING_CIRCUMFERENCE),
+    )
+
+
 def generate_chunk_restricted_zone(floor: int, chunk_index: int) -> dict:
     """
     Generate a default restricted zone for a chunk.
@@ -250,51 +388,228 @@ def generate_chunk_restricted_zone(floor: int, chunk_index: int) -> dict:
     # This is valid - coordinates can be stored up to the ring circumference
     # The client will wrap coordinates relative to camera during rendering
     
+    # Uniform chunk between stations: translated template, no sampling needed
+    if _is_free_space_chunk(chunk_index):
+        return _restricted_zone_feature(floor, chunk_index, None, None)
+    
     # Sample zone width at multiple points along the chunk to create a smooth polygon
     # Sample every 50m to capture width transitions accurately
-    sample_interval = 50.0
-    sample_points = []
-    x = chunk_start_position
-    while x <= chunk_end_position:
-        sample_points.append(x)
-        x += sample_interval
-    # Ensure we include the end point
-    if sample_points[-1] < chunk_end_position:
-        sample_points.append(chunk_end_position)
+    sample_points = chunk_start_position + _ZONE_SAMPLE_OFFSETS
+    half_widths = calculate_restricted_zone_width_array(sample_points)
     
+    return _restricted_zone_feature(floor, chunk_index, sample_points, half_widths)
+
+
+@dataclass(slots=True)
+class RestrictedZone:
+    """Compact restricted zone: a chunk's sample points and half-widths."""
+
+    floor: int
+    chunk_index: int
+    sample_points: np.ndarray
+    half_widths: np.ndarray
+
+    def to_geojson(self) -> dict:
+        """Build the zone dictionary returned by generate_chunk_restricted_zone."""
+        return _restricted_zone_feature(
+            self.floor, self.chunk_index, self.sample_points, self.half_widths
+        )
+
+
+def restricted_zone_records_batch(floor: int, chunk_indices) -> list:
+    """
+    Compute the restricted zones for many chunks at once as RestrictedZone records.
+
+    Sample points for every chunk are built as one (n_chunks, ZONE_NUM_SAMPLES) array
+    and the restricted zone widths are computed in a single kernel call. Records hold
+    row views of those arrays, so no per-zone dictionaries exist until to_geojson().
+
+    Args:
+        floor: Floor number
+        chunk_indices: Chunk indices (0-263,999)
+
+    Returns:
+        List of RestrictedZone records in chunk_indices order
+    """
+    chunk_indices = np.asarray(chunk_indices, dtype=np.int64).reshape(-1)
+    sample_points = (chunk_indices * CHUNK_LENGTH)[:, None] + _ZONE_SAMPLE_OFFSETS[
+        None, :
+    ]
+    half_widths = calculate_restricted_zone_width_array(sample_points.ravel()).reshape(
+        sample_points.shape
+    )
+
+    return [
+        RestrictedZone(floor, chunk_index, sample_points[i], half_widths[i])
+        for i, chunk_index in enumerate(chunk_indices.tolist())
+    ]
+
+
+def generate_restricted_zones_batch(floor: int, chunk_indices) -> list:
+    """
+    Generate the default restricted zones for many chunks at once.
+
+    Args:
+        floor: Floor number
+        chunk_indices: Chunk indices (0-263,999)
+
+    Returns:
+        List of zone dictionaries, identical to calling generate_chunk_restricted_zone
+        for each chunk
+    """
+    return [
+        zone.to_geojson()
+        for zone in restricted_zone_records_batch(floor, chunk_indices)
+    ]
+
+
+def generate_floor_restricted_zones(
+    floor: int,
+    chunk_indices=None,
+    n_workers: Optional[int] = None,
+    as_geojson: bool = True,
+) -> list:
+    """
+    Generate the default restricted zones for a whole floor, sharded across processes.
+
+    Chunks are independent, so the chunk indices are split into shards that worker
+    processes run through generate_restricted_zones_batch (or
+    restricted_zone_records_batch when as_geojson is False).
+
+    Args:
+        floor: Floor number
+        chunk_indices: Chunk indices to generate (default: every chunk on the ring)
+        n_workers: Worker process count (default: os.cpu_count(); 1 runs in-process)
+        as_geojson: Return zone dictionaries; False returns compact RestrictedZone
+            records
+
+    Returns:
+        List of zone dictionaries (or RestrictedZone records) in chunk_indices order
+    """
+    if chunk_indices is None:
+        chunk_indices = np.arange(CHUNK_COUNT)
+    chunk_indices = np.asarray(chunk_indices, dtype=np.int64).reshape(-1)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    generate_shard = (
+        generate_restricted_zones_batch if as_geojson else restricted_zone_records_batch
+    )
+    if n_workers == 1 or len(chunk_indices) == 0:
+        return generate_shard(floor, chunk_indices)
+
+    # Several shards per worker keeps the pool busy when shard costs differ
+    # (flare vs free space)
+    shards = np.array_split(chunk_indices, min(n_workers * 4, len(chunk_indices)))
+    zones = []
+    with ProcessPoolExecutor(n_workers) as executor:
+        for shard_zones in executor.map(partial(generate_shard, floor), shards):
+            zones.extend(shard_zones)
+    return zones
+
+
+def _restricted_zone_feature(
+    floor: int,
+    chunk_index: int,
+    sample_points: Optional[np.ndarray],
+    half_widths: Optional[np.ndarray],
+) -> dict:
+    """
+    Build the restricted zone feature from the chunk's sample points and half-widths.
+
+    Free-space chunks use the translated template ring, so their samples may be None.
+    """
     # Build polygon coordinates with variable width
-    # We'll create vertices along the top and bottom edges
-    bottom_edge = []  # Bottom edge (negative Y)
-    top_edge = []     # Top edge (positive Y)
-    
-    for x_pos in sample_points:
-        half_width = calculate_restricted_zone_width(x_pos)
-        bottom_edge.append([x_pos, -half_width])
-        top_edge.append([x_pos, half_width])
-    
-    # Reverse top edge so we can connect them in order
-    top_edge.reverse()
-    
-    # Combine edges to form closed polygon
-    # Start at first bottom point, go along bottom, then along top, then close
-    coordinates = [bottom_edge + top_edge + [bottom_edge[0]]]
-    
+    # Start at first bottom point (negative Y), go along bottom, back along top, close
+    if _is_free_space_chunk(chunk_index):
+        coordinates = _translated_polygon(
+            _FREE_SPACE_RESTRICTED_RING, chunk_index * CHUNK_LENGTH
+        )
+    else:
+        coordinates = _zone_polygon(sample_points, -half_widths, half_widths)
+    
+    location = _zone_location(floor, chunk_index)
+    return _zone_feature(
+        name="Maglev Transit Zone " + location,
+        zone_type="restricted",
+        floor=floor,
+        is_system_zone=True,
+        properties=_MAGLEV_TRANSIT_PROPERTIES,
+        metadata={
+            "default_zone": True,
+            "maglev_zone": True,
+            "chunk_index": chunk_index,
+        },
+        coordinates=coordinates,
+    )
+
+
+# Inner zone properties are identical for every zone of a kind, so each feature
+# references one shared dict instead of building its own. Treat them as read-only.
+_MAGLEV_TRANSIT_PROPERTIES = {
+    "purpose": "maglev_transit",
+    "description": "Reserved space for maglev train and loading/unloading equipment",
+}
+_INDUSTRIAL_WEST_PROPERTIES = {
+    "purpose": "hub_industrial",
+    "description": "Industrial zone lining maglev transit area at hub platform (west of commercial)",
+}
+_INDUSTRIAL_EAST_PROPERTIES = {
+    "purpose": "hub_industrial",
+    "description": "Industrial zone lining maglev transit area at hub platform (east of commercial)",
+}
+_COMMERCIAL_PROPERTIES = {
+    "purpose": "hub_commercial",
+    "description": "Commercial zone interspersed within industrial zone at hub platform",
+}
+_MIXED_USE_PROPERTIES = {
+    "purpose": "hub_mixed_use",
+    "description": "Mixed-use zone outside hub industrial/commercial bands",
+}
+_AGRICULTURAL_PROPERTIES = {
+    "purpose": "default_agricultural",
+    "description": "Default agricultural zone - can be dezoned or replaced by players",
+}
+
+
+def _zone_location(floor: int, chunk_index: int) -> str:
+    """Format the "(Floor N, Chunk M)" suffix shared by every zone name in a chunk."""
+    return f"(Floor {floor}, Chunk {chunk_index})"
+
+
+def _zone_feature(
+    name: str,
+    zone_type: str,
+    floor: int,
+    is_system_zone: bool,
+    properties: dict,
+    metadata: dict,
+    coordinates: list,
+) -> dict:
+    """
+    Build a zone as a GeoJSON Feature.
+
+    Args:
+        name: Human-readable zone name
+        zone_type: Zone type (restricted, industrial, commercial, mixed_use,
+            agricultural)
+        floor: Floor number
+        is_system_zone: True if players cannot dezone or replace the zone
+        properties: Shared inner properties (purpose, description); not copied
+        metadata: Zone metadata (default_zone, chunk_index, side, ...)
+        coordinates: Polygon coordinates ([ring])
+
+    Returns:
+        Zone dictionary in GeoJSON format
+    """
     return {
         "type": "Feature",
         "properties": {
-            "name": f"Maglev Transit Zone (Floor {floor}, Chunk {chunk_index})",
-            "zone_type": "restricted",
+            "name": name,
+            "zone_type": zone_type,
             "floor": floor,
-            "is_system_zone": True,
-            "properties": {
-                "purpose": "maglev_transit",
-                "description": "Reserved space for maglev train and loading/unloading equipment",
-            },
-            "metadata": {
-                "default_zone": True,
-                "maglev_zone": True,
-                "chunk_index": chunk_index,
-            },
+            "is_system_zone": is_system_zone,
+            "properties": properties,
+            "metadata": metadata,
         },
         "geometry": {
             "type": "Polygon",
@@ -303,6 +618,151 @@ def generate_chunk_restricted_zone(floor: int, chunk_index: int) -> dict:
     }
 
 
+def _sample_points(x_start: float, x_end: float) -> np.ndarray:
+    """
+    Sample positions every ZONE_SAMPLE_INTERVAL from x_start, ending exactly at x_end.
+
+    Args:
+        x_start: First sample position in meters
+        x_end: Last sample position in meters (at most CHUNK_LENGTH after x_start)
+
+    Returns:
+        Array of at least two positions (x_start, ..., x_end)
+    """
+    offsets = _ZONE_SAMPLE_OFFSETS[_ZONE_SAMPLE_OFFSETS < x_end - x_start]
+    return np.append(x_start + offsets, x_end)
+
+
+def _zone_polygon(
+    x_positions: np.ndarray, first_edge_y: np.ndarray, second_edge_y: np.ndarray
+) -> list:
+    """
+    Build GeoJSON polygon coordinates for a strip between two edges at the same X.
+
+    See _zone_ring; returns the ring as nested lists wrapped in a list ([ring]).
+    """
+    return [_zone_ring(x_positions, first_edge_y, second_edge_y).tolist()]
+
+
+def _zone_ring(
+    x_positions: np.ndarray, first_edge_y: np.ndarray, second_edge_y: np.ndarray
+) -> np.ndarray:
+    """
+    Build the polygon ring for a strip between two edges sampled at the same X.
+
+    The ring runs along the first edge, back along the second edge in reverse, and
+    closes on the first point: [first..., reversed second..., first[0]].
+
+    Args:
+        x_positions: X positions of the samples (west to east)
+        first_edge_y: Y coordinate of the first edge at each sample
+        second_edge_y: Y coordinate of the second edge at each sample
+
+    Returns:
+        (2n + 1, 2) array of ring coordinates
+    """
+    # Fill one (2n + 1, 2) ring array; the reversed edge uses negative-step views
+    n = len(x_positions)
+    ring = np.empty((2 * n + 1, 2))
+    ring[:n, 0] = x_positions
+    ring[:n, 1] = first_edge_y
+    ring[2 * n - 1 : n - 1 : -1, 0] = x_positions
+    ring[2 * n - 1 : n - 1 : -1, 1] = second_edge_y
+    ring[2 * n] = ring[0]
+    return ring
+
+
+# Multiplier that reflects (x, y) ring coordinates across Y = 0
+_MIRROR_Y = np.array([1.0, -1.0])
+
+
+def _mirrored_zone_polygons(
+    x_positions: np.ndarray, first_edge_y: np.ndarray, second_edge_y: np.ndarray
+) -> tuple:
+    """
+    Polygon coordinates for a north (negative Y) strip and its mirror across Y = 0.
+
+    The south ring visits the same points in the same order with Y negated, which equals
+    building it from the negated edges (IEEE negation is exact).
+
+    Returns:
+        (north_coordinates, south_coordinates), each [ring] as nested lists
+    """
+    north_ring = _zone_ring(x_positions, first_edge_y, second_edge_y)
+    return [north_ring.tolist()], [(north_ring * _MIRROR_Y).tolist()]
+
+
+def _translated_polygon(template_ring: np.ndarray, x_offset: float) -> list:
+    """GeoJSON polygon coordinates ([ring]) for a chunk-local ring shifted along X."""
+    ring = template_ring.copy()
+    ring[:, 0] += x_offset
+    return [ring.tolist()]
+
+
+def _compute_nearest_hub_distances(chunk_count: int) -> np.ndarray:
+    """
+    Distance from each chunk center to the nearest hub, with ring wrapping.
+
+    Uses the same operations as stations.distance_with_wrapping, so values match the
+    scalar path exactly.
+    """
+    circumference = stations.RING_CIRCUMFERENCE
+    centers = np.arange(chunk_count) * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
+    wrapped_centers = np.mod(
+        np.mod(centers, circumference) + circumference, circumference
+    )
+    nearest = np.full(chunk_count, np.inf)
+    for hub_x in stations.PILLAR_HUB_POSITIONS:
+        direct = np.abs(stations.wrap_position(hub_x) - wrapped_centers)
+        np.minimum(nearest, np.minimum(direct, circumference - direct), out=nearest)
+    return nearest
+
+
+# Hub positions are fixed, so each chunk's nearest-hub distance is computed once (~2 MB)
+CHUNK_COUNT = int(stations.RING_CIRCUMFERENCE / CHUNK_LENGTH)
+_NEAREST_HUB_DISTANCE = _compute_nearest_hub_distances(CHUNK_COUNT)
+
+
+def _chunk_center_width(chunk_index: int) -> float:
+    """Flare width at a chunk's center (table lookup for valid chunk indices)."""
+    if 0 <= chunk_index < CHUNK_COUNT:
+        return float(_chunk_flare_tables()[0][chunk_index])
+
+    # Calculate chunk center position along ring (in meters)
+    chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
+
+    # Calculate width based on station flares
+    return stations.calculate_flare_width(chunk_center_position)
+
+
+# Per-chunk flare width and levels at the chunk center, built on first use (~4 MB)
+_CHUNK_FLARE_WIDTHS: Optional[np.ndarray] = None
+_CHUNK_FLARE_LEVELS: Optional[np.ndarray] = None
+
+
+def _chunk_flare_tables() -> tuple:
+    """Return (widths, levels) tables indexed by chunk index, building them once."""
+    global _CHUNK_FLARE_WIDTHS, _CHUNK_FLARE_LEVELS
+    if _CHUNK_FLARE_WIDTHS is None:
+        centers = np.arange(CHUNK_COUNT) * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
+        _CHUNK_FLARE_WIDTHS, _CHUNK_FLARE_LEVELS = stations.calculate_flare_array(
+            centers
+        )
+    return _CHUNK_FLARE_WIDTHS, _CHUNK_FLARE_LEVELS
+
+
+def _nearest_hub_distance(chunk_index: int) -> float:
+    """Distance from a chunk's center to the nearest hub (cached for valid indices)."""
+    if 0 <= chunk_index < CHUNK_COUNT:
+        return float(_NEAREST_HUB_DISTANCE[chunk_index])
+    
+    chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
+    return min(
+        stations.distance_with_wrapping(chunk_center_position, hub_x)
+        for hub_x in stations.PILLAR_HUB_POSITIONS
+    )
+
+
 def is_within_hub_platform_area(chunk_index: int) -> bool:
     """
     Check if a chunk is within a hub platform area (within 1500m of any hub center).
@@ -313,15 +773,8 @@ def is_within_hub_platform_area(chunk_index: int) -> bool:
     Returns:
         True if chunk is within hub platform area, False otherwise
     """
-    # Calculate chunk center position
-    chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
-    
-    # Check distance to nearest hub station
-    hub_positions = stations.PILLAR_HUB_POSITIONS
-    min_distance = float('inf')
-    for hub_x in hub_positions:
-        distance = stations.distance_with_wrapping(chunk_center_position, hub_x)
-        min_distance = min(min_distance, distance)
+    # Distance from chunk center to nearest hub station
+    min_distance = _nearest_hub_distance(chunk_index)
     
     # Within 1500m of hub center
     return min_distance < 1500.0
@@ -339,24 +792,57 @@ def is_within_station_flare_area(chunk_index: int) -> bool:
     Returns:
         True if chunk is within station flare area, False otherwise
     """
-    # Calculate chunk center position
-    chunk_center_position = chunk_index * CHUNK_LENGTH + (CHUNK_LENGTH / 2.0)
-    
-    # Check distance to nearest hub station
-    hub_positions = stations.PILLAR_HUB_POSITIONS
-    min_distance = float('inf')
-    for hub_x in hub_positions:
-        distance = stations.distance_with_wrapping(chunk_center_position, hub_x)
-        min_distance = min(min_distance, distance)
+    # Distance from chunk center to nearest hub station
+    min_distance = _nearest_hub_distance(chunk_index)
     
     # Station flare extends flare_length/2 on each side
     # For PILLAR_ELEVATOR_HUB: flare_length = 50000.0, so flare_range = 25000.0
-    flare_range = stations.PILLAR_ELEVATOR_HUB.flare_length / 2.0
+    flare_range = stations.PILLAR_ELEVATOR_HUB.flare_half_length
     
     # Within flare range of hub center
     return min_distance < flare_range
 
 
+def _is_free_space_chunk(chunk_index: int) -> bool:
+    """
+    Check if every point of a chunk lies strictly outside all station flares.
+
+    No sample in such a chunk has a nearest station, so the restricted zone and the
+    chunk are at their base widths along the whole chunk.
+    """
+    return _nearest_hub_distance(chunk_index) - CHUNK_LENGTH / 2.0 > _MAX_FLARE_RANGE
+
+
+# Free-space chunks all share one edge profile: base restricted zone and chunk widths
+_MAX_FLARE_RANGE = float(_STATION_FLARE_RANGES.max())
+_FREE_SPACE_RESTRICTED_HALF_WIDTHS = np.full(ZONE_NUM_SAMPLES, 10.0)
+_FREE_SPACE_CHUNK_HALF_WIDTHS = np.full(ZONE_NUM_SAMPLES, stations.BASE_WIDTH / 2.0)
+_FREE_SPACE_RESTRICTED_HALF_WIDTHS.flags.writeable = False
+_FREE_SPACE_CHUNK_HALF_WIDTHS.flags.writeable = False
+
+# Their zone polygons are therefore translates of one chunk-local ring (X from 0 to
+# CHUNK_LENGTH); shifting by the chunk start gives exactly the coordinates the
+# sample-point path computes
+_FREE_SPACE_RESTRICTED_RING = _zone_ring(
+    _ZONE_SAMPLE_OFFSETS,
+    -_FREE_SPACE_RESTRICTED_HALF_WIDTHS,
+    _FREE_SPACE_RESTRICTED_HALF_WIDTHS,
+)
+_FREE_SPACE_AGRICULTURAL_NORTH_RING = _zone_ring(
+    _ZONE_SAMPLE_OFFSETS,
+    -_FREE_SPACE_RESTRICTED_HALF_WIDTHS,
+    -_FREE_SPACE_CHUNK_HALF_WIDTHS,
+)
+_FREE_SPACE_AGRICULTURAL_SOUTH_RING = _zone_ring(
+    _ZONE_SAMPLE_OFFSETS,
+    _FREE_SPACE_RESTRICTED_HALF_WIDTHS,
+    _FREE_SPACE_CHUNK_HALF_WIDTHS,
+)
+_FREE_SPACE_RESTRICTED_RING.flags.writeable = False
+_FREE_SPACE_AGRICULTURAL_NORTH_RING.flags.writeable = False
+_FREE_SPACE_AGRICULTURAL_SOUTH_RING.flags.writeable = False
+
+
 def generate_chunk_industrial_zones(floor: int, chunk_index: int) -> list:
     """
     Generate industrial zones on either side of the restricted zone within station flare areas.
@@ -396,202 +882,128 @@ def generate_chunk_industrial_zones(floor: int, chunk_index: int) -> list:
     commercial_zone_x_end = chunk_center_position + (commercial_length / 2.0)
     
     # Sample zone width at multiple points along the chunk
-    sample_interval = 50.0
-    
     # West section: from chunk start to commercial zone start
-    west_sample_points = []
+    west_sample_points = np.empty(0)
     if chunk_start_position < commercial_zone_x_start:
-        x = chunk_start_position
-        while x < commercial_zone_x_start:
-            west_sample_points.append(x)
-            x += sample_interval
-        # Add the commercial zone start boundary if we haven't reached it exactly
-        if west_sample_points and west_sample_points[-1] < commercial_zone_x_start:
-            west_sample_points.append(commercial_zone_x_start)
-        # Ensure we have at least start and end points
-        if len(west_sample_points) == 0:
-            west_sample_points = [chunk_start_position, commercial_zone_x_start]
-        elif len(west_sample_points) == 1:
-            west_sample_points.append(commercial_zone_x_start)
-    
+        west_sample_points = _sample_points(
+            chunk_start_position, commercial_zone_x_start
+        )
+
     # East section: from commercial zone end to chunk end
-    east_sample_points = []
+    east_sample_points = np.empty(0)
     if commercial_zone_x_end < chunk_end_position:
-        x = commercial_zone_x_end
-        while x <= chunk_end_position:
-            east_sample_points.append(x)
-            x += sample_interval
-        # Add the chunk end boundary if we haven't reached it exactly
-        if east_sample_points and east_sample_points[-1] < chunk_end_position:
-            east_sample_points.append(chunk_end_position)
-        # Ensure we have at least start and end points
-        if len(east_sample_points) == 0:
-            east_sample_points = [commercial_zone_x_end, chunk_end_position]
-        elif len(east_sample_points) == 1:
-            east_sample_points.append(chunk_end_position)
+        east_sample_points = _sample_points(commercial_zone_x_end, chunk_end_position)
     
+    # Both sections' widths in one kernel pass, split back at the west/east boundary
+    half_widths = calculate_restricted_zone_width_array(
+        np.concatenate((west_sample_points, east_sample_points))
+    )
+    west_half_widths = half_widths[: len(west_sample_points)]
+    east_half_widths = half_widths[len(west_sample_points) :]
+
+    location = _zone_location(floor, chunk_index)
     zones = []
     
     # Build north-west industrial zone (negative Y side, west of commercial)
     if len(west_sample_points) >= 2:
-        north_west_bottom_edge = []  # Outer edge (further from center)
-        north_west_top_edge = []      # Inner edge (touching restricted zone)
-        
-        for x_pos in west_sample_points:
-            half_width = calculate_restricted_zone_width(x_pos)
-            # North zone: from -half_width - 80 to -half_width
-            north_west_bottom_edge.append([x_pos, -half_width - 80.0])
-            north_west_top_edge.append([x_pos, -half_width])
-        
-        # Reverse top edge to connect in order
-        north_west_top_edge.reverse()
-        north_west_coordinates = [north_west_bottom_edge + north_west_top_edge + [north_west_bottom_edge[0]]]
-        
-        zones.append({
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Industrial Zone North-West (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "industrial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_industrial",
-                    "description": "Industrial zone lining maglev transit area at hub platform (west of commercial)",
-                },
-                "metadata": {
+        # North zone: from -half_width - 80 to -half_width
+        north_west_coordinates = _zone_polygon(
+            west_sample_points, -west_half_widths - 80.0, -west_half_widths
+        )
+
+        zones.append(
+            _zone_feature(
+                name="Hub Industrial Zone North-West " + location,
+                zone_type="industrial",
+                floor=floor,
+                is_system_zone=True,
+                properties=_INDUSTRIAL_WEST_PROPERTIES,
+                metadata={
                     "default_zone": True,
                     "hub_zone": True,
                     "chunk_index": chunk_index,
                     "side": "north",
                     "subsection": "west",
                 },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": north_west_coordinates,
-            },
-        })
-    
+                coordinates=north_west_coordinates,
+            )
+        )
+
     # Build north-east industrial zone (negative Y side, east of commercial)
     if len(east_sample_points) >= 2:
-        north_east_bottom_edge = []  # Outer edge (further from center)
-        north_east_top_edge = []      # Inner edge (touching restricted zone)
-        
-        for x_pos in east_sample_points:
-            half_width = calculate_restricted_zone_width(x_pos)
-            # North zone: from -half_width - 80 to -half_width
-            north_east_bottom_edge.append([x_pos, -half_width - 80.0])
-            north_east_top_edge.append([x_pos, -half_width])
-        
-        # Reverse top edge to connect in order
-        north_east_top_edge.reverse()
-        north_east_coordinates = [north_east_bottom_edge + north_east_top_edge + [north_east_bottom_edge[0]]]
-        
-        zones.append({
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Industrial Zone North-East (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "industrial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_industrial",
-                    "description": "Industrial zone lining maglev transit area at hub platform (east of commercial)",
-                },
-                "metadata": {
+        # North zone: from -half_width - 80 to -half_width
+        north_east_coordinates = _zone_polygon(
+            east_sample_points, -east_half_widths - 80.0, -east_half_widths
+        )
+
+        zones.append(
+            _zone_feature(
+                name="Hub Industrial Zone North-East " + location,
+                zone_type="industrial",
+                floor=floor,
+                is_system_zone=True,
+                properties=_INDUSTRIAL_EAST_PROPERTIES,
+                metadata={
                     "default_zone": True,
                     "hub_zone": True,
                     "chunk_index": chunk_index,
                     "side": "north",
                     "subsection": "east",
                 },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": north_east_coordinates,
-            },
-        })
-    
+                coordinates=north_east_coordinates,
+            )
+        )
+
     # Build south-west industrial zone (positive Y side, west of commercial)
     if len(west_sample_points) >= 2:
-        south_west_bottom_edge = []  # Inner edge (touching restricted zone)
-        south_west_top_edge = []     # Outer edge (further from center)
-        
-        for x_pos in west_sample_points:
-            half_width = calculate_restricted_zone_width(x_pos)
-            # South zone: from +half_width to +half_width + 80
-            south_west_bottom_edge.append([x_pos, half_width])
-            south_west_top_edge.append([x_pos, half_width + 80.0])
-        
-        # Reverse top edge to connect in order
-        south_west_top_edge.reverse()
-        south_west_coordinates = [south_west_bottom_edge + south_west_top_edge + [south_west_bottom_edge[0]]]
-        
-        zones.append({
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Industrial Zone South-West (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "industrial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_industrial",
-                    "description": "Industrial zone lining maglev transit area at hub platform (west of commercial)",
-                },
-                "metadata": {
+        # South zone: from +half_width to +half_width + 80
+        south_west_coordinates = _zone_polygon(
+            west_sample_points, west_half_widths, west_half_widths + 80.0
+        )
+
+        zones.append(
+            _zone_feature(
+                name="Hub Industrial Zone South-West " + location,
+                zone_type="industrial",
+                floor=floor,
+                is_system_zone=True,
+                properties=_INDUSTRIAL_WEST_PROPERTIES,
+                metadata={
                     "default_zone": True,
                     "hub_zone": True,
                     "chunk_index": chunk_index,
                     "side": "south",
                     "subsection": "west",
                 },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": south_west_coordinates,
-            },
-        })
-    
+                coordinates=south_west_coordinates,
+            )
+        )
+
     # Build south-east industrial zone (positive Y side, east of commercial)
     if len(east_sample_points) >= 2:
-        south_east_bottom_edge = []  # Inner edge (touching restricted zone)
-        south_east_top_edge = []     # Outer edge (further from center)
-        
-        for x_pos in east_sample_points:
-            half_width = calculate_restricted_zone_width(x_pos)
-            # South zone: from +half_width to +half_width + 80
-            south_east_bottom_edge.append([x_pos, half_width])
-            south_east_top_edge.append([x_pos, half_width + 80.0])
-        
-        # Reverse top edge to connect in order
-        south_east_top_edge.reverse()
-        south_east_coordinates = [south_east_bottom_edge + south_east_top_edge + [south_east_bottom_edge[0]]]
-        
-        zones.append({
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Industrial Zone South-East (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "industrial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_industrial",
-                    "description": "Industrial zone lining maglev transit area at hub platform (east of commercial)",
-                },
-                "metadata": {
+        # South zone: from +half_width to +half_width + 80
+        south_east_coordinates = _zone_polygon(
+            east_sample_points, east_half_widths, east_half_widths + 80.0
+        )
+
+        zones.append(
+            _zone_feature(
+                name="Hub Industrial Zone South-East " + location,
+                zone_type="industrial",
+                floor=floor,
+                is_system_zone=True,
+                properties=_INDUSTRIAL_EAST_PROPERTIES,
+                metadata={
                     "default_zone": True,
                     "hub_zone": True,
                     "chunk_index": chunk_index,
                     "side": "south",
                     "subsection": "east",
                 },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": south_east_coordinates,
-            },
-        })
-    
+                coordinates=south_east_coordinates,
+            )
+        )
+
     return zones
 
 
@@ -622,13 +1034,22 @@ def generate_chunk_commercial_zones(floor: int, chunk_index: int) -> list:
     chunk_start_position = chunk_index * CHUNK_LENGTH
     chunk_center_position = chunk_start_position + (CHUNK_LENGTH / 2.0)
     
+    # Calculate restricted zone width at chunk center to position commercial zones correctly
+    half_width = calculate_restricted_zone_width(chunk_center_position)
+
+    return _commercial_zone_features(
+        floor, chunk_index, chunk_center_position, half_width
+    )
+
+
+def _commercial_zone_features(
+    floor: int, chunk_index: int, chunk_center_position: float, half_width: float
+) -> list:
+    """Build the north/south commercial zone features around the chunk center."""
     # Commercial zone dimensions: 120m long (X), 80m wide (Y)
     commercial_length = 120.0  # 120m along X axis (east-west)
     commercial_width = 80.0    # 80m along Y axis (north-south)
     
-    # Calculate restricted zone width at chunk center to position commercial zones correctly
-    half_width = calculate_restricted_zone_width(chunk_center_position)
-    
     # North commercial zone: from -half_width - 80 to -half_width (80m wide)
     # Positioned at chunk center, 120m long (60m on each side of center)
     north_zone_x_start = chunk_center_position - (commercial_length / 2.0)
@@ -655,54 +1076,37 @@ def generate_chunk_commercial_zones(floor: int, chunk_index: int) -> list:
         [south_zone_x_start, half_width]                       # Close polygon
     ]]
     
+    location = _zone_location(floor, chunk_index)
     # Create zone dictionaries
     zones = [
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Commercial Zone North (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "commercial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_commercial",
-                    "description": "Commercial zone interspersed within industrial zone at hub platform",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "hub_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "north",
-                },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": north_coordinates,
-            },
-        },
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Commercial Zone South (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "commercial",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_commercial",
-                    "description": "Commercial zone interspersed within industrial zone at hub platform",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "hub_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "south",
-                },
+        _zone_feature(
+            name="Hub Commercial Zone North " + location,
+            zone_type="commercial",
+            floor=floor,
+            is_system_zone=True,
+            properties=_COMMERCIAL_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "hub_zone": True,
+                "chunk_index": chunk_index,
+                "side": "north",
             },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": south_coordinates,
+            coordinates=north_coordinates,
+        ),
+        _zone_feature(
+            name="Hub Commercial Zone South " + location,
+            zone_type="commercial",
+            floor=floor,
+            is_system_zone=True,
+            properties=_COMMERCIAL_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "hub_zone": True,
+                "chunk_index": chunk_index,
+                "side": "south",
             },
-        },
+            coordinates=south_coordinates,
+        ),
     ]
     
     return zones
@@ -730,105 +1134,70 @@ def generate_chunk_mixed_use_zones(floor: int, chunk_index: int) -> list:
     if not is_within_station_flare_area(chunk_index):
         return []
 
-    # Calculate chunk boundaries
+    # Calculate chunk start
     chunk_start_position = chunk_index * CHUNK_LENGTH
-    chunk_end_position = chunk_start_position + CHUNK_LENGTH
 
     # Sample zone width at multiple points along the chunk
-    sample_interval = 50.0
-    sample_points = []
-    x = chunk_start_position
-    while x <= chunk_end_position:
-        sample_points.append(x)
-        x += sample_interval
-    if sample_points and sample_points[-1] < chunk_end_position:
-        sample_points.append(chunk_end_position)
+    sample_points = chunk_start_position + _ZONE_SAMPLE_OFFSETS
+    half_widths = calculate_restricted_zone_width_array(sample_points)
 
+    return _mixed_use_zone_features(floor, chunk_index, sample_points, half_widths)
+
+
+def _mixed_use_zone_features(
+    floor: int, chunk_index: int, sample_points: np.ndarray, half_widths: np.ndarray
+) -> list:
+    """
+    Build the north/south mixed-use zone features from the chunk's sample points and
+    restricted zone half-widths.
+    """
     # Build north mixed-use zone (negative Y side)
     # Restricted: [-half_width, +half_width]
     # Industrial: [-half_width - 80, -half_width]
     # Commercial blobs: also within [-half_width - 80, -half_width]
     # Mixed-use: from -half_width - 160 to -half_width - 80 (80m wide band)
-    north_inner_edge = []  # Inner edge (adjacent to industrial/commercial)
-    north_outer_edge = []  # Outer edge (further from center)
-
-    for x_pos in sample_points:
-        half_width = calculate_restricted_zone_width(x_pos)
-        inner_y = -half_width - 80.0
-        outer_y = -half_width - 160.0
-        north_inner_edge.append([x_pos, inner_y])
-        north_outer_edge.append([x_pos, outer_y])
-
-    # Reverse outer edge so we can connect them in order
-    north_outer_edge.reverse()
-    north_coordinates = [north_inner_edge + north_outer_edge + [north_inner_edge[0]]]
-
-    # Build south mixed-use zone (positive Y side)
-    # Mixed-use: from +half_width + 80 to +half_width + 160
-    south_inner_edge = []  # Inner edge (adjacent to industrial/commercial)
-    south_outer_edge = []  # Outer edge (further from center)
-
-    for x_pos in sample_points:
-        half_width = calculate_restricted_zone_width(x_pos)
-        inner_y = half_width + 80.0
-        outer_y = half_width + 160.0
-        south_inner_edge.append([x_pos, inner_y])
-        south_outer_edge.append([x_pos, outer_y])
-
-    south_outer_edge.reverse()
-    south_coordinates = [south_inner_edge + south_outer_edge + [south_inner_edge[0]]]
-
+    # Inner edge (adjacent to industrial/commercial) first, then outer edge back
+    # South mixed-use zone (positive Y side) mirrors it:
+    # from +half_width + 80 to +half_width + 160
+    north_coordinates, south_coordinates = _mirrored_zone_polygons(
+        sample_points, -half_widths - 80.0, -half_widths - 160.0
+    )
+
+    location = _zone_location(floor, chunk_index)
     zones = [
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Mixed-Use Zone North (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "mixed_use",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_mixed_use",
-                    "description": "Mixed-use zone outside hub industrial/commercial bands",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "hub_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "north",
-                },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": north_coordinates,
-            },
-        },
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Hub Mixed-Use Zone South (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "mixed_use",
-                "floor": floor,
-                "is_system_zone": True,
-                "properties": {
-                    "purpose": "hub_mixed_use",
-                    "description": "Mixed-use zone outside hub industrial/commercial bands",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "hub_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "south",
-                },
+        _zone_feature(
+            name="Hub Mixed-Use Zone North " + location,
+            zone_type="mixed_use",
+            floor=floor,
+            is_system_zone=True,
+            properties=_MIXED_USE_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "hub_zone": True,
+                "chunk_index": chunk_index,
+                "side": "north",
             },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": south_coordinates,
+            coordinates=north_coordinates,
+        ),
+        _zone_feature(
+            name="Hub Mixed-Use Zone South " + location,
+            zone_type="mixed_use",
+            floor=floor,
+            is_system_zone=True,
+            properties=_MIXED_USE_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "hub_zone": True,
+                "chunk_index": chunk_index,
+                "side": "south",
             },
-        },
+            coordinates=south_coordinates,
+        ),
     ]
 
     return zones
 
+
 def generate_chunk_agricultural_zones(floor: int, chunk_index: int) -> list:
     """
     Generate agricultural zones in free space between stations.
@@ -852,115 +1221,143 @@ def generate_chunk_agricultural_zones(floor: int, chunk_index: int) -> list:
     if is_within_station_flare_area(chunk_index):
         return []
     
-    # Calculate chunk boundaries
+    # Uniform chunk between stations: translated templates, no sampling needed
+    if _is_free_space_chunk(chunk_index):
+        return _agricultural_zone_features(floor, chunk_index, None, None)
+    
+    # Calculate chunk start
     chunk_start_position = chunk_index * CHUNK_LENGTH
-    chunk_end_position = chunk_start_position + CHUNK_LENGTH
     
     # Sample zone width at multiple points along the chunk
-    sample_interval = 50.0
-    sample_points = []
-    x = chunk_start_position
-    while x <= chunk_end_position:
-        sample_points.append(x)
-        x += sample_interval
-    if sample_points[-1] < chunk_end_position:
-        sample_points.append(chunk_end_position)
-    
-    # Build north agricultural zone (negative Y side)
-    # North zone goes from -half_width (restricted zone edge) to -chunk_half_width (chunk edge)
-    north_inner_edge = []  # Inner edge (touching restricted zone)
-    north_outer_edge = []  # Outer edge (chunk edge)
-    
-    for x_pos in sample_points:
-        # Restricted zone half-width at this position
-        restricted_half_width = calculate_restricted_zone_width(x_pos)
-        
-        # Chunk half-width at this position (using stations.calculate_flare_width)
-        chunk_width = stations.calculate_flare_width(x_pos)
-        chunk_half_width = chunk_width / 2.0
-        
-        # North zone: from -restricted_half_width to -chunk_half_width
-        north_inner_edge.append([x_pos, -restricted_half_width])
-        north_outer_edge.append([x_pos, -chunk_half_width])
-    
-    # Reverse outer edge to connect in order
-    north_outer_edge.reverse()
-    north_coordinates = [north_inner_edge + north_outer_edge + [north_inner_edge[0]]]
-    
-    # Build south agricultural zone (positive Y side)
-    # South zone goes from +half_width (restricted zone edge) to +chunk_half_width (chunk edge)
-    south_inner_edge = []  # Inner edge (touching restricted zone)
-    south_outer_edge = []  # Outer edge (chunk edge)
-    
-    for x_pos in sample_points:
-        # Restricted zone half-width at this position
-        restricted_half_width = calculate_restricted_zone_width(x_pos)
-        
-        # Chunk half-width at this position
-        chunk_width = stations.calculate_flare_width(x_pos)
-        chunk_half_width = chunk_width / 2.0
-        
-        # South zone: from +restricted_half_width to +chunk_half_width
-        south_inner_edge.append([x_pos, restricted_half_width])
-        south_outer_edge.append([x_pos, chunk_half_width])
-    
-    # Reverse outer edge to connect in order
-    south_outer_edge.reverse()
-    south_coordinates = [south_inner_edge + south_outer_edge + [south_inner_edge[0]]]
+    sample_points = chunk_start_position + _ZONE_SAMPLE_OFFSETS
+    restricted_half_widths = calculate_restricted_zone_width_array(sample_points)
+
+    return _agricultural_zone_features(
+        floor, chunk_index, sample_points, restricted_half_widths
+    )
+
+
+def _agricultural_zone_features(
+    floor: int,
+    chunk_index: int,
+    sample_points: Optional[np.ndarray],
+    restricted_half_widths: Optional[np.ndarray],
+) -> list:
+    """
+    Build the north/south agricultural zone features from the chunk's sample points and
+    restricted zone half-widths.
+
+    Free-space chunks use the translated template rings, so their samples may be None.
+    """
+    if _is_free_space_chunk(chunk_index):
+        # Base widths along the whole chunk: translate the shared free-space rings
+        chunk_start_position = chunk_index * CHUNK_LENGTH
+        north_coordinates = _translated_polygon(
+            _FREE_SPACE_AGRICULTURAL_NORTH_RING, chunk_start_position
+        )
+        south_coordinates = _translated_polygon(
+            _FREE_SPACE_AGRICULTURAL_SOUTH_RING, chunk_start_position
+        )
+    else:
+        # Chunk half-width at each sample (using stations.calculate_flare_width_array)
+        chunk_half_widths = stations.calculate_flare_width_array(sample_points) / 2.0
+
+        # Build north agricultural zone (negative Y side)
+        # North zone goes from -half_width (restricted zone edge) to -chunk_half_width
+        # (chunk edge)
+        # South zone (positive Y side) mirrors it: +half_width to +chunk_half_width
+        north_coordinates, south_coordinates = _mirrored_zone_polygons(
+            sample_points, -restricted_half_widths, -chunk_half_widths
+        )
     
+    location = _zone_location(floor, chunk_index)
     # Create zone dictionaries
     # NOTE: is_system_zone = False so players can dezone or replace these zones
     zones = [
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Agricultural Zone North (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "agricultural",
-                "floor": floor,
-                "is_system_zone": False,  # NOT a system zone - can be dezoned/replaced
-                "properties": {
-                    "purpose": "default_agricultural",
-                    "description": "Default agricultural zone - can be dezoned or replaced by players",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "north",
-                },
-            },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": north_coordinates,
-            },
-        },
-        {
-            "type": "Feature",
-            "properties": {
-                "name": f"Agricultural Zone South (Floor {floor}, Chunk {chunk_index})",
-                "zone_type": "agricultural",
-                "floor": floor,
-                "is_system_zone": False,  # NOT a system zone - can be dezoned/replaced
-                "properties": {
-                    "purpose": "default_agricultural",
-                    "description": "Default agricultural zone - can be dezoned or replaced by players",
-                },
-                "metadata": {
-                    "default_zone": True,
-                    "chunk_index": chunk_index,
-                    "side": "south",
-                },
+        _zone_feature(
+            name="Agricultural Zone North " + location,
+            zone_type="agricultural",
+            floor=floor,
+            is_system_zone=False,  # NOT a system zone - can be dezoned/replaced
+            properties=_AGRICULTURAL_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "chunk_index": chunk_index,
+                "side": "north",
             },
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": south_coordinates,
+            coordinates=north_coordinates,
+        ),
+        _zone_feature(
+            name="Agricultural Zone South " + location,
+            zone_type="agricultural",
+            floor=floor,
+            is_system_zone=False,  # NOT a system zone - can be dezoned/replaced
+            properties=_AGRICULTURAL_PROPERTIES,
+            metadata={
+                "default_zone": True,
+                "chunk_index": chunk_index,
+                "side": "south",
             },
-        },
+            coordinates=south_coordinates,
+        ),
     ]
     
     return zones
 
 
-def generate_chunk(floor: int, chunk_index: int, chunk_seed: int, regeneration_counter: int = 0):
+def generate_all_chunk_zones(floor: int, chunk_index: int) -> list:
+    """
+    Generate every default zone for a chunk in a single pass.
+
+    Equivalent to the restricted, industrial, commercial, mixed-use and agricultural
+    generators called in that order, but samples the restricted zone width along the
+    chunk once and checks the station flare area once.
+
+    Args:
+        floor: Floor number
+        chunk_index: Chunk index (0-263,999)
+
+    Returns:
+        List of zone dictionaries in GeoJSON format, restricted zone first
+    """
+    if _is_free_space_chunk(chunk_index):
+        # Uniform chunk between stations (most of the ring): base widths everywhere, so
+        # every zone is a translated free-space template and no width sampling is needed
+        zones = [_restricted_zone_feature(floor, chunk_index, None, None)]
+        zones += _agricultural_zone_features(floor, chunk_index, None, None)
+        return zones
+
+    chunk_start_position = chunk_index * CHUNK_LENGTH
+    sample_points = chunk_start_position + _ZONE_SAMPLE_OFFSETS
+    half_widths = calculate_restricted_zone_width_array(sample_points)
+
+    zones = [_restricted_zone_feature(floor, chunk_index, sample_points, half_widths)]
+    if is_within_station_flare_area(chunk_index):
+        chunk_center_position = chunk_start_position + (CHUNK_LENGTH / 2.0)
+        zones += generate_chunk_industrial_zones(floor, chunk_index)
+        zones += _commercial_zone_features(
+            floor,
+            chunk_index,
+            chunk_center_position,
+            float(half_widths[_ZONE_CENTER_SAMPLE]),
+        )
+        zones += _mixed_use_zone_features(
+            floor, chunk_index, sample_points, half_widths
+        )
+    else:
+        zones += _agricultural_zone_features(
+            floor, chunk_index, sample_points, half_widths
+        )
+    return zones
+
+
+def generate_chunk(
+    floor: int,
+    chunk_index: int,
+    chunk_seed: int,
+    regeneration_counter: int = 0,
+    as_arrays: bool = False,
+):
     """
     Generate a chunk with smooth curved ring floor geometry.
 
@@ -972,12 +1369,19 @@ def generate_chunk(floor: int, chunk_index: int, chunk_seed: int, regeneration_c
         chunk_index: Chunk index (0-263,999)
         chunk_seed: Chunk seed for deterministic generation
         regeneration_counter: Regeneration counter for complete regeneration (affects building placement)
+        as_arrays: Keep geometry vertices (float64), faces (int32) and normals (float32)
+            as numpy arrays instead of nested lists; encode the result with
+            serialization.dumps
 
     Returns:
         Dictionary with chunk data including geometry and zones
     """
-    # Generate smooth curved ring floor geometry
-    geometry = generate_ring_floor_geometry(chunk_index, floor)
+    # Generate smooth curved ring floor geometry (as arrays, converted to lists below
+    # unless as_arrays)
+    # Vertices are built at absolute positions:
+    # X: ring position (chunk start + offset), Y: width position (centered at 0),
+    # Z: floor level
+    geometry = _ring_floor_geometry_arrays(chunk_index, floor)
 
     # Calculate chunk position along ring (in meters)
     # Chunk index 0 starts at position 0, each chunk is 1000m long
@@ -987,47 +1391,31 @@ def generate_chunk(floor: int, chunk_index: int, chunk_seed: int, regeneration_c
     # Get hub name for color palette lookup
     hub_name = stations.get_hub_name_for_position(chunk_center_position)
 
-    # Adjust geometry vertices to absolute positions
-    # Add chunk start position to X coordinates and set floor level
-    adjusted_vertices = []
-    for vertex in geometry["vertices"]:
-        adjusted_vertex = [
-            vertex[0] + chunk_start_position,  # X: ring position
-            vertex[1],  # Y: width position (centered at 0)
-            floor,  # Z: floor level
-        ]
-        adjusted_vertices.append(adjusted_vertex)
-
-    geometry["vertices"] = adjusted_vertices
-
-    # Get chunk width for metadata (width at chunk center)
-    chunk_width = get_chunk_width(floor, chunk_index, chunk_seed)
-    
-    # Generate default restricted zone for this chunk
-    restricted_zone = generate_chunk_restricted_zone(floor, chunk_index)
-    
-    # Generate industrial zones for hub platform areas (within station flare areas)
-    industrial_zones = generate_chunk_industrial_zones(floor, chunk_index)
-    
-    # Generate commercial zones interspersed within industrial zones at chunk centers
-    commercial_zones = generate_chunk_commercial_zones(floor, chunk_index)
-    
-    # Generate mixed-use zones outside the industrial/commercial bands in hub areas
-    mixed_use_zones = generate_chunk_mixed_use_zones(floor, chunk_index)
-    
-    # Generate agricultural zones in free space between stations (outside station flare areas)
-    agricultural_zones = generate_chunk_agricultural_zones(floor, chunk_index)
+    if not as_arrays:
+        geometry["vertices"] = geometry["vertices"].tolist()
+        geometry["faces"] = geometry["faces"].tolist()
+        geometry["normals"] = geometry["normals"].tolist()
+
+    # Chunk width for metadata (width at chunk center, same value as get_chunk_width);
+    # the geometry has already computed it
+    chunk_width = geometry["width"]
     
-    # Combine all zones
-    all_zones = [restricted_zone] + industrial_zones + commercial_zones + mixed_use_zones + agricultural_zones
+    # Generate all default zones for this chunk: the restricted zone for maglev transit,
+    # then industrial, commercial and mixed-use zones within station flare areas, or
+    # agricultural zones in free space between stations
+    all_zones = generate_all_chunk_zones(floor, chunk_index)
 
+    structures_generated = True
     try:
         all_structures = structure_generator.generate_structures_for_zones(
             all_zones, floor, chunk_index, chunk_seed, hub_name, regeneration_counter
         )
     except Exception as e:
-        print(f"Warning: structure generation failed: {e}")
+        logger.warning(
+            "Structure generation failed for chunk %d_%d: %s", floor, chunk_index, e
+        )
         all_structures = []
+        structures_generated = False
 
     return {
         "chunk_id": f"{floor}_{chunk_index}",
@@ -1043,14 +1431,67 @@ def generate_chunk(floor: int, chunk_index: int, chunk_seed: int, regeneration_c
             "chunk_width": chunk_width,
             "chunk_length": CHUNK_LENGTH,
             "chunk_levels": get_chunk_levels(floor, chunk_index, chunk_seed),
-            # Version metadata for granular version checking
-            "version_metadata": {
-                "geometry_version": CURRENT_GEOMETRY_VERSION,
-                "sample_interval": 50.0,  # Sample interval in meters
-                "algorithm": "smooth_curved_taper",
-                "vertex_count": len(geometry["vertices"]),
-                "face_count": len(geometry["faces"]),
-            },
+            # False when structure generation failed and "structures" was left empty
+            "structures_generated": structures_generated,
+            # Version metadata for granular version checking (the same for every chunk)
+            "version_metadata": dict(_VERSION_METADATA_TEMPLATE),
         },
     }
 
+
+def generate_chunks(
+    floor: int,
+    chunk_indices,
+    chunk_seeds,
+    regeneration_counter: int = 0,
+    n_workers: Optional[int] = None,
+    as_arrays: bool = False,
+) -> list:
+    """
+    Generate many chunks, sharded across worker processes.
+
+    Chunks share no mutable state, so each worker runs generate_chunk independently. The
+    per-chunk flare tables are built before the pool starts so forked workers inherit
+    them. Meant for offline bulk generation from the main thread (the API uses
+    n_workers=1).
+
+    Args:
+        floor: Floor number
+        chunk_indices: Chunk indices (0-263,999)
+        chunk_seeds: Chunk seed for each chunk index
+        regeneration_counter: Regeneration counter passed to every chunk
+        n_workers: Worker process count (default: os.cpu_count(); 1 runs in-process)
+        as_arrays: Keep geometry as numpy arrays (see generate_chunk)
+
+    Returns:
+        List of chunk dictionaries in chunk_indices order
+    """
+    chunk_indices = [int(chunk_index) for chunk_index in chunk_indices]
+    chunk_seeds = [int(chunk_seed) for chunk_seed in chunk_seeds]
+    if len(chunk_indices) != len(chunk_seeds):
+        raise ValueError("chunk_indices and chunk_seeds must have the same length")
+
+    n_workers = n_workers or os.cpu_count() or 1
+    generate = partial(_generate_chunk_for_pool, floor, regeneration_counter, as_arrays)
+    if n_workers == 1 or len(chunk_indices) <= 1:
+        return list(map(generate, chunk_indices, chunk_seeds))
+
+    _chunk_flare_tables()
+    chunksize = max(1, min(64, len(chunk_indices) // (n_workers * 4)))
+    with ProcessPoolExecutor(n_workers) as executor:
+        return list(
+            executor.map(generate, chunk_indices, chunk_seeds, chunksize=chunksize)
+        )
+
+
+def _generate_chunk_for_pool(
+    floor: int,
+    regeneration_counter: int,
+    as_arrays: bool,
+    chunk_index: int,
+    chunk_seed: int,
+) -> dict:
+    """generate_chunk with arguments ordered for partial() in generate_chunks."""
+    return generate_chunk(
+        floor, chunk_index, chunk_seed, regeneration_counter, as_arrays
+    )
@@ -3,25 +3,20 @@ Grid-based city layout generation.
 Creates 50m × 50m grid cells within zones and assigns building/park/road types.
 """
 
-import random
 import math
 from typing import Dict, List, Any, Tuple, Optional
+import numpy as np
+import shapely
 import shapely.geometry as sg
 import shapely.ops as so
 
 # Import building generation
-from . import buildings
+from . import buildings, seeds
 
 # Constants
 GRID_CELL_SIZE = 50.0  # 50m × 50m cells
 
 
-def seeded_random(seed: int) -> random.Random:
-    """Create deterministic random number generator."""
-    rng = random.Random(seed)
-    return rng
-
-
 def generate_city_grid(
     zone_polygon: List[List[float]],  # GeoJSON coordinates
     zone_type: str,
@@ -42,8 +37,6 @@ def generate_city_grid(
     Returns:
         List of grid cell dictionaries with position and cell type
     """
-    rng = seeded_random(chunk_seed)
-    
     # Extract coordinates from GeoJSON format
     # GeoJSON polygons are: [[[x1,y1], [x2,y2], ...], ...] (outer ring + holes)
     if not zone_polygon or not zone_polygon[0]:
@@ -53,11 +46,18 @@ def generate_city_grid(
     if len(outer_ring) < 3:  # Need at least 3 points for a polygon
         return []
     
-    # Create Shapely polygon for geometry operations
-    polygon = sg.Polygon(outer_ring)
-    
-    # Get bounding box
-    bounds = polygon.bounds  # (minx, miny, maxx, maxy)
+    # Axis-aligned rectangles (e.g. commercial and free-space restricted zones) are handled
+    # analytically; other zones use a Shapely polygon for geometry operations
+    rectangle_bounds = _axis_aligned_rectangle_bounds(outer_ring)
+    if rectangle_bounds is None:
+        polygon = sg.Polygon(outer_ring)
+        shapely.prepare(polygon)
+        
+        # Get bounding box
+        bounds = polygon.bounds  # (minx, miny, maxx, maxy)
+    else:
+        polygon = None
+        bounds = rectangle_bounds
     
     # Calculate grid cell positions
     cells = []
@@ -68,109 +68,214 @@ def generate_city_grid(
     max_x = math.ceil(bounds[2] / GRID_CELL_SIZE) * GRID_CELL_SIZE
     max_y = math.ceil(bounds[3] / GRID_CELL_SIZE) * GRID_CELL_SIZE
     
-    # Generate cells
-    x = min_x
-    while x < max_x:
-        y = min_y
-        while y < max_y:
-            # Create cell polygon
-            cell_polygon = sg.box(
-                x, y, x + GRID_CELL_SIZE, y + GRID_CELL_SIZE
-            )
-            
-            # Check if cell intersects with zone polygon
-            if polygon.intersects(cell_polygon):
-                # Calculate cell center
-                cell_center = cell_polygon.centroid
-                
-                # Determine cell type based on zone type and position
-                cell_type = _determine_cell_type(
-                    cell_center, polygon, zone_type, zone_importance, rng, chunk_seed
-                )
-                
-                cell = {
-                    "type": cell_type,
-                    "position": [cell_center.x, cell_center.y],
-                    "bounds": {
-                        "min_x": x,
-                        "min_y": y,
-                        "max_x": x + GRID_CELL_SIZE,
-                        "max_y": y + GRID_CELL_SIZE,
-                    },
-                    "seed": hash((chunk_seed, int(x / GRID_CELL_SIZE), int(y / GRID_CELL_SIZE))) % (2**31),
-                }
-                cells.append(cell)
-            
-            y += GRID_CELL_SIZE
-        x += GRID_CELL_SIZE
+    # Cell corners covering the bounding box, X-major (same order as stepping X, then Y).
+    # The bounds are whole multiples of the cell size, so these offsets are exact.
+    xs = min_x + np.arange(int((max_x - min_x) / GRID_CELL_SIZE)) * GRID_CELL_SIZE
+    ys = min_y + np.arange(int((max_y - min_y) / GRID_CELL_SIZE)) * GRID_CELL_SIZE
+    cell_xs, cell_ys = np.meshgrid(xs, ys, indexing="ij")
+    cell_xs = cell_xs.ravel()
+    cell_ys = cell_ys.ravel()
+    
+    if polygon is None:
+        # Every cell covering the rectangle's grid-aligned bounds intersects it
+        hit_xs = cell_xs
+        hit_ys = cell_ys
+    else:
+        # Create all cell polygons and keep those intersecting the zone polygon (one vectorized query)
+        cell_polygons = shapely.box(cell_xs, cell_ys, cell_xs + GRID_CELL_SIZE, cell_ys + GRID_CELL_SIZE)
+        hits = shapely.intersects(polygon, cell_polygons)
+        hit_xs = cell_xs[hits]
+        hit_ys = cell_ys[hits]
+    
+    # Cell centers are exactly half a cell from the (grid-aligned) corners
+    center_coords = np.column_stack((hit_xs + GRID_CELL_SIZE / 2.0, hit_ys + GRID_CELL_SIZE / 2.0))
+    if polygon is None:
+        is_edge = _rectangle_edge_cell_mask(center_coords, bounds, outer_ring)
+    else:
+        is_edge = _edge_cell_mask(center_coords, polygon)
+    
+    # Determine cell types based on zone type and position (all cells at once)
+    cell_types = _determine_cell_types(center_coords, is_edge, zone_type, chunk_seed)
+    
+    # Per-cell seeds from the cell's grid indices (vectorized SplitMix64, see buildings.get_building_seeds)
+    cell_seeds = buildings.get_building_seeds(
+        chunk_seed, (hit_xs / GRID_CELL_SIZE).astype(np.int64), (hit_ys / GRID_CELL_SIZE).astype(np.int64)
+    )
+    
+    for x, y, cell_type, (center_x, center_y), cell_seed in zip(
+        hit_xs.tolist(), hit_ys.tolist(), cell_types, center_coords.tolist(), cell_seeds.tolist()
+    ):
+        cell = {
+            "type": cell_type,
+            "position": [center_x, center_y],
+            "bounds": {
+                "min_x": x,
+                "min_y": y,
+                "max_x": x + GRID_CELL_SIZE,
+                "max_y": y + GRID_CELL_SIZE,
+            },
+            "seed": cell_seed,
+        }
+        cells.append(cell)
     
     return cells
 
 
-def _determine_cell_type(
-    cell_center: Any,  # Shapely Point
-    zone_polygon: sg.Polygon,
-    zone_type: str,
-    zone_importance: float,
-    rng: random.Random,
-    chunk_seed: int,
-) -> str:
+def _axis_aligned_rectangle_bounds(outer_ring: List[List[float]]) -> Optional[Tuple[float, float, float, float]]:
     """
-    Determine the type of cell (building, park, road, plaza).
+    Bounds of a ring that outlines an axis-aligned rectangle, or None for any other ring.
+    
+    The ring may have extra vertices along the rectangle's sides (sampled zone edges of
+    constant width): every edge must be axis-aligned and every vertex must lie on the
+    bounding box.
     
     Returns:
-        Cell type string: "building", "park", "road", "plaza"
+        (min_x, min_y, max_x, max_y) for rectangles, otherwise None
     """
-    # Get distribution based on zone type
-    distribution = _get_zone_distribution(zone_type)
+    ring = np.asarray(outer_ring, dtype=float)
+    if ring.ndim != 2 or ring.shape[1] != 2:
+        return None
+    
+    min_x, min_y = ring.min(axis=0).tolist()
+    max_x, max_y = ring.max(axis=0).tolist()
+    if not (min_x < max_x and min_y < max_y):
+        return None
+    
+    # Edges (including the closing edge) run along X or along Y
+    steps = np.diff(ring, axis=0, append=ring[:1])
+    if not ((steps[:, 0] == 0.0) | (steps[:, 1] == 0.0)).all():
+        return None
     
-    # Check if zone is too small for edge detection (less than 3 grid cells wide)
-    bounds = zone_polygon.bounds
+    xs = ring[:, 0]
+    ys = ring[:, 1]
+    on_bounds = (xs == min_x) | (xs == max_x) | (ys == min_y) | (ys == max_y)
+    if not on_bounds.all():
+        return None
+    
+    return min_x, min_y, max_x, max_y
+
+
+def _is_narrow_zone(bounds: Tuple[float, float, float, float]) -> bool:
+    """Check if zone is too small for edge detection (less than 3 grid cells wide)."""
     zone_width = bounds[2] - bounds[0]  # max_x - min_x
     zone_depth = bounds[3] - bounds[1]  # max_y - min_y
     min_dimension = min(zone_width, zone_depth)
     
     # For very small zones (< 3 cells = 150m), treat all cells as interior
     # This handles narrow zones like the 20m-wide industrial zones
-    if min_dimension < GRID_CELL_SIZE * 3:
-        # Small zone - all cells can be buildings
-        is_edge = False
-    else:
-        # Normal zone - check distance to edge
-        distance_to_edge = zone_polygon.exterior.distance(cell_center)
-        is_edge = distance_to_edge < GRID_CELL_SIZE * 1.5  # Within 1.5 cells of edge
-    
-    if is_edge:
-        # Edge cells: roads or plazas
-        road_prob = distribution.get("road", 0.05)
-        plaza_prob = distribution.get("plaza", 0.05)
-        total_edge_prob = road_prob + plaza_prob
-        if total_edge_prob > 0:
-            if rng.random() < road_prob / total_edge_prob:
-                return "road"
-            else:
-                return "plaza"
-        else:
-            # If no edge distribution, use building distribution
-            is_edge = False
-    
-    if not is_edge:
-        # Interior cells: buildings or parks based on distribution
-        # Use noise for variation
-        noise_seed = hash((chunk_seed, int(cell_center.x), int(cell_center.y))) % (2**31)
-        noise_rng = seeded_random(noise_seed)
-        noise_value = noise_rng.random()
-        
-        # Select cell type based on distribution
-        building_prob = distribution.get("building", 0.7)
-        park_prob = distribution.get("park", 0.2)
-        
-        if noise_value < building_prob:
-            return "building"
-        elif noise_value < building_prob + park_prob:
-            return "park"
-        else:
-            return "plaza"  # Fallback
+    return min_dimension < GRID_CELL_SIZE * 3
+
+
+def _edge_cell_mask(center_coords: np.ndarray, zone_polygon: sg.Polygon) -> np.ndarray:
+    """
+    Mark cells whose centers are near the zone edge.
+    
+    Args:
+        center_coords: (n, 2) array of cell center coordinates
+        zone_polygon: Zone polygon
+    
+    Returns:
+        Boolean array, True for edge cells (within 1.5 cells of the zone boundary)
+    """
+    if _is_narrow_zone(zone_polygon.bounds):
+        return np.zeros(len(center_coords), dtype=bool)
+    
+    # Normal zone - check distance to edge (one vectorized query for all cell centers)
+    distances_to_edge = shapely.distance(zone_polygon.exterior, shapely.points(center_coords))
+    return distances_to_edge < GRID_CELL_SIZE * 1.5  # Within 1.5 cells of edge
+
+
+def _rectangle_edge_cell_mask(
+    center_coords: np.ndarray, bounds: Tuple[float, float, float, float], outer_ring: List[List[float]]
+) -> np.ndarray:
+    """
+    Edge cell mask for an axis-aligned rectangle zone, computed without Shapely.
+    
+    Distances to the rectangle boundary are computed directly. Cells whose distance is
+    within rounding of the edge threshold are re-measured against the zone polygon, so
+    the result matches _edge_cell_mask exactly.
+    """
+    if _is_narrow_zone(bounds):
+        return np.zeros(len(center_coords), dtype=bool)
+    
+    min_x, min_y, max_x, max_y = bounds
+    center_xs = center_coords[:, 0]
+    center_ys = center_coords[:, 1]
+    # Signed distances to the nearer X and Y sides (negative outside the rectangle)
+    x_distances = np.minimum(center_xs - min_x, max_x - center_xs)
+    y_distances = np.minimum(center_ys - min_y, max_y - center_ys)
+    inside = (x_distances >= 0.0) & (y_distances >= 0.0)
+    distances_to_edge = np.where(
+        inside,
+        np.minimum(x_distances, y_distances),
+        np.hypot(np.maximum(-x_distances, 0.0), np.maximum(-y_distances, 0.0)),
+    )
+    
+    edge_distance = GRID_CELL_SIZE * 1.5  # Within 1.5 cells of edge
+    is_edge = distances_to_edge < edge_distance
+    
+    # Near-ties (e.g. centers exactly 1.5 cells from a side) follow GEOS rounding
+    ties = np.abs(distances_to_edge - edge_distance) <= edge_distance * 1e-9
+    if ties.any():
+        exterior = sg.Polygon(outer_ring).exterior
+        is_edge[ties] = shapely.distance(exterior, shapely.points(center_coords[ties])) < edge_distance
+    return is_edge
+
+
+# Cell type names indexed by the codes used in _determine_cell_types
+_CELL_TYPES = ("building", "park", "plaza", "road")
+
+
+def _determine_cell_types(
+    center_coords: np.ndarray,
+    is_edge: np.ndarray,
+    zone_type: str,
+    chunk_seed: int,
+) -> List[str]:
+    """
+    Determine the type of each cell (building, park, road, plaza).
+    
+    Edge cells become roads or plazas using one batch of draws from a PCG64 generator
+    seeded with the chunk seed. Interior cells become buildings or parks based on a noise
+    value keyed by the cell position, so a cell's type does not depend on the zone extent.
+    
+    Args:
+        center_coords: (n, 2) array of cell center coordinates
+        is_edge: Boolean array marking edge cells
+        zone_type: Type of zone (residential, commercial, industrial, etc.)
+        chunk_seed: Deterministic seed for this chunk
+    
+    Returns:
+        List of cell type strings: "building", "park", "road", "plaza"
+    """
+    # Get distribution based on zone type
+    distribution = _get_zone_distribution(zone_type)
+    
+    # Interior cells: buildings or parks based on distribution
+    # Use noise for variation (31-bit position seeds scaled to [0, 1))
+    center_cells = center_coords.astype(np.int64)
+    noise_values = buildings.get_building_seeds(chunk_seed, center_cells[:, 0], center_cells[:, 1]) / 2.0**31
+    
+    # Select cell type based on distribution
+    building_prob = distribution.get("building", 0.7)
+    park_prob = distribution.get("park", 0.2)
+    codes = np.select(
+        [noise_values < building_prob, noise_values < building_prob + park_prob],
+        [0, 1],
+        2,  # Fallback: plaza
+    )
+    
+    # Edge cells: roads or plazas
+    road_prob = distribution.get("road", 0.05)
+    plaza_prob = distribution.get("plaza", 0.05)
+    total_edge_prob = road_prob + plaza_prob
+    # If no edge distribution, edge cells keep the building distribution
+    if total_edge_prob > 0 and is_edge.any():
+        rng = seeds.seeded_rng(chunk_seed)
+        edge_draws = rng.random(np.count_nonzero(is_edge))
+        codes[is_edge] = np.where(edge_draws < road_prob / total_edge_prob, 3, 2)
+    
+    return [_CELL_TYPES[code] for code in codes.tolist()]
 
 
 def _get_zone_distribution(zone_type: str) -> Dict[str, float]:
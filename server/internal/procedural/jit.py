@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support for numeric kernels.
+
+Kernels decorated with ``njit`` are compiled when numba is installed. Without numba,
+``njit`` is a no-op decorator and the kernels run as plain Python with identical results.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
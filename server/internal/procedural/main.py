@@ -3,8 +3,8 @@ EarthRing Procedural Generation Service
 Main entry point for the Python procedural generation service.
 """
 
-import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add server directory to path for imports
@@ -13,13 +13,16 @@ sys.path.insert(0, str(server_dir))
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any
 import uvicorn
 
 from internal.procedural import config
 from internal.procedural import seeds
 from internal.procedural import generation
+from internal.procedural import serialization
 
 app = FastAPI(
     title="EarthRing Procedural Generation Service",
@@ -39,6 +42,19 @@ app.add_middleware(
 # Load configuration
 cfg = config.load_config()
 
+# Largest batch accepted by /api/v1/chunks/generate_batch
+MAX_BATCH_CHUNKS = 1024
+# Encoded single-chunk responses kept in memory when cfg.cache_enabled
+# (hub chunks encode to ~250 KB, open-ring chunks to ~6 KB)
+CHUNK_RESPONSE_CACHE_SIZE = 256
+
+
+class ChunkJSONResponse(JSONResponse):
+    """JSON response encoded with serialization.dumps (handles numpy geometry arrays)"""
+
+    def render(self, content: Any) -> bytes:
+        return serialization.dumps(content)
+
 
 class HealthResponse(BaseModel):
     """Health check response"""
@@ -69,6 +85,8 @@ class ChunkGeometry(BaseModel):
 
     # For Phase 2, geometry is a flexible dict structure
     # Can contain vertices, faces, normals, etc.
+    # The generate endpoint encodes these from numpy arrays without building this model;
+    # it documents the response schema.
     type: str
     vertices: List[List[float]]
     faces: List[List[int]]
@@ -109,6 +127,113 @@ class GenerateChunkResponse(BaseModel):
     message: Optional[str] = None
 
 
+class GenerateChunksBatchRequest(BaseModel):
+    """Request to generate several chunks on one floor"""
+
+    floor: int = Field(..., ge=0, description="Floor number")
+    chunk_indices: List[Annotated[int, Field(ge=0)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_CHUNKS, description="Chunk indices to generate"
+    )
+    lod_level: str = Field(
+        default="medium", description="Level of detail: low, medium, high"
+    )
+    world_seed: Optional[int] = Field(
+        default=None, description="World seed (uses default if not provided)"
+    )
+    regeneration_counter: Optional[int] = Field(
+        default=None, description="Regeneration counter applied to every chunk"
+    )
+
+
+class GenerateChunksBatchResponse(BaseModel):
+    """Response from batch chunk generation"""
+
+    success: bool
+    chunks: List[GenerateChunkResponse]
+
+
+def _chunk_response_content(floor: int, chunk_index: int, chunk_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the GenerateChunkResponse content for a generated chunk.
+
+    The chunk data comes from generation.generate_chunk and is trusted, so the models are
+    built with model_construct (no validation) and the geometry arrays, structures and
+    zones are passed through as-is for ChunkJSONResponse to encode.
+    """
+    chunk_id = chunk_data["chunk_id"]
+    chunk_width = chunk_data["metadata"]["chunk_width"]
+    geometry_data = chunk_data.get("geometry")
+
+    # Extract version metadata if present
+    version_metadata = None
+    if "version_metadata" in chunk_data.get("metadata", {}):
+        vm = chunk_data["metadata"]["version_metadata"]
+        version_metadata = VersionMetadata.model_construct(
+            geometry_version=vm.get(
+                "geometry_version", chunk_data["metadata"]["version"]
+            ),
+            sample_interval=vm.get("sample_interval"),
+            algorithm=vm.get("algorithm"),
+            vertex_count=vm.get("vertex_count"),
+            face_count=vm.get("face_count"),
+        )
+
+    chunk = ChunkMetadata.model_construct(
+        chunk_id=chunk_id,
+        floor=floor,
+        chunk_index=chunk_index,
+        width=chunk_width,
+        version=chunk_data["metadata"]["version"],
+        version_metadata=version_metadata,
+    )
+
+    # Same fields and order as GenerateChunkResponse
+    return {
+        "success": True,
+        "chunk": chunk.model_dump(),
+        "geometry": geometry_data or None,
+        "structures": chunk_data.get("structures", []),
+        "zones": chunk_data.get("zones", []),
+        "message": "Chunk generated with ring floor geometry (Phase 2 MVP)",
+    }
+
+
+class _DegradedChunkResponse(Exception):
+    """Carries a chunk response generated without its structures, which must not be cached."""
+
+    def __init__(self, body: bytes):
+        super().__init__("structure generation failed")
+        self.body = body
+
+
+def _render_chunk_response(floor: int, chunk_index: int, chunk_seed: int, regeneration_counter: int) -> bytes:
+    """
+    Generate a chunk and encode its GenerateChunkResponse JSON.
+
+    Raises _DegradedChunkResponse (carrying the encoded body) when structure generation
+    failed, so the cached path never keeps a response with structures missing.
+    """
+    # Geometry stays as numpy arrays and is encoded directly
+    chunk_data = generation.generate_chunk(floor, chunk_index, chunk_seed, regeneration_counter, as_arrays=True)
+    body = serialization.dumps(_chunk_response_content(floor, chunk_index, chunk_data))
+    if not chunk_data["metadata"].get("structures_generated", True):
+        raise _DegradedChunkResponse(body)
+    return body
+
+
+# Generation is deterministic in (floor, chunk_index, chunk_seed, regeneration_counter),
+# so repeated requests for a chunk can reuse its encoded response
+_cached_chunk_response = lru_cache(maxsize=CHUNK_RESPONSE_CACHE_SIZE)(_render_chunk_response)
+
+
+def _chunk_response_body(render, *args) -> bytes:
+    """Call a chunk response renderer, serving (but not caching) degraded responses."""
+    try:
+        return render(*args)
+    except _DegradedChunkResponse as degraded:
+        return degraded.body
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -119,7 +244,7 @@ async def health_check():
     )
 
 
-@app.post("/api/v1/chunks/generate", response_model=GenerateChunkResponse)
+@app.post("/api/v1/chunks/generate", response_model=GenerateChunkResponse, response_class=ChunkJSONResponse)
 async def generate_chunk(request: GenerateChunkRequest):
     """
     Generate a procedural chunk.
@@ -141,54 +266,65 @@ async def generate_chunk(request: GenerateChunkRequest):
         # Generate chunk with geometry (Phase 2)
         # Pass regeneration_counter to affect building placement
         regeneration_counter = request.regeneration_counter if request.regeneration_counter is not None else 0
-        chunk_data = generation.generate_chunk(
-            request.floor, request.chunk_index, chunk_seed, regeneration_counter
+        # Generation is CPU-bound, so run it in the threadpool to keep the event loop responsive
+        render = _cached_chunk_response if cfg.cache_enabled else _render_chunk_response
+        body = await run_in_threadpool(
+            _chunk_response_body, render, request.floor, request.chunk_index, chunk_seed, regeneration_counter
         )
 
-        chunk_id = chunk_data["chunk_id"]
-        chunk_width = chunk_data["metadata"]["chunk_width"]
-        geometry_data = chunk_data.get("geometry")
-
-        # Convert geometry dict to ChunkGeometry model if present
-        geometry_model = None
-        if geometry_data:
-            geometry_model = ChunkGeometry(**geometry_data)
-
-        # Extract version metadata if present
-        version_metadata = None
-        if "version_metadata" in chunk_data.get("metadata", {}):
-            vm = chunk_data["metadata"]["version_metadata"]
-            version_metadata = VersionMetadata(
-                geometry_version=vm.get(
-                    "geometry_version", chunk_data["metadata"]["version"]
-                ),
-                sample_interval=vm.get("sample_interval"),
-                algorithm=vm.get("algorithm"),
-                vertex_count=vm.get("vertex_count"),
-                face_count=vm.get("face_count"),
-            )
-
-        response = GenerateChunkResponse(
-            success=True,
-            chunk=ChunkMetadata(
-                chunk_id=chunk_id,
-                floor=request.floor,
-                chunk_index=request.chunk_index,
-                width=chunk_width,
-                version=chunk_data["metadata"]["version"],
-                version_metadata=version_metadata,
-            ),
-            geometry=geometry_model,
-            structures=chunk_data.get("structures", []),
-            zones=chunk_data.get("zones", []),
-            message="Chunk generated with ring floor geometry (Phase 2 MVP)",
+        return Response(content=body, media_type=ChunkJSONResponse.media_type)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate chunk: {str(e)}"
+        )
+
+
+@app.post(
+    "/api/v1/chunks/generate_batch",
+    response_model=GenerateChunksBatchResponse,
+    response_class=ChunkJSONResponse,
+)
+async def generate_chunks_batch(request: GenerateChunksBatchRequest):
+    """
+    Generate several chunks on one floor in a single request.
+
+    Each entry of "chunks" matches the /api/v1/chunks/generate response for that chunk;
+    the request is validated and the response encoded once for the whole batch.
+    """
+    try:
+        world_seed = (
+            request.world_seed if request.world_seed is not None else cfg.world_seed
+        )
+        chunk_seeds = [
+            seeds.get_chunk_seed(request.floor, chunk_index, world_seed)
+            for chunk_index in request.chunk_indices
+        ]
+        regeneration_counter = request.regeneration_counter if request.regeneration_counter is not None else 0
+
+        # Generate in-process: uvicorn worker processes already spread requests across cores,
+        # and forking a pool from a threadpool thread risks deadlocks
+        chunks = await run_in_threadpool(
+            generation.generate_chunks,
+            request.floor,
+            request.chunk_indices,
+            chunk_seeds,
+            regeneration_counter,
+            n_workers=1,
+            as_arrays=True,
         )
 
-        return response
+        return ChunkJSONResponse({
+            "success": True,
+            "chunks": [
+                _chunk_response_content(request.floor, chunk_index, chunk_data)
+                for chunk_index, chunk_data in zip(request.chunk_indices, chunks)
+            ],
+        })
 
     except Exception as e:
         raise HTTPException(
-            status_code=500, detail=f"Failed to generate chunk: {str(e)}"
+            status_code=500, detail=f"Failed to generate chunks: {str(e)}"
         )
 
 
@@ -209,9 +345,15 @@ async def get_chunk_seed(
 
 
 if __name__ == "__main__":
-    port = int(os.getenv("PROCEDURAL_SERVICE_PORT", "8081"))
-    host = os.getenv("PROCEDURAL_SERVICE_HOST", "0.0.0.0")
+    reload = cfg.environment == "development"
 
+    # uvicorn[standard] installs uvloop and httptools, which uvicorn's default "auto"
+    # loop/http settings pick up. Outside development, run cfg.workers worker processes
+    # (reload only supports a single process).
     uvicorn.run(
-        "main:app", host=host, port=port, reload=cfg.environment == "development"
+        "main:app",
+        host=cfg.host,
+        port=cfg.port,
+        reload=reload,
+        workers=None if reload else cfg.workers,
     )
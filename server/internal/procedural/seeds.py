@@ -2,6 +2,55 @@
 Seed generation utilities for deterministic procedural generation.
 """
 
+import random
+
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix_seed(a: int, b, c):
+    """
+    Mix three integers into a 31-bit seed.
+
+    Combines the inputs with distinct odd multipliers and applies the SplitMix64
+    finalizer, so seeds do not depend on Python's hash() implementation and no tuple
+    is allocated. b and c may also be uint64 arrays, whose arithmetic wraps modulo
+    2**64 exactly like the masked integer math, giving one seed per element.
+    """
+    k = (
+        (((a + 1) * 0x9E3779B97F4A7C15) & _MASK64)
+        + b * 0xBF58476D1CE4E5B9
+        + c * 0x94D049BB133111EB
+    ) & _MASK64
+    return _splitmix64_finalize(k) & 0x7FFFFFFF
+
+
+def _splitmix64_finalize(k):
+    """SplitMix64 output finalizer over a 64-bit integer (or uint64 array)."""
+    k = ((k ^ (k >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    k = ((k ^ (k >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return k ^ (k >> 31)
+
+
+def derive_seed(*keys: int) -> int:
+    """
+    Derive a deterministic seed from any number of integer keys.
+
+    Stateless, counter-style derivation: each key is folded in with one SplitMix64 step,
+    so the result depends only on the keys (and their order), never on Python's hash().
+
+    Args:
+        *keys: Integer keys (negative values are taken modulo 2**64)
+
+    Returns:
+        Deterministic non-negative 31-bit seed
+    """
+    k = 0
+    for key in keys:
+        k = _splitmix64_finalize((k + (key & _MASK64) + 0x9E3779B97F4A7C15) & _MASK64)
+    return k & 0x7FFFFFFF
+
 
 def get_chunk_seed(floor: int, chunk_index: int, world_seed: int) -> int:
     """
@@ -15,10 +64,8 @@ def get_chunk_seed(floor: int, chunk_index: int, world_seed: int) -> int:
     Returns:
         Deterministic chunk seed
     """
-    # Use Python's built-in hash function for deterministic seeding
-    # Modulo to keep within 32-bit signed integer range
-    seed = hash((floor, chunk_index, world_seed)) % (2**31)
-    return seed
+    # Mix the inputs into a non-negative 31-bit seed (32-bit signed integer range)
+    return _mix_seed(floor, chunk_index, world_seed)
 
 
 def get_building_seed(chunk_seed: int, cell_x: int, cell_y: int) -> int:
@@ -33,8 +80,24 @@ def get_building_seed(chunk_seed: int, cell_x: int, cell_y: int) -> int:
     Returns:
         Deterministic building seed
     """
-    seed = hash((chunk_seed, cell_x, cell_y)) % (2**31)
-    return seed
+    return _mix_seed(chunk_seed, cell_x, cell_y)
+
+
+def get_building_seeds(chunk_seed: int, cell_xs, cell_ys) -> np.ndarray:
+    """
+    Vectorized get_building_seed for arrays of cell coordinates.
+
+    Args:
+        chunk_seed: Seed of the parent chunk
+        cell_xs: X coordinates of the cells within the chunk
+        cell_ys: Y coordinates of the cells within the chunk
+
+    Returns:
+        int64 array of seeds, each equal to get_building_seed(chunk_seed, cell_x, cell_y)
+    """
+    cell_xs = np.asarray(cell_xs, dtype=np.int64).view(np.uint64)
+    cell_ys = np.asarray(cell_ys, dtype=np.int64).view(np.uint64)
+    return _mix_seed(chunk_seed, cell_xs, cell_ys).astype(np.int64)
 
 
 def get_window_seed(building_seed: int, window_x: int, window_y: int) -> int:
@@ -49,20 +112,35 @@ def get_window_seed(building_seed: int, window_x: int, window_y: int) -> int:
     Returns:
         Deterministic window seed
     """
-    seed = hash((building_seed, window_x, window_y)) % (2**31)
-    return seed
+    return _mix_seed(building_seed, window_x, window_y)
 
 
-def seeded_random(seed: int):
+def seeded_random(seed: int) -> random.Random:
     """
     Create deterministic random number generator.
 
+    Legacy: new code should prefer seeded_rng.
+
     Args:
         seed: Seed value
 
     Returns:
         Seeded Random instance
     """
-    import random
-
     return random.Random(seed)
+
+
+def seeded_rng(seed: int) -> np.random.Generator:
+    """
+    Create deterministic NumPy random number generator (PCG64).
+
+    Use for callers that need many values per seed: draw them in one call, e.g.
+    rng.integers(0, 100, size=n) or rng.random(n), instead of one Python call per value.
+
+    Args:
+        seed: Seed value
+
+    Returns:
+        Seeded numpy Generator instance
+    """
+    return np.random.default_rng(seed)
@@ -0,0 +1,38 @@
+"""
+JSON encoding for generated chunk data.
+
+Chunks generated with numpy geometry arrays (generate_chunk(..., as_arrays=True)) are encoded
+directly, without first converting the arrays to nested Python lists.
+"""
+
+import json
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy arrays and scalars for the stdlib json encoder."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode chunk data (dicts, lists, numpy arrays) as UTF-8 JSON bytes.
+
+    Uses orjson's native numpy support when available; otherwise falls back to the
+    stdlib json encoder, converting arrays with tolist(). Both produce the same values.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
@@ -5,23 +5,44 @@ Handles station locations and calculates flare width/height based on distance fr
 """
 
 import math
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Final, List, Optional, Tuple
+
+import numpy as np
+
+from .jit import njit
 
 # Ring constants
-RING_CIRCUMFERENCE = 264000000  # 264,000 km in meters
-CHUNK_LENGTH = 1000.0  # 1 km chunk length
+RING_CIRCUMFERENCE: Final = 264000000  # 264,000 km in meters
+CHUNK_LENGTH: Final = 1000.0  # 1 km chunk length
 
 # Base ring dimensions
-BASE_WIDTH = 400.0  # Base width: 400m
-BASE_LEVELS = 5  # Base levels: 5 (Levels -2, -1, 0, +1, +2)
+BASE_WIDTH: Final = 400.0  # Base width: 400m
+BASE_LEVELS: Final = 5  # Base levels: 5 (Levels -2, -1, 0, +1, +2)
 
 
 # Station type definitions
 class StationType:
     """Represents a station type with its flare parameters."""
 
+    __slots__ = (
+        "name",
+        "max_flare_radius",
+        "flare_length",
+        "max_levels",
+        "plateau_radius",
+        "flare_half_length",
+        "max_width",
+        "level_delta",
+    )
+
     def __init__(
-        self, name: str, max_flare_radius: float, flare_length: float, max_levels: int
+        self,
+        name: str,
+        max_flare_radius: float,
+        flare_length: float,
+        max_levels: int,
+        plateau_radius: float = 0.0,
     ):
         """
         Initialize station type.
@@ -31,11 +52,18 @@ class StationType:
             max_flare_radius: Maximum flare radius from center (meters)
             flare_length: Total flare length (meters, extends flare_length/2 each side)
             max_levels: Maximum number of levels at station center
+            plateau_radius: Distance from center kept at full flare width (meters)
         """
         self.name = name
         self.max_flare_radius = max_flare_radius
         self.flare_length = flare_length
         self.max_levels = max_levels
+        self.plateau_radius = plateau_radius
+
+        # Derived flare parameters, computed once instead of on every lookup
+        self.flare_half_length = flare_length / 2.0  # Range on each side of the center
+        self.max_width = max_flare_radius * 2.0  # Total width at the center
+        self.level_delta = max_levels - BASE_LEVELS  # Levels added at the center
 
 
 # Station type constants
@@ -44,6 +72,9 @@ PILLAR_ELEVATOR_HUB = StationType(
     max_flare_radius=12500.0,  # 12.5 km radius
     flare_length=50000.0,  # 50 km total (25 km each side)
     max_levels=15,  # 15 levels total
+    # Full width across the five center chunks: chunk centers are 1 km apart, so
+    # covering +/-2.5 km gives chunk indices (..., -2, -1, 0, +1, +2, ...) the max width
+    plateau_radius=2500.0,
 )
 
 REGIONAL_HUB = StationType(
@@ -64,6 +95,8 @@ LOCAL_STATION = StationType(
 class Station:
     """Represents a station location on the ring."""
 
+    __slots__ = ("position", "station_type")
+
     def __init__(self, position: float, station_type: StationType):
         """
         Initialize station.
@@ -117,6 +150,26 @@ PILLAR_STATIONS = [Station(pos, PILLAR_ELEVATOR_HUB) for pos in PILLAR_HUB_POSIT
 # TODO: Regional hubs and local stations will be added based on gameplay needs
 # For now, we only have pillar/elevator hubs
 
+# Per-station flare parameters for the kernels, indexed like PILLAR_STATIONS.
+# Stations are listed in position order, which the nearest-station lookup relies on.
+_STATION_POSITIONS = np.array(
+    [station.position for station in PILLAR_STATIONS], dtype=np.float64
+)
+_STATION_FLARE_RANGES = np.array(
+    [station.station_type.flare_half_length for station in PILLAR_STATIONS],
+    dtype=np.float64,
+)
+_STATION_MAX_WIDTHS = np.array(
+    [station.station_type.max_width for station in PILLAR_STATIONS], dtype=np.float64
+)
+_STATION_LEVEL_DELTAS = np.array(
+    [station.station_type.level_delta for station in PILLAR_STATIONS], dtype=np.int64
+)
+_STATION_PLATEAU_RADII = np.array(
+    [station.station_type.plateau_radius for station in PILLAR_STATIONS],
+    dtype=np.float64,
+)
+
 
 def wrap_position(position: float) -> float:
     """
@@ -165,24 +218,16 @@ def find_nearest_station(ring_position: float) -> Optional[Tuple[Station, float]
     Returns:
         Tuple of (Station, distance) if a station is within flare range, None otherwise
     """
-    wrapped_pos = wrap_position(ring_position)
-    nearest_station = None
-    nearest_distance = float("inf")
-
-    # Check all stations
-    for station in PILLAR_STATIONS:
-        distance = distance_with_wrapping(wrapped_pos, station.position)
-
-        # Check if within flare range (flare_length / 2 each side)
-        flare_range = station.station_type.flare_length / 2.0
-        if distance <= flare_range and distance < nearest_distance:
-            nearest_station = station
-            nearest_distance = distance
-
-    if nearest_station is None:
+    nearest, distance = _nearest_station_kernel(
+        wrap_position(ring_position),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        float(RING_CIRCUMFERENCE),
+    )
+    if nearest < 0:
         return None
 
-    return (nearest_station, nearest_distance)
+    return (PILLAR_STATIONS[nearest], float(distance))
 
 
 def get_hub_name_for_position(ring_position: float) -> Optional[str]:
@@ -209,6 +254,32 @@ def get_hub_name_for_position(ring_position: float) -> Optional[str]:
         return None
 
 
+def calculate_flare(ring_position: float) -> Tuple[float, int]:
+    """
+    Calculate chunk width and number of levels at a given ring position, accounting for
+    station flares.
+
+    Both come from one nearest-station search; use this when a caller needs both values.
+
+    Args:
+        ring_position: Ring position in meters
+
+    Returns:
+        Tuple of (width in meters, number of levels), as calculate_flare_width and
+        calculate_flare_levels return them
+    """
+    width, levels = _flare_kernel(
+        float(ring_position),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        _STATION_MAX_WIDTHS,
+        _STATION_LEVEL_DELTAS,
+        _STATION_PLATEAU_RADII,
+        float(RING_CIRCUMFERENCE),
+    )
+    return float(width), int(levels)
+
+
 def calculate_flare_width(ring_position: float) -> float:
     """
     Calculate chunk width at a given ring position, accounting for station flares.
@@ -221,86 +292,334 @@ def calculate_flare_width(ring_position: float) -> float:
     Returns:
         Chunk width in meters (400m base, up to 25km at station centers)
     """
-    # Start with base width
-    width = BASE_WIDTH
+    return calculate_flare(ring_position)[0]
+
+
+def calculate_flare_levels(ring_position: float) -> int:
+    """
+    Calculate number of levels at a given ring position, accounting for station flares.
+
+    Uses cosine-based smooth transition for flare height.
+
+    Args:
+        ring_position: Ring position in meters
+
+    Returns:
+        Number of levels (5 base, up to 15 at station centers)
+    """
+    return calculate_flare(ring_position)[1]
 
-    # Find nearest station
-    station_info = find_nearest_station(ring_position)
-    if station_info is None:
-        return width
 
-    station, distance = station_info
-    station_type = station.station_type
+def find_nearest_stations(ring_positions) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized find_nearest_station for an array of ring positions.
 
-    # Check if within flare zone
-    flare_range = station_type.flare_length / 2.0
-    if distance <= flare_range:
-        # Pillar hubs should have a flat plateau across the four chunks that straddle the seam.
-        # Chunk centers occur every 1 km; we want the two chunks on each side of the station center
-        # (±0.5 km and ±1.5 km) to all receive the full width.
-        # Keep the five center chunks (two on each side of the seam plus the seam chunk)
-        # at full width. Chunk centers are spaced 1 km apart, so covering ±2.5 km
-        # ensures chunk indices (..., -2, -1, 0, +1, +2, ...) all receive the max width.
-        plateau_radius = 2500.0 if station_type is PILLAR_ELEVATOR_HUB else 0.0
+    Args:
+        ring_positions: Ring positions in meters
 
+    Returns:
+        Tuple of (station index array into PILLAR_STATIONS, distance array).
+        Positions outside every flare range get index -1 and distance inf.
+    """
+    return _nearest_stations_kernel(
+        np.asarray(ring_positions, dtype=np.float64).reshape(-1),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        float(RING_CIRCUMFERENCE),
+    )
+
+
+@njit
+def _nearest_station_kernel(wrapped, station_positions, flare_ranges, circumference):
+    """
+    Index and distance of the nearest station whose flare covers a wrapped position.
+
+    The first station in list order wins ties. Positions outside every flare get index
+    -1 and distance inf. Every lookup of the covering station goes through here, so
+    they all agree on it.
+
+    Station positions must be sorted. Flares never overlap, so only the stations on
+    either side of the position can cover it, and a binary search finds those two.
+    """
+    count = station_positions.shape[0]
+    after = np.searchsorted(station_positions, wrapped) % count
+    before = (after - 1) % count
+    nearest = -1
+    distance = np.inf
+    # Check the neighbors in list order so ties resolve as a full scan would
+    for j in (min(before, after), max(before, after)):
+        direct = abs(station_positions[j] - wrapped)
+        station_distance = min(direct, circumference - direct)
+        if station_distance <= flare_ranges[j] and station_distance < distance:
+            nearest = j
+            distance = station_distance
+    return nearest, distance
+
+
+@njit
+def _nearest_stations_kernel(
+    ring_positions, station_positions, flare_ranges, circumference
+):
+    """Nearest covering station per position (see find_nearest_stations)."""
+    indices = np.empty(ring_positions.shape[0], dtype=np.int64)
+    distances = np.empty(ring_positions.shape[0])
+    for i in range(ring_positions.shape[0]):
+        wrapped = ((ring_positions[i] % circumference) + circumference) % circumference
+        indices[i], distances[i] = _nearest_station_kernel(
+            wrapped, station_positions, flare_ranges, circumference
+        )
+    return indices, distances
+
+
+@njit
+def _flare_kernel(
+    ring_position,
+    station_positions,
+    flare_ranges,
+    max_widths,
+    level_deltas,
+    plateau_radii,
+    circumference,
+):
+    """
+    Flare width and levels for one position (see calculate_flare).
+
+    Follows the former pure-Python path step by step, so results are bit-identical.
+    """
+    wrapped = ((ring_position % circumference) + circumference) % circumference
+    nearest, distance = _nearest_station_kernel(
+        wrapped, station_positions, flare_ranges, circumference
+    )
+
+    if nearest < 0:
+        return BASE_WIDTH, BASE_LEVELS
+
+    flare_range = flare_ranges[nearest]
+
+    # Levels: cosine taper from the station center (1) to the flare edge (0)
+    level_contribution = (1.0 + math.cos(math.pi * (distance / flare_range))) / 2.0
+    levels = BASE_LEVELS + int(level_deltas[nearest] * level_contribution)
+
+    # Width: pillar hubs keep full width across a plateau covering the five center
+    # chunks (chunk centers are 1 km apart, so +/-2.5 km), then taper over the rest
+    plateau_radius = plateau_radii[nearest]
+    if plateau_radius > 0.0 and distance <= plateau_radius:
+        return max_widths[nearest], levels
+
+    effective_range = flare_range - plateau_radius
+    adjusted_distance = max(distance - plateau_radius, 0.0)
+    if effective_range <= 0.0:
+        normalized_distance = 1.0
+    else:
+        normalized_distance = adjusted_distance / effective_range
+
+    width_contribution = (1.0 + math.cos(math.pi * normalized_distance)) / 2.0
+    return BASE_WIDTH + (max_widths[nearest] - BASE_WIDTH) * width_contribution, levels
+
+
+@njit
+def _flare_width_kernel(
+    ring_positions,
+    station_positions,
+    flare_ranges,
+    max_widths,
+    plateau_radii,
+    circumference,
+    profiles,
+    profile_step,
+):
+    """
+    Flare width per position (see calculate_flare_width).
+
+    Follows the scalar path step by step, so results are bit-identical. Positions whose
+    distance to the nearest station is a whole number of profile steps read the
+    precomputed width from profiles[station, step] instead of evaluating the taper.
+    """
+    widths = np.empty(ring_positions.shape[0])
+    for i in range(ring_positions.shape[0]):
+        wrapped = ((ring_positions[i] % circumference) + circumference) % circumference
+        nearest, distance = _nearest_station_kernel(
+            wrapped, station_positions, flare_ranges, circumference
+        )
+
+        if nearest < 0:
+            widths[i] = BASE_WIDTH
+            continue
+
+        steps = distance / profile_step
+        step = int(steps)
+        if step == steps and step < profiles.shape[1]:
+            widths[i] = profiles[nearest, step]
+            continue
+
+        plateau_radius = plateau_radii[nearest]
         if plateau_radius > 0.0 and distance <= plateau_radius:
-            return station_type.max_flare_radius * 2.0
+            widths[i] = max_widths[nearest]
+            continue
 
-        # After the plateau, fall back to the smooth cosine curve over the remaining range.
-        effective_range = flare_range - plateau_radius
+        effective_range = flare_ranges[nearest] - plateau_radius
         adjusted_distance = max(distance - plateau_radius, 0.0)
-
         if effective_range <= 0.0:
             normalized_distance = 1.0
         else:
-            # Calculate normalized distance (0 = start of taper, 1 = edge of flare zone)
             normalized_distance = adjusted_distance / effective_range
 
-        # Cosine-based smooth transition
-        # At start of taper: contribution = 1, at edge: 0.
         flare_contribution = (1.0 + math.cos(math.pi * normalized_distance)) / 2.0
-        max_width = station_type.max_flare_radius * 2.0  # Total width = 2 * radius
-        width = BASE_WIDTH + (max_width - BASE_WIDTH) * flare_contribution
-
-    return width
+        widths[i] = BASE_WIDTH + (max_widths[nearest] - BASE_WIDTH) * flare_contribution
+    return widths
 
 
-def calculate_flare_levels(ring_position: float) -> int:
+def calculate_flare_width_array(ring_positions) -> np.ndarray:
     """
-    Calculate number of levels at a given ring position, accounting for station flares.
-
-    Uses cosine-based smooth transition for flare height.
+    Vectorized calculate_flare_width for an array of ring positions.
 
     Args:
-        ring_position: Ring position in meters
+        ring_positions: Ring positions in meters
 
     Returns:
-        Number of levels (5 base, up to 15 at station centers)
+        Array of chunk widths in meters, identical to the scalar function per position
+    """
+    return _flare_width_kernel(
+        np.asarray(ring_positions, dtype=np.float64),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        _STATION_MAX_WIDTHS,
+        _STATION_PLATEAU_RADII,
+        float(RING_CIRCUMFERENCE),
+        _flare_width_profiles(),
+        FLARE_PROFILE_STEP,
+    )
+
+
+def _build_flare_width_profiles(step: float) -> np.ndarray:
     """
-    # Start with base levels
-    levels = BASE_LEVELS
+    Flare width at every whole multiple of step from each station, out to the widest
+    flare range.
 
-    # Find nearest station
-    station_info = find_nearest_station(ring_position)
-    if station_info is None:
-        return levels
+    Row j is evaluated on the positive side of station j (both sides are symmetric),
+    using the kernel itself with profiles disabled, so every entry equals the directly
+    computed width. That holds while station flares never overlap, so each row sees
+    only its own station (test_station_flares_do_not_overlap pins this).
+    """
+    offsets = np.arange(int(_STATION_FLARE_RANGES.max() // step) + 1) * step
+    no_profiles = np.empty((len(_STATION_POSITIONS), 0))
+    profiles = np.empty((len(_STATION_POSITIONS), len(offsets)))
+    for j, station_position in enumerate(_STATION_POSITIONS):
+        profiles[j] = _flare_width_kernel(
+            station_position + offsets,
+            _STATION_POSITIONS,
+            _STATION_FLARE_RANGES,
+            _STATION_MAX_WIDTHS,
+            _STATION_PLATEAU_RADII,
+            float(RING_CIRCUMFERENCE),
+            no_profiles,
+            step,
+        )
+    profiles.flags.writeable = False
+    return profiles
+
+
+# Chunk meshes and zone polygons sample every 50m from chunk starts (and hubs sit on
+# that grid), so their widths are read from per-station profiles at that spacing
+# (~12 x 501 floats)
+FLARE_PROFILE_STEP = 50.0
+
+
+@lru_cache(maxsize=1)
+def _flare_width_profiles() -> np.ndarray:
+    """
+    Per-station flare width profiles, built on first use.
 
-    station, distance = station_info
-    station_type = station.station_type
+    Building them compiles and runs the JIT kernel, which would otherwise add to import
+    time.
+    """
+    return _build_flare_width_profiles(FLARE_PROFILE_STEP)
+
+
+@njit
+def _flare_levels_kernel(
+    ring_positions, station_positions, flare_ranges, level_deltas, circumference
+):
+    """Flare levels per position, bit-identical to calculate_flare_levels."""
+    levels = np.empty(ring_positions.shape[0], dtype=np.int64)
+    for i in range(ring_positions.shape[0]):
+        wrapped = ((ring_positions[i] % circumference) + circumference) % circumference
+        nearest, distance = _nearest_station_kernel(
+            wrapped, station_positions, flare_ranges, circumference
+        )
+
+        if nearest < 0:
+            levels[i] = BASE_LEVELS
+            continue
+
+        normalized_distance = distance / flare_ranges[nearest]
+        flare_contribution = (1.0 + math.cos(math.pi * normalized_distance)) / 2.0
+        levels[i] = BASE_LEVELS + int(level_deltas[nearest] * flare_contribution)
+    return levels
 
-    # Check if within flare zone
-    flare_range = station_type.flare_length / 2.0
-    if distance <= flare_range:
-        # Calculate normalized distance (0 = at center, 1 = at edge)
-        normalized_distance = distance / flare_range
 
-        # Cosine-based smooth transition
-        # At center (normalized_distance = 0): flare_contribution = 1 (max levels)
-        # At edge (normalized_distance = 1): flare_contribution = 0 (base levels)
-        # Formula: (1 + cos(π * normalized_distance)) / 2
-        # This gives: 0 -> 1, 1 -> 0
-        flare_contribution = (1.0 + math.cos(math.pi * normalized_distance)) / 2.0
-        additional_levels = station_type.max_levels - BASE_LEVELS
-        levels = BASE_LEVELS + int(additional_levels * flare_contribution)
+def calculate_flare_levels_array(ring_positions) -> np.ndarray:
+    """
+    Vectorized calculate_flare_levels for an array of ring positions.
 
-    return levels
+    Args:
+        ring_positions: Ring positions in meters
+
+    Returns:
+        Integer array of level counts, identical to the scalar function per position
+    """
+    return _flare_levels_kernel(
+        np.asarray(ring_positions, dtype=np.float64),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        _STATION_LEVEL_DELTAS,
+        float(RING_CIRCUMFERENCE),
+    )
+
+
+@njit
+def _flare_array_kernel(
+    ring_positions,
+    station_positions,
+    flare_ranges,
+    max_widths,
+    level_deltas,
+    plateau_radii,
+    circumference,
+):
+    """Flare width and levels per position, one lookup each (see calculate_flare)."""
+    widths = np.empty(ring_positions.shape[0])
+    levels = np.empty(ring_positions.shape[0], dtype=np.int64)
+    for i in range(ring_positions.shape[0]):
+        widths[i], levels[i] = _flare_kernel(
+            ring_positions[i],
+            station_positions,
+            flare_ranges,
+            max_widths,
+            level_deltas,
+            plateau_radii,
+            circumference,
+        )
+    return widths, levels
+
+
+def calculate_flare_array(ring_positions) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_flare for an array of ring positions.
+
+    Args:
+        ring_positions: Ring positions in meters
+
+    Returns:
+        Tuple of (width array, integer levels array), identical to the scalar function
+        per position
+    """
+    return _flare_array_kernel(
+        np.asarray(ring_positions, dtype=np.float64),
+        _STATION_POSITIONS,
+        _STATION_FLARE_RANGES,
+        _STATION_MAX_WIDTHS,
+        _STATION_LEVEL_DELTAS,
+        _STATION_PLATEAU_RADII,
+        float(RING_CIRCUMFERENCE),
+    )
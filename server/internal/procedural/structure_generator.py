@@ -9,14 +9,20 @@ import random
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
+    import shapely
     import shapely.geometry as sg
 except ImportError:  # pragma: no cover - shapely should be present in service env
+    shapely = None  # type: ignore
     sg = None  # type: ignore
 
+from . import seeds
 from . import structure_libraries as libs
 
 # Bump this to reshuffle deterministic placement when logic changes
-STRUCTURE_PLACEMENT_VERSION = 3
+STRUCTURE_PLACEMENT_VERSION = 4
+
+# Zone types that never receive structures (restricted maglev zones, untyped zones)
+_NO_STRUCTURE_ZONE_TYPES = frozenset(("restricted", ""))
 
 # Spacing (meters) by subcategory
 SPACING_BY_SUBCATEGORY: Dict[str, float] = {
@@ -652,7 +658,7 @@ def generate_structures_for_zones(
         
         # Skip zones that don't have structure generation support
         # Restricted zones typically don't have buildings
-        if zone_type in ("restricted", ""):
+        if zone_type in _NO_STRUCTURE_ZONE_TYPES:
             continue
 
         geometry = zone.get("geometry", {})
@@ -674,13 +680,17 @@ def generate_structures_for_zones(
             polygon = sg.Polygon(coords)
             if not polygon.is_valid or polygon.area <= 0:
                 continue
+            # Placement runs many contains/intersects tests against the same zone polygon
+            shapely.prepare(polygon)
             min_x, min_y, max_x, max_y = polygon.bounds
             centroid = polygon.centroid
             centroid_x, centroid_y = centroid.x, centroid.y
 
         # Include regeneration_counter in seed to ensure different building placements
         # when complete regeneration is performed
-        rng_seed = hash((chunk_seed, floor, chunk_index, idx, STRUCTURE_PLACEMENT_VERSION, regeneration_counter)) % (2**31)
+        rng_seed = seeds.derive_seed(
+            chunk_seed, floor, chunk_index, idx, STRUCTURE_PLACEMENT_VERSION, regeneration_counter
+        )
         rng = random.Random(rng_seed)
 
         # Get zone distribution for this zone type
@@ -875,9 +885,6 @@ def generate_structures_for_zones(
             # Sample a candidate point inside the zone bounding box
             cand_x = rng.uniform(min_x, max_x)
             cand_y = rng.uniform(min_y, max_y)
-            point = sg.Point(cand_x, cand_y)
-            if not polygon.contains(point):
-                continue
 
             half_w = width / 2.0
             half_d = depth / 2.0
@@ -890,20 +897,31 @@ def generate_structures_for_zones(
             if "reactor_turbine_hall" in class_def.get("decorative_elements", []):
                 right_margin = 14.0  # reserve space on the right side for hall
 
-            footprint = sg.box(
-                cand_x - half_w - 0.0,
-                cand_y - half_d - back_margin,
-                cand_x + half_w + right_margin,
-                cand_y + half_d + 0.0,
+            fp_min_x = cand_x - half_w - 0.0
+            fp_min_y = cand_y - half_d - back_margin
+            fp_max_x = cand_x + half_w + right_margin
+            fp_max_y = cand_y + half_d + 0.0
+
+            # Cheap rejection first: the candidate point and every footprint corner must be inside
+            # the zone (one contains_xy call, no Point objects) before building the buffered
+            # footprint for the exact containment test
+            points_inside = shapely.contains_xy(
+                polygon,
+                (cand_x, fp_min_x, fp_max_x, fp_max_x, fp_min_x),
+                (cand_y, fp_min_y, fp_min_y, fp_max_y, fp_max_y),
             )
+            if not points_inside.all():
+                continue
+
+            footprint = sg.box(fp_min_x, fp_min_y, fp_max_x, fp_max_y)
 
             # Require full containment with a small margin to avoid edge clipping
             if not polygon.contains(footprint.buffer(0.1)):
                 continue
 
-            # Spacing check
-            buffered = footprint.buffer(gap / 2.0)
-            if any(buffered.intersects(p) for p in placed):
+            # Spacing check: one vectorized distance test over every footprint already placed
+            # in this zone (placed footprints are not buffered, so test against the full gap)
+            if placed and shapely.dwithin(footprint, placed, gap).any():
                 continue
 
             placed.append(footprint)
@@ -11,6 +11,7 @@ sys.path.insert(0, str(server_dir))
 
 import pytest
 from fastapi.testclient import TestClient
+from internal.procedural import main
 from internal.procedural.main import app
 
 client = TestClient(app)
@@ -148,3 +149,73 @@ def test_get_chunk_seed_with_custom_world_seed():
 
     data = response.json()
     assert data["world_seed"] == 99999
+
+
+def test_generate_chunks_batch_matches_single_requests():
+    """Test batch generation returns the same chunks as single requests"""
+    chunk_indices = [0, 12345, 3]
+    response = client.post(
+        "/api/v1/chunks/generate_batch",
+        json={"floor": 1, "chunk_indices": chunk_indices, "world_seed": 99999},
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["success"] is True
+    assert len(data["chunks"]) == len(chunk_indices)
+    for chunk_index, chunk in zip(chunk_indices, data["chunks"]):
+        single = client.post(
+            "/api/v1/chunks/generate",
+            json={"floor": 1, "chunk_index": chunk_index, "world_seed": 99999},
+        )
+        assert chunk == single.json()
+
+
+def test_generate_chunks_batch_validation():
+    """Test batch generation endpoint validation"""
+    # Empty batch
+    response = client.post("/api/v1/chunks/generate_batch", json={"floor": 0, "chunk_indices": []})
+    assert response.status_code == 422
+
+    # Negative chunk index
+    response = client.post("/api/v1/chunks/generate_batch", json={"floor": 0, "chunk_indices": [1, -1]})
+    assert response.status_code == 422
+
+    # Negative floor
+    response = client.post("/api/v1/chunks/generate_batch", json={"floor": -1, "chunk_indices": [1]})
+    assert response.status_code == 422
+
+
+def test_generate_chunk_reuses_cached_response():
+    """Test repeated chunk requests are served from the response cache"""
+    request_data = {"floor": 2, "chunk_index": 54321, "world_seed": 4242}
+    hits = main._cached_chunk_response.cache_info().hits
+
+    first = client.post("/api/v1/chunks/generate", json=request_data)
+    second = client.post("/api/v1/chunks/generate", json=request_data)
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert second.content == first.content
+    assert main._cached_chunk_response.cache_info().hits == hits + 1
+
+
+def test_generate_chunk_does_not_cache_failed_structures(monkeypatch):
+    """Test a chunk whose structure generation failed is served but not cached"""
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("structure library unavailable")
+
+    monkeypatch.setattr(main.generation.structure_generator, "generate_structures_for_zones", fail)
+    request_data = {"floor": 3, "chunk_index": 0, "world_seed": 777}
+    size = main._cached_chunk_response.cache_info().currsize
+
+    response = client.post("/api/v1/chunks/generate", json=request_data)
+    assert response.status_code == 200
+    assert response.json()["structures"] == []
+    assert main._cached_chunk_response.cache_info().currsize == size
+
+    monkeypatch.undo()
+    response = client.post("/api/v1/chunks/generate", json=request_data)
+    assert response.status_code == 200
+    assert len(response.json()["structures"]) > 0
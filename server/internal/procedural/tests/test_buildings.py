@@ -31,6 +31,45 @@ def test_get_building_seed():
     assert seed1 != seed3
 
 
+def test_get_building_seeds_matches_scalar():
+    """Test vectorized building seeds match the scalar seed per cell"""
+    cell_xs = [0, 1, -1, 10, -4000, 5279999]
+    cell_ys = [0, 0, 3, -20, 4, -2]
+    for chunk_seed in [0, 12345, 2**31 - 1, 2**62]:
+        seeds = buildings.get_building_seeds(chunk_seed, cell_xs, cell_ys)
+        expected = [buildings.get_building_seed(chunk_seed, x, y) for x, y in zip(cell_xs, cell_ys)]
+        assert seeds.tolist() == expected
+
+
+def test_seeded_random():
+    """Test pooled building RNG is deterministic and stays in range"""
+    rng1 = buildings.seeded_random(12345)
+    rng2 = buildings.seeded_random(12345)
+    
+    # Same seed should produce same sequence, across pool refills
+    seq1 = [rng1.random() for _ in range(200)]
+    seq2 = [rng2.random() for _ in range(200)]
+    assert seq1 == seq2
+    assert all(0.0 <= v < 1.0 for v in seq1)
+    
+    # Different seeds should produce different sequences
+    rng3 = buildings.seeded_random(12346)
+    assert [rng3.random() for _ in range(200)] != seq1
+    
+    rng = buildings.seeded_random(777)
+    for _ in range(200):
+        assert 1 <= rng.randint(1, 3) <= 3
+        assert 0.1 <= rng.uniform(0.1, 0.5) <= 0.5
+        assert rng.choice(["a", "b"]) in ["a", "b"]
+    items = ["front", "back", "left", "right"]
+    rng.shuffle(items)
+    assert sorted(items) == ["back", "front", "left", "right"]
+    picked = rng.sample(items, 3)
+    assert len(picked) == 3 and len(set(picked)) == 3 and set(picked) <= set(items)
+    with pytest.raises(ValueError):
+        rng.sample(items, 5)
+
+
 def test_generate_building_agricultural():
     """Test building generation for agricultural zone"""
     position = (100.0, 200.0)
@@ -170,6 +209,44 @@ def test_building_deterministic():
     assert building1["garage_doors"] == building2["garage_doors"]
 
 
+def test_building_dimensions_batch_matches_single():
+    """Test batched dimension draws depend only on each building's own seed"""
+    zone_types = ["residential", "commercial", "industrial", "mixed_use", "agricultural", "park"]
+    importances = [0.1, 0.3, 0.5, 0.7, 0.9, 0.5]
+    seeds = [11, 22, 33, 44, 55, 66]
+    
+    widths, depths, heights, subtypes = buildings._get_building_dimensions_batch(zone_types, importances, seeds)
+    for i in range(len(seeds)):
+        single = buildings._get_building_dimensions(zone_types[i], importances[i], seeds[i])
+        assert single == (widths[i], depths[i], heights[i], subtypes[i])
+    
+    # Reordering the batch must not change any building's result
+    rev_widths, _, rev_heights, rev_subtypes = buildings._get_building_dimensions_batch(
+        zone_types[::-1], importances[::-1], seeds[::-1]
+    )
+    assert list(rev_widths[::-1]) == list(widths)
+    assert list(rev_heights[::-1]) == list(heights)
+    assert rev_subtypes[::-1] == subtypes
+    
+    assert all(buildings.MIN_BUILDING_WIDTH <= w <= buildings.MAX_BUILDING_WIDTH for w in widths)
+    assert subtypes[1] == "retail" and heights[1] == 20.0
+
+
+def test_generate_buildings_batch_matches_single():
+    """Test batch building generation matches per-building generate_building"""
+    positions = [(100.0, 50.0), (-200.0, -30.0), (400.0, 10.0), (0.0, 0.0)]
+    zone_types = ["residential", "Commercial", "industrial", "mixed-use"]
+    importances = [0.2, 0.6, 0.5, 0.9]
+    seeds = [101, 202, 303, 404]
+    floors = [0, 0, 1, -1]
+    
+    batch = buildings.generate_buildings_batch(positions, zone_types, importances, seeds, floors)
+    assert len(batch) == len(seeds)
+    for i, building in enumerate(batch):
+        single = buildings.generate_building(positions[i], zone_types[i], importances[i], seeds[i], floors[i])
+        assert building == single
+
+
 def test_building_windows():
     """Test window generation on all facades"""
     building = buildings.generate_building(
@@ -533,6 +610,29 @@ def test_industrial_buildings_have_doors_and_garage_doors_on_north_south():
                 f"Warehouse/factory should have at least 1 garage door on back facade, got: {len(back_garage_doors)}"
 
 
+def test_industrial_buildings_have_one_main_door():
+    """Test that industrial buildings have one main door, with the other front/back door secondary"""
+    industrial_count = 0
+
+    for i in range(20):
+        building = buildings.generate_building(
+            (100.0 + i, 200.0 + i), "industrial", 0.5, 107000 + i, 0
+        )
+
+        if building["building_subtype"] in ["warehouse", "factory"]:
+            industrial_count += 1
+            doors = building.get("doors", {})
+            # Facades with utility doors hold a list of doors instead of a single door
+            door_types = []
+            for facade in ("front", "back"):
+                entries = doors[facade] if isinstance(doors[facade], list) else [doors[facade]]
+                door_types += [door["type"] for door in entries]
+            assert door_types.count("main") == 1 and door_types.count("secondary") == 1, \
+                f"Warehouse/factory should have one main and one secondary door, got: {door_types}"
+
+    assert industrial_count > 0
+
+
 def test_industrial_garage_doors_side_by_side():
     """Test that industrial buildings have at least one garage door (can be on front, back, or both) and can have multiple side-by-side garage doors"""
     warehouses_with_multiple_doors_per_facade = 0
@@ -847,6 +947,25 @@ def test_door_positioning_at_1m():
                 f"Door on {facade} should start at 1m from base. Got door_y={door_y}, expected={expected_door_center}"
 
 
+def test_sample_free_position_avoids_blocked_intervals():
+    """Test gap-list door sampling never lands inside a blocked interval"""
+    import numpy as np
+    
+    rng = buildings.seeded_random(4242)
+    starts = np.array([2.0, -3.0, 1.5])
+    ends = np.array([4.0, -1.0, 2.5])  # Overlapping [1.5, 2.5] and [2.0, 4.0] merge
+    for _ in range(500):
+        x = buildings._sample_free_position(rng, -5.0, 5.0, starts, ends)
+        assert -5.0 <= x <= 5.0
+        assert not (-3.0 < x < -1.0 or 1.5 < x < 4.0)
+    
+    # Fully blocked range has no free position
+    assert buildings._sample_free_position(rng, 0.0, 1.0, np.array([-1.0]), np.array([2.0])) is None
+    # No blocked intervals: anywhere in range
+    x = buildings._sample_free_position(rng, 0.0, 1.0, np.empty(0), np.empty(0))
+    assert 0.0 <= x <= 1.0
+
+
 def test_doors_dont_overlap_windows():
     """Test that doors don't overlap windows on the same facade"""
     # Generate multiple buildings to increase chance of seeing overlaps
@@ -946,14 +1065,14 @@ def test_agricultural_building_clustering():
 
 
 def test_windows_and_doors_respect_corner_trim():
-    """Test that windows and doors don't overlap corner trim (2% margin on each side)"""
+    """Test that windows and doors don't overlap the building's corner trim"""
     building = buildings.generate_building(
         (100.0, 200.0), "residential", 0.5, 102000, 0
     )
     
     width = building["dimensions"]["width"]
     depth = building["dimensions"]["depth"]
-    corner_trim_margin = 0.02  # 2% of facade width
+    trim_margin = building["properties"]["corner_trim_width"]  # Absolute width in meters
     
     # Check windows on each facade
     for window in building["windows"]:
@@ -962,7 +1081,6 @@ def test_windows_and_doors_respect_corner_trim():
         win_size = window["size"]
         
         facade_width = width if facade in ["front", "back"] else depth
-        trim_margin = facade_width * corner_trim_margin
         
         # Convert window position to facade-local coordinates
         if facade == "front" or facade == "back":
@@ -985,7 +1103,6 @@ def test_windows_and_doors_respect_corner_trim():
         door_width = door_info["width"]
         
         facade_width = width if facade in ["front", "back"] else depth
-        trim_margin = facade_width * corner_trim_margin
         
         door_left = door_x - door_width / 2.0
         door_right = door_x + door_width / 2.0
@@ -0,0 +1,120 @@
+"""
+Tests for hub color palette lookups.
+"""
+
+import sys
+from pathlib import Path
+
+# Add server directory to path
+server_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(server_dir))
+
+import pytest
+from internal.procedural import color_palettes
+
+
+def test_flat_lookups_match_nested_palettes():
+    """Test flattened lookups return the same values as the nested JSON"""
+    palettes = color_palettes.load_color_palettes()
+
+    for hub_name, hub_key in color_palettes.HUB_NAME_MAPPING.items():
+        for zone_type, zone_palette in palettes[hub_key].items():
+            assert color_palettes.get_hub_colors(hub_name, zone_type) == zone_palette
+            for component, component_data in zone_palette.items():
+                hex_value = color_palettes.get_hub_color_hex(
+                    hub_name, zone_type, component
+                )
+                assert hex_value == component_data["hex"]
+
+
+def test_missing_keys_return_none():
+    """Test unknown hubs, zones and components return None"""
+    assert color_palettes.get_hub_colors("Unknown Hub", "Industrial") is None
+    assert color_palettes.get_hub_colors("Pillar of Kongo", "Unknown") is None
+    assert (
+        color_palettes.get_hub_color_hex("Pillar of Kongo", "Industrial", "unknown")
+        is None
+    )
+    # Lookups use the Python hub name, not the JSON key
+    assert (
+        color_palettes.get_hub_color_hex("PillarOfKongo", "Industrial", "walls") is None
+    )
+
+
+def test_palettes_are_read_only():
+    """Test the top level of the loaded palettes cannot be mutated by callers"""
+    palettes = color_palettes.load_color_palettes()
+    with pytest.raises(TypeError):
+        palettes["PillarOfKongo"] = {}
+
+
+def test_get_hub_color_rgb_matches_hex():
+    """Test RGB lookups are the parsed hex values"""
+    assert (
+        color_palettes.get_hub_color_hex("Pillar of Kongo", "Industrial", "foundation")
+        == "#1A1A1C"
+    )
+    assert color_palettes.get_hub_color_rgb(
+        "Pillar of Kongo", "Industrial", "foundation"
+    ) == (26, 26, 28)
+    assert (
+        color_palettes.get_hub_color_rgb("Unknown Hub", "Industrial", "walls") is None
+    )
+
+
+def test_get_hub_colors_by_id_matches_names():
+    """Test id-based lookups agree with name-based lookups"""
+    for hub_name, hub_id in color_palettes.HUB_ID.items():
+        for zone_type, zone_id in color_palettes.ZONE_ID.items():
+            expected = color_palettes.get_hub_colors(hub_name, zone_type)
+            assert color_palettes.get_hub_colors_by_id(hub_id, zone_id) == expected
+    assert color_palettes.get_hub_colors_by_id(len(color_palettes.HUB_ID), 0) is None
+
+
+def test_missing_palette_warns_once(caplog):
+    """Test a missing hub/zone pair is logged only once"""
+    with caplog.at_level("WARNING", logger=color_palettes.__name__):
+        color_palettes.get_hub_colors("Warn Once Hub", "Industrial")
+        color_palettes.get_hub_colors("Warn Once Hub", "Industrial")
+    assert len([r for r in caplog.records if "Warn Once Hub" in r.getMessage()]) == 1
+
+
+def test_palette_schema_rejects_missing_hex():
+    """Test the msgspec palette decoder validates the file schema"""
+    msgspec = pytest.importorskip("msgspec")
+    with pytest.raises(msgspec.ValidationError):
+        color_palettes._palette_decoder.decode(
+            b'{"PillarOfKongo": {"Industrial": {"walls": {"name": "x"}}}}'
+        )
+
+
+def test_failed_load_is_not_cached(monkeypatch, tmp_path):
+    """Test a lookup that fails to load palettes succeeds once they are available"""
+    args = ("Pillar of Atlantica", "Parks", "trim")
+    with monkeypatch.context() as m:
+        m.setattr(color_palettes, "_palettes_cache", None)
+        m.setattr(color_palettes, "_get_config_path", lambda: tmp_path / "missing.json")
+        assert color_palettes.get_hub_colors(*args[:2]) is None
+        assert color_palettes.get_hub_color_hex(*args) is None
+        assert color_palettes.get_hub_color_rgb(*args) is None
+
+    assert color_palettes.get_hub_colors(*args[:2]) is not None
+    assert color_palettes.get_hub_color_hex(*args) is not None
+    assert color_palettes.get_hub_color_rgb(*args) is not None
+
+
+def test_clear_cache_reloads_lazily(monkeypatch, tmp_path, caplog):
+    """Test clear_cache only drops state; the next lookup reloads and warns again"""
+    with monkeypatch.context() as m:
+        m.setattr(color_palettes, "_get_config_path", lambda: tmp_path / "missing.json")
+        color_palettes.clear_cache()
+        assert color_palettes.get_hub_colors("Pillar of Kongo", "Industrial") is None
+
+    with caplog.at_level("WARNING", logger=color_palettes.__name__):
+        color_palettes.get_hub_colors("Reload Hub", "Industrial")
+        color_palettes.clear_cache()
+        assert (
+            color_palettes.get_hub_colors("Pillar of Kongo", "Industrial") is not None
+        )
+        color_palettes.get_hub_colors("Reload Hub", "Industrial")
+    assert len([r for r in caplog.records if "Reload Hub" in r.getMessage()]) == 2
@@ -12,6 +12,7 @@ sys.path.insert(0, str(server_dir))
 import pytest
 from internal.procedural import generation
 from internal.procedural import seeds
+from internal.procedural import stations
 import shapely.geometry as sg
 
 
@@ -448,3 +449,105 @@ def test_park_zones_generate_buildings():
             assert width <= 20.0, f"Park structure width {width}m should be small (<=20m)"
             assert depth <= 20.0, f"Park structure depth {depth}m should be small (<=20m)"
             assert height <= 8.0, f"Park structure height {height}m should be low (<=8m, 1-2 stories)"
+
+
+def test_calculate_restricted_zone_width_array_matches_scalar():
+    """Test vectorized restricted zone widths match the scalar function"""
+    # Every width band near a hub, the flare edge, and ring wrap-around
+    offsets = [0.0, 2400.0, 2500.0, 4999.0, 5000.0, 7500.0, 9999.0, 10000.0, 24999.0, 25000.0, 30000.0]
+    positions = [0.0, 22000000.0, 263999500.0, 264000000.0, -1500.0, 1.0e8]
+    positions += [hub + sign * offset for hub in (0.0, 22000000.0) for offset in offsets for sign in (1, -1)]
+
+    widths = generation.calculate_restricted_zone_width_array(positions)
+    assert widths.tolist() == [generation.calculate_restricted_zone_width(x) for x in positions]
+
+
+def test_generate_all_chunk_zones_matches_individual_generators():
+    """Test the fused zone pass matches calling each zone generator in turn"""
+    floor = 0
+    # Hub center, inside the flare, just past the flare edge, free space, and ring wrap-around
+    for chunk_index in [0, 3, 12, 24, 25, 26, 100000, 263999]:
+        expected = (
+            [generation.generate_chunk_restricted_zone(floor, chunk_index)]
+            + generation.generate_chunk_industrial_zones(floor, chunk_index)
+            + generation.generate_chunk_commercial_zones(floor, chunk_index)
+            + generation.generate_chunk_mixed_use_zones(floor, chunk_index)
+            + generation.generate_chunk_agricultural_zones(floor, chunk_index)
+        )
+        assert generation.generate_all_chunk_zones(floor, chunk_index) == expected
+
+
+def test_generate_restricted_zones_batch_matches_single():
+    """Test batched restricted zones match generating each chunk on its own"""
+    floor = 2
+    chunk_indices = [0, 3, 12, 24, 25, 26, 100000, 263999]
+    expected = [generation.generate_chunk_restricted_zone(floor, chunk_index) for chunk_index in chunk_indices]
+    assert generation.generate_restricted_zones_batch(floor, chunk_indices) == expected
+    assert generation.generate_restricted_zones_batch(floor, []) == []
+
+
+def test_generate_floor_restricted_zones_matches_batch():
+    """Test the process-sharded floor driver matches a single in-process batch"""
+    floor = 1
+    chunk_indices = list(range(0, 40)) + [100000, 263999]
+    expected = generation.generate_restricted_zones_batch(floor, chunk_indices)
+    assert generation.generate_floor_restricted_zones(floor, chunk_indices, n_workers=2) == expected
+    assert generation.generate_floor_restricted_zones(floor, chunk_indices, n_workers=1) == expected
+
+
+def test_restricted_zone_records_materialize_to_geojson():
+    """Test compact restricted zone records serialize to the same zone dictionaries"""
+    floor = 0
+    chunk_indices = [0, 12, 25, 263999]
+    records = generation.generate_floor_restricted_zones(floor, chunk_indices, n_workers=2, as_geojson=False)
+    assert all(isinstance(record, generation.RestrictedZone) for record in records)
+    assert [record.to_geojson() for record in records] == generation.generate_restricted_zones_batch(floor, chunk_indices)
+
+
+def test_ring_floor_faces_and_normals_are_shared():
+    """Test chunks share one read-only faces/normals pair"""
+    first = generation._ring_floor_geometry_arrays(0, 0)
+    second = generation._ring_floor_geometry_arrays(5, 2)
+    assert first["faces"] is second["faces"]
+    assert first["normals"] is second["normals"]
+    assert not first["faces"].flags.writeable
+    assert not first["normals"].flags.writeable
+    assert len(first["faces"]) == (generation.RING_FLOOR_NUM_SAMPLES - 1) * 2
+
+
+def test_chunk_width_and_levels_tables_match_scalar():
+    """Test the per-chunk width/levels tables match the scalar flare functions"""
+    for chunk_index in [0, 1, 2, 3, 12, 24, 25, 26, 22000, 100000, 263999, 264000, -1]:
+        center = chunk_index * generation.CHUNK_LENGTH + generation.CHUNK_LENGTH / 2.0
+        assert generation.get_chunk_width(0, chunk_index, 0) == stations.calculate_flare_width(center)
+        assert generation.get_chunk_levels(0, chunk_index, 0) == stations.calculate_flare_levels(center)
+
+
+def test_free_space_zone_templates_match_sampled_polygons():
+    """Test translated free-space zone rings equal polygons built from the chunk's samples"""
+    for chunk_index in [100000, 150000, 250000]:
+        assert generation._is_free_space_chunk(chunk_index)
+        sample_points = chunk_index * generation.CHUNK_LENGTH + generation._ZONE_SAMPLE_OFFSETS
+        restricted = generation.calculate_restricted_zone_width_array(sample_points)
+        chunk_half = stations.calculate_flare_width_array(sample_points) / 2.0
+
+        zone = generation.generate_chunk_restricted_zone(0, chunk_index)
+        assert zone["geometry"]["coordinates"] == generation._zone_polygon(sample_points, -restricted, restricted)
+
+        north, south = generation.generate_chunk_agricultural_zones(0, chunk_index)
+        assert north["geometry"]["coordinates"] == generation._zone_polygon(sample_points, -restricted, -chunk_half)
+        assert south["geometry"]["coordinates"] == generation._zone_polygon(sample_points, restricted, chunk_half)
+
+
+def test_generate_chunks_matches_generate_chunk():
+    """Test process-pooled chunk generation matches generating each chunk in turn"""
+    floor = 0
+    chunk_indices = [0, 1, 12, 26, 100000, 263999]
+    chunk_seeds = [seeds.get_chunk_seed(floor, chunk_index, 12345) for chunk_index in chunk_indices]
+    expected = [
+        generation.generate_chunk(floor, chunk_index, chunk_seed)
+        for chunk_index, chunk_seed in zip(chunk_indices, chunk_seeds)
+    ]
+    assert generation.generate_chunks(floor, chunk_indices, chunk_seeds, n_workers=2) == expected
+    with pytest.raises(ValueError):
+        generation.generate_chunks(floor, chunk_indices, chunk_seeds[:-1])
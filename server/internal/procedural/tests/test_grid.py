@@ -10,7 +10,7 @@ server_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(server_dir))
 
 import pytest
-from internal.procedural import grid
+from internal.procedural import buildings, grid
 
 
 def test_generate_city_grid_basic():
@@ -95,7 +95,8 @@ def test_grid_zone_type_distribution():
     # With edge detection at 75m, a 500x500 zone still has many edge cells
     # The actual ratio depends on the specific seed and randomness
     # For deterministic testing, we just verify buildings are being generated
-    assert building_ratio > 0.5  # At least half should be buildings (accounts for edge cells)
+    # (with per-cell type noise the ratio averages ~0.55 over seeds and stays above 0.42)
+    assert building_ratio > 0.4  # Most cells should be buildings (accounts for edge cells)
     
     # Commercial zones should also have high building density
     commercial_cells = grid.generate_city_grid(
@@ -105,7 +106,42 @@ def test_grid_zone_type_distribution():
     commercial_ratio = len(commercial_buildings) / len(commercial_cells) if commercial_cells else 0
     
     # Commercial zones should have ~80% buildings, but edge cells reduce this significantly
-    assert commercial_ratio > 0.5  # At least half should be buildings (accounts for edge cells)
+    assert commercial_ratio > 0.4  # Most cells should be buildings (accounts for edge cells)
+
+
+def test_grid_interior_zone_type_distribution():
+    """Test interior cells (away from edge roads and plazas) are mostly buildings"""
+    zone_polygon = [[[0.0, 0.0], [500.0, 0.0], [500.0, 500.0], [0.0, 500.0], [0.0, 0.0]]]
+    
+    for zone_type, chunk_seed in (("industrial", 12345), ("commercial", 67890)):
+        cells = grid.generate_city_grid(zone_polygon, zone_type, 0.5, chunk_seed)
+        interior = _interior_cells(cells, 500.0)
+        buildings_count = len([c for c in interior if c["type"] == "building"])
+        assert buildings_count / len(interior) > 0.5
+
+
+def _interior_cells(cells, zone_size):
+    """Cells whose centers are at least 1.5 cells from the edges of a square zone at the origin"""
+    margin = grid.GRID_CELL_SIZE * 1.5
+    return [
+        c for c in cells
+        if margin <= c["position"][0] <= zone_size - margin and margin <= c["position"][1] <= zone_size - margin
+    ]
+
+
+def test_interior_cell_types_depend_on_position():
+    """Test an interior cell gets the same type regardless of the zone extent"""
+    small_zone = [[[0.0, 0.0], [500.0, 0.0], [500.0, 500.0], [0.0, 500.0], [0.0, 0.0]]]
+    large_zone = [[[0.0, 0.0], [1000.0, 0.0], [1000.0, 1000.0], [0.0, 1000.0], [0.0, 0.0]]]
+    
+    small_cells = _interior_cells(grid.generate_city_grid(small_zone, "residential", 0.5, 4242), 500.0)
+    large_types = {
+        tuple(c["position"]): c["type"] for c in grid.generate_city_grid(large_zone, "residential", 0.5, 4242)
+    }
+    
+    assert small_cells
+    for cell in small_cells:
+        assert large_types[tuple(cell["position"])] == cell["type"]
 
 
 def test_grid_narrow_zone():
@@ -137,3 +173,31 @@ def test_grid_empty_zone():
     cells = grid.generate_city_grid(zone_polygon, "industrial", 0.5, 12345)
     assert cells == []
 
+
+def test_rectangle_fast_path_matches_polygon_path(monkeypatch):
+    """Test axis-aligned rectangles produce the same cells as the Shapely polygon path"""
+    zones = [
+        [[[0.0, 0.0], [500.0, 0.0], [500.0, 500.0], [0.0, 500.0], [0.0, 0.0]]],
+        [[[12.5, -80.0], [1012.5, -80.0], [1012.5, 80.0], [12.5, 80.0], [12.5, -80.0]]],
+        # Restricted-zone style ring with extra vertices along its sides
+        [[[x, -10.0] for x in range(0, 1050, 50)] + [[x, 10.0] for x in range(1000, -50, -50)] + [[0.0, -10.0]]],
+    ]
+    assert all(grid._axis_aligned_rectangle_bounds(zone[0]) is not None for zone in zones)
+    
+    fast_cells = [grid.generate_city_grid(zone, "residential", 0.5, 2024) for zone in zones]
+    monkeypatch.setattr(grid, "_axis_aligned_rectangle_bounds", lambda outer_ring: None)
+    polygon_cells = [grid.generate_city_grid(zone, "residential", 0.5, 2024) for zone in zones]
+    
+    assert fast_cells == polygon_cells
+
+
+def test_cell_seeds_match_building_seed():
+    """Test cell seeds are the building seeds of the cell's grid indices"""
+    zone_polygon = [[[-130.0, -90.0], [400.0, -90.0], [400.0, 300.0], [-130.0, 300.0], [-130.0, -90.0]]]
+    cells = grid.generate_city_grid(zone_polygon, "residential", 0.5, 77)
+    
+    assert cells
+    for cell in cells:
+        cell_x = int(cell["bounds"]["min_x"] / grid.GRID_CELL_SIZE)
+        cell_y = int(cell["bounds"]["min_y"] / grid.GRID_CELL_SIZE)
+        assert cell["seed"] == buildings.get_building_seed(77, cell_x, cell_y)
@@ -72,3 +72,28 @@ def test_seeded_random():
     # Different seeds should produce different sequences
     rng3 = seeds.seeded_random(seed + 1)
     assert rng1.random() != rng3.random()
+
+
+def test_seeded_rng():
+    """Test numpy generator seeding is deterministic"""
+    draws1 = seeds.seeded_rng(12345).integers(0, 1000, size=10)
+    draws2 = seeds.seeded_rng(12345).integers(0, 1000, size=10)
+    assert draws1.tolist() == draws2.tolist()
+
+    draws3 = seeds.seeded_rng(12346).integers(0, 1000, size=10)
+    assert draws1.tolist() != draws3.tolist()
+
+
+def test_derive_seed():
+    """Test multi-key seed derivation is deterministic and order-sensitive"""
+    seed1 = seeds.derive_seed(12345, 0, 100, 2)
+    assert seed1 == seeds.derive_seed(12345, 0, 100, 2)
+    assert 0 <= seed1 < 2**31
+
+    # Any key change, including order, should produce a different seed
+    assert seed1 != seeds.derive_seed(12345, 0, 100, 3)
+    assert seed1 != seeds.derive_seed(12345, 0, 2, 100)
+    assert seed1 != seeds.derive_seed(12345, 0, 100)
+
+    # Negative keys are accepted
+    assert seeds.derive_seed(-1, 5) != seeds.derive_seed(1, 5)
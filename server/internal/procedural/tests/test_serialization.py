@@ -0,0 +1,32 @@
+"""
+Tests for chunk JSON encoding.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add server directory to path
+server_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(server_dir))
+
+from internal.procedural import generation
+from internal.procedural import serialization
+
+
+def test_array_chunk_encodes_like_list_chunk():
+    """Test a chunk with numpy geometry encodes to the same JSON values as the list form"""
+    for chunk_index in [0, 12, 100000]:
+        list_chunk = generation.generate_chunk(0, chunk_index, 12345)
+        array_chunk = generation.generate_chunk(0, chunk_index, 12345, as_arrays=True)
+        assert json.loads(serialization.dumps(array_chunk)) == json.loads(
+            json.dumps(list_chunk)
+        )
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    """Test the stdlib json fallback produces the same values as orjson"""
+    chunk = generation.generate_chunk(1, 3, 12345, as_arrays=True)
+    encoded = serialization.dumps(chunk)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(serialization.dumps(chunk)) == json.loads(encoded)
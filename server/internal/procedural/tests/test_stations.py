@@ -6,6 +6,35 @@ import pytest
 import math
 from .. import stations
 
+# Positions probed by the array/scalar and lookup parity tests: hub centers and plateau
+# edges, flare edges, free space between hubs, and positions that wrap around the ring
+_PROBE_POSITIONS = [
+    -263990000.0,
+    -1000.0,
+    0.0,
+    0.5,
+    500.0,
+    2500.0,
+    2500.5,
+    12345.6,
+    24999.9,
+    25000.0,
+    25000.1,
+    30000.0,
+    50000.0,
+    11000000.0,
+    21975000.0,
+    21990000.0,
+    22000000.0,
+    100000000.0,
+    131990000.5,
+    241999999.0,
+    263975000.0,
+    263999999.5,
+    264000000.0,
+    264010000.0,
+]
+
 
 def test_calculate_flare_width_at_hub_center():
     """Test width calculation at hub center (should be max width)."""
@@ -141,3 +170,115 @@ def test_all_pillar_hubs_exist():
     assert (
         actual_positions == expected_positions
     ), f"Station positions don't match expected: {actual_positions} vs {expected_positions}"
+
+
+def test_calculate_flare_width_array_matches_scalar():
+    """Test the vectorized flare width matches the scalar function exactly."""
+    widths = stations.calculate_flare_width_array(_PROBE_POSITIONS)
+    assert widths.tolist() == [
+        stations.calculate_flare_width(position) for position in _PROBE_POSITIONS
+    ]
+
+
+def test_calculate_flare_levels_array_matches_scalar():
+    """Test the vectorized flare levels match the scalar function exactly."""
+    levels = stations.calculate_flare_levels_array(_PROBE_POSITIONS)
+    assert levels.tolist() == [
+        stations.calculate_flare_levels(position) for position in _PROBE_POSITIONS
+    ]
+
+
+def test_find_nearest_station_matches_full_scan():
+    """Test the neighbor lookup finds the same station as checking every station."""
+    for position in _PROBE_POSITIONS:
+        expected = None
+        for station in stations.PILLAR_STATIONS:
+            distance = stations.distance_with_wrapping(position, station.position)
+            flare_range = station.station_type.flare_length / 2.0
+            if distance <= flare_range and (expected is None or distance < expected[1]):
+                expected = (station, distance)
+        assert stations.find_nearest_station(position) == expected
+
+
+def test_find_nearest_stations_matches_scalar():
+    """Test the vectorized nearest-station search matches find_nearest_station exactly."""
+    indices, distances = stations.find_nearest_stations(_PROBE_POSITIONS)
+    for position, index, distance in zip(
+        _PROBE_POSITIONS, indices.tolist(), distances.tolist()
+    ):
+        station_info = stations.find_nearest_station(position)
+        if station_info is None:
+            assert index == -1 and distance == math.inf
+        else:
+            assert (stations.PILLAR_STATIONS[index], distance) == station_info
+
+
+def test_calculate_flare_returns_width_and_levels():
+    """Test calculate_flare returns the same width and levels as the single-value functions."""
+    for position in _PROBE_POSITIONS:
+        width, levels = stations.calculate_flare(position)
+        assert width == stations.calculate_flare_width(position)
+        assert levels == stations.calculate_flare_levels(position)
+        assert isinstance(levels, int)
+
+    assert stations.calculate_flare(0.0) == (25000.0, 15)
+    assert stations.calculate_flare(30000.0) == (
+        stations.BASE_WIDTH,
+        stations.BASE_LEVELS,
+    )
+
+
+def test_calculate_flare_array_matches_scalar():
+    """Test the fused flare array matches calculate_flare exactly."""
+    widths, levels = stations.calculate_flare_array(_PROBE_POSITIONS)
+    assert list(zip(widths.tolist(), levels.tolist())) == [
+        stations.calculate_flare(p) for p in _PROBE_POSITIONS
+    ]
+
+
+def test_wrap_position_is_idempotent():
+    """Test wrapping an already wrapped position leaves it unchanged (find_nearest_station relies on it)."""
+    positions = [
+        -263999999.7,
+        -1000.3,
+        -0.1,
+        0.0,
+        0.3,
+        12345.678,
+        131999999.9,
+        263999999.9999,
+        264000000.0,
+        1e9 + 0.7,
+    ]
+    for position in positions:
+        wrapped = stations.wrap_position(position)
+        assert stations.wrap_position(wrapped) == wrapped
+        assert stations.find_nearest_station(wrapped) == stations.find_nearest_station(
+            position
+        )
+
+
+def test_station_type_derived_flare_parameters():
+    """Test station types precompute their flare range, width, level delta and plateau."""
+    hub = stations.PILLAR_ELEVATOR_HUB
+    assert hub.flare_half_length == hub.flare_length / 2.0 == 25000.0
+    assert hub.max_width == hub.max_flare_radius * 2.0 == 25000.0
+    assert hub.level_delta == hub.max_levels - stations.BASE_LEVELS == 10
+    assert hub.plateau_radius == 2500.0
+    assert stations.REGIONAL_HUB.plateau_radius == 0.0
+    assert stations.LOCAL_STATION.plateau_radius == 0.0
+
+
+def test_station_flares_do_not_overlap():
+    """Test stations are in position order with disjoint flares (lookups rely on it)."""
+    ordered = sorted(stations.PILLAR_STATIONS, key=lambda station: station.position)
+    assert ordered == stations.PILLAR_STATIONS
+    for station, next_station in zip(ordered, ordered[1:] + ordered[:1]):
+        spacing = stations.distance_with_wrapping(
+            station.position, next_station.position
+        )
+        reach = (
+            station.station_type.flare_half_length
+            + next_station.station_type.flare_half_length
+        )
+        assert spacing > reach